@@ -0,0 +1,86 @@
+"""
+Benchmark of the UPSequentialSimulator modes on the PDDL domains bundled with the tests.
+
+For every domain, all the actions are grounded before starting the clock, then a
+breadth-first exploration of the state space is timed for every simulator mode.
+The explored successors are compared to make sure that all the modes have the same
+semantic.
+
+Usage: python3 scripts/benchmark_sequential_simulator.py [--expansions N] [domain ...]
+"""
+
+import argparse
+import os
+import sys
+import pathlib
+import time
+from collections import deque
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.resolve()))
+
+import unified_planning.test.pddl
+from unified_planning.io import PDDLReader
+from unified_planning.engines import UPSequentialSimulator
+
+PDDL_DIR = os.path.dirname(unified_planning.test.pddl.__file__)
+DEFAULT_DOMAINS = ["counters", "miconic", "safe_road", "sailing"]
+MODES = {
+    "default": {},
+    "compact_states": {"compact_states": True},
+    "compiled": {"compiled": True},
+}
+
+
+def explore(simulator, expansions):
+    trace = []
+    frontier = deque([simulator.get_initial_state()])
+    expanded = 0
+    while frontier and expanded < expansions:
+        state = frontier.popleft()
+        expanded += 1
+        for action, params in simulator.get_applicable_actions(state):
+            frontier.append(simulator.apply(state, action, params))
+            trace.append((action.name, params))
+    return trace
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--expansions", type=int, default=200)
+    parser.add_argument("domains", nargs="*", default=DEFAULT_DOMAINS)
+    args = parser.parse_args()
+    exit_code = 0
+    for domain in args.domains:
+        domain_file = os.path.join(PDDL_DIR, domain, "domain.pddl")
+        problem_files = sorted(
+            f
+            for f in os.listdir(os.path.join(PDDL_DIR, domain))
+            if f.endswith(".pddl") and f != "domain.pddl"
+        )
+        problem = PDDLReader().parse_problem(
+            domain_file, os.path.join(PDDL_DIR, domain, problem_files[0])
+        )
+        if not UPSequentialSimulator.supports(problem.kind):
+            print(f"{domain}: not supported by the UPSequentialSimulator")
+            continue
+        times, traces = {}, {}
+        for mode, params in MODES.items():
+            simulator = UPSequentialSimulator(problem, **params)
+            for _ in simulator._grounder.get_grounded_actions():
+                pass
+            start = time.perf_counter()
+            traces[mode] = explore(simulator, args.expansions)
+            times[mode] = time.perf_counter() - start
+        speedups = ", ".join(
+            f"{mode}: {t:.3f}s (x{times['default'] / t:.2f})"
+            for mode, t in times.items()
+        )
+        print(f"{domain} [{len(traces['default'])} successors] {speedups}")
+        if any(t != traces["default"] for t in traces.values()):
+            print(f"{domain}: the simulator modes explored different successors!")
+            exit_code = 1
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,11 @@ def create_up_parser() -> argparse.ArgumentParser:
     )
     oneshot_planning_parser.set_defaults(cmd="oneshot-planning")
 
+    batch_planning_parser = subparsers.add_parser(
+        "batch-planning",
+    )
+    batch_planning_parser.set_defaults(cmd="batch-planning")
+
     anytime_planning_parser = subparsers.add_parser(
         "anytime-planning",
         epilog=compilation_kind_explaination,
@@ -62,6 +67,9 @@ def create_up_parser() -> argparse.ArgumentParser:
     # --compilation-kinds
     # --optimality-guarantee
     # --anytime-guarantee
+    # --workers, -w
+    # --threads
+    # --plans-dir
     # --pddl-output
     # --anml-output
     # --kind
@@ -222,6 +230,68 @@ def create_up_parser() -> argparse.ArgumentParser:
         metavar="COMPILATION_KIND",
     )
 
+    batch_mutually_exclusive = batch_planning_parser.add_mutually_exclusive_group(
+        required=True
+    )
+    batch_mutually_exclusive.add_argument(
+        "--pddl",
+        type=str,
+        nargs="+",
+        help="The path of the pddl domain followed by the paths of the pddl problems",
+        dest="pddl",
+        metavar="PDDL_FILENAME",
+    )
+    batch_mutually_exclusive.add_argument(
+        "--anml",
+        type=str,
+        nargs="+",
+        help="The paths of the anml files, one for every problem",
+        dest="anml",
+        metavar="ANML_FILENAME",
+    )
+    batch_planning_parser.add_argument(
+        "--engine",
+        "-e",
+        type=str,
+        help="The name of the engine to use",
+        dest="engine_name",
+    )
+    batch_planning_parser.add_argument(
+        "--timeout",
+        type=float,
+        help="The timeout in seconds for the engine, for every problem",
+        dest="timeout",
+    )
+    batch_planning_parser.add_argument(
+        "--optimality-guarantee",
+        "-o",
+        type=str,
+        choices=[og.name.lower() for og in OptimalityGuarantee],
+        help="The required optimality guarantee",
+        dest="optimality_guarantee",
+    )
+    batch_planning_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="The maximum number of problems solved at the same time",
+        dest="max_workers",
+    )
+    batch_planning_parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="If set the workers are threads instead of processes",
+        dest="use_threads",
+        default=False,
+    )
+    batch_planning_parser.add_argument(
+        "--plans-dir",
+        type=str,
+        help="The directory where to write the plans found, named as the problem files",
+        dest="plans_dir",
+        metavar="PLANS_DIRECTORY",
+    )
+
     list_engines_parser.add_argument(
         "--operation-mode",
         type=str,
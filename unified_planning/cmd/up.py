@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 
 import argparse
-from typing import Optional, cast
+import os
+from typing import Dict, Optional, cast
 import unified_planning as up
 from unified_planning.cmd.arg_parser import create_up_parser
 from unified_planning.shortcuts import *
@@ -21,6 +22,8 @@ def main(args=None):
 
     if parsed_args.mode == "oneshot-planning":
         oneshot_planning(parser, parsed_args)
+    elif parsed_args.mode == "batch-planning":
+        batch_planning(parser, parsed_args)
     elif parsed_args.mode == "anytime-planning":
         anytime_planning(parser, parsed_args)
     elif parsed_args.mode == "plan-validation":
@@ -82,6 +85,60 @@ def oneshot_planning(
                 writer.write_plan(plan, plan_filename)
 
 
+def batch_planning(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+):
+    if args.pddl is not None:
+        if len(args.pddl) < 2:
+            parser.error(
+                "batch-planning mode requires the pddl domain and at least one pddl problem"
+            )
+        domain_filename, problem_filenames = args.pddl[0], args.pddl[1:]
+    else:
+        domain_filename, problem_filenames = None, args.anml
+
+    # the problems are parsed lazily, while the previous ones are being solved
+    parsed_problems: Dict[int, "up.model.AbstractProblem"] = {}
+
+    def problems():
+        for idx, problem_filename in enumerate(problem_filenames):
+            if domain_filename is not None:
+                problem = PDDLReader().parse_problem(domain_filename, problem_filename)
+            else:
+                problem = ANMLReader().parse_problem(problem_filename)
+            parsed_problems[idx] = problem
+            yield problem
+
+    if args.plans_dir is not None:
+        os.makedirs(args.plans_dir, exist_ok=True)
+    all_solved = True
+    for idx, plan_gen_res in solve_many(
+        problems(),
+        name=args.engine_name,
+        optimality_guarantee=args.optimality_guarantee,
+        timeout=args.timeout,
+        max_workers=args.max_workers,
+        use_threads=args.use_threads,
+    ):
+        problem_filename = problem_filenames[idx]
+        problem = parsed_problems.pop(idx)
+        print(
+            f"{problem_filename}: status returned by {plan_gen_res.engine_name}: {plan_gen_res.status.name}"
+        )
+        plan = plan_gen_res.plan
+        if plan is None:
+            all_solved = False
+        elif args.plans_dir is not None:
+            plan_filename = os.path.join(
+                args.plans_dir,
+                os.path.splitext(os.path.basename(problem_filename))[0] + ".plan",
+            )
+            PDDLWriter(problem).write_plan(plan, plan_filename)
+    if not all_solved:
+        exit(1)
+
+
 def anytime_planning(
     parser: argparse.ArgumentParser,
     args: argparse.Namespace,
@@ -0,0 +1,179 @@
+# Copyright 2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+This module defines the scheduling of many problems over a pool of workers,
+used by :func:`Factory.solve_many <unified_planning.engines.Factory.solve_many>`.
+
+Every worker (a process or a thread) keeps the planners it creates, so the
+engines are instantiated once per worker and not once per problem.
+Every problem is solved on a copy living in its own environment, also when the
+workers are threads, because the walkers of an environment can't be used by
+many threads at the same time.
+"""
+
+import os
+import pickle
+import threading
+import unified_planning as up
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    FIRST_COMPLETED,
+    wait,
+)
+from unified_planning.engines.engine import OperationMode
+from unified_planning.engines.mixins.oneshot_planner import (
+    OneshotPlannerMixin,
+    OptimalityGuarantee,
+)
+from unified_planning.engines.results import PlanGenerationResult
+from unified_planning.exceptions import UPUsageError
+from typing import Any, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+
+# The configuration of the planners of a batch:
+# (name, params, optimality_guarantee, timeout)
+_BatchConfig = Tuple[
+    Optional[str], Dict[str, Any], Optional[OptimalityGuarantee], Optional[float]
+]
+
+# The factory of the worker processes, set by _init_worker_process
+_worker_factory: Optional["up.engines.factory.Factory"] = None
+# The planners created by every worker, by engine class
+_worker_planners = threading.local()
+
+
+def _init_worker_process(factory: "up.engines.factory.Factory"):
+    global _worker_factory
+    _worker_factory = factory
+
+
+def _solve_problem(
+    factory: Optional["up.engines.factory.Factory"],
+    config: _BatchConfig,
+    index: int,
+    problem: "up.model.AbstractProblem",
+) -> Tuple[int, PlanGenerationResult]:
+    if factory is None:
+        factory = _worker_factory
+    assert factory is not None
+    name, params, optimality_guarantee, timeout = config
+    planners: Dict[type, "up.engines.engine.Engine"] = getattr(
+        _worker_planners, "planners", None
+    )
+    if planners is None:
+        planners = {}
+        _worker_planners.planners = planners
+    EngineClass = factory._get_engine_class(
+        OperationMode.ONESHOT_PLANNER,
+        name,
+        problem.kind,
+        optimality_guarantee,
+    )
+    planner = planners.get(EngineClass, None)
+    if planner is None:
+        planner = factory._get_engine(
+            OperationMode.ONESHOT_PLANNER,
+            name=name,
+            params=params,
+            problem_kind=problem.kind,
+            optimality_guarantee=optimality_guarantee,
+        )
+        planners[EngineClass] = planner
+    assert isinstance(planner, OneshotPlannerMixin)
+    return index, planner.solve(problem, timeout=timeout)
+
+
+def solve_many(
+    factory: "up.engines.factory.Factory",
+    problems: Iterable["up.model.AbstractProblem"],
+    name: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    optimality_guarantee: Optional[OptimalityGuarantee] = None,
+    timeout: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    use_threads: bool = False,
+) -> Iterator[Tuple[int, PlanGenerationResult]]:
+    """
+    Solves the given ``problems`` over a pool of workers, yielding the results
+    as soon as they are available; see
+    :func:`Factory.solve_many <unified_planning.engines.Factory.solve_many>`.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise UPUsageError("solve_many requires at least one worker.")
+    config: _BatchConfig = (name, params or {}, optimality_guarantee, timeout)
+    executor: Executor
+    if use_threads:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        task_factory: Optional["up.engines.factory.Factory"] = factory
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_process,
+            initargs=(factory,),
+        )
+        task_factory = None
+    # At most 2 problems per worker are submitted at the same time, so the
+    # problems are consumed lazily from the given iterable
+    max_pending = 2 * max_workers
+    pending: Set[Future] = set()
+    submitted: Dict[int, "up.model.AbstractProblem"] = {}
+    problems_iterator = enumerate(problems)
+    exhausted = False
+    with executor:
+        while not exhausted or pending:
+            while not exhausted and len(pending) < max_pending:
+                try:
+                    index, problem = next(problems_iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                submitted[index] = problem
+                if use_threads:
+                    # copied here, so the original environment is never
+                    # accessed by the worker threads
+                    problem = pickle.loads(pickle.dumps(problem))
+                pending.add(
+                    executor.submit(
+                        _solve_problem, task_factory, config, index, problem
+                    )
+                )
+            if not pending:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, result = future.result()
+                problem = submitted.pop(index)
+                if result.plan is not None:
+                    # the plan refers to the copy of the problem in the worker
+                    result = _normalize_result(problem, result)
+                yield index, result
+
+
+def _normalize_result(
+    problem: "up.model.AbstractProblem", result: PlanGenerationResult
+) -> PlanGenerationResult:
+    assert result.plan is not None
+    return PlanGenerationResult(
+        result.status,
+        problem.normalize_plan(result.plan),
+        result.engine_name,
+        result.metrics,
+        result.log_messages,
+    )
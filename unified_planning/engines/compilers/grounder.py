@@ -24,9 +24,16 @@ from unified_planning.model import (
     Problem,
     ProblemKind,
     Action,
+    InstantaneousAction,
+    DurativeAction,
+    Fluent,
     Type,
     Expression,
     FNode,
+    Effect,
+    EffectKind,
+    DurationInterval,
+    OperatorKind,
     MinimizeActionCosts,
 )
 from unified_planning.model.types import domain_size, domain_item
@@ -36,8 +43,9 @@ from unified_planning.engines.compilers.utils import (
     create_action_with_given_subs,
 )
 from unified_planning.exceptions import UPUsageError
-from typing import Dict, Iterable, List, Optional, Tuple, Iterator, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Iterator, cast
 from itertools import product
+from multiprocessing import Pool
 from functools import partial
 
 
@@ -58,6 +66,8 @@ class GrounderHelper:
         self,
         problem: Problem,
         grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None,
+        prune_actions: bool = True,
+        workers: int = 1,
     ):
         """
         Creates an instance of the GrounderHelper.
@@ -72,10 +82,21 @@ class GrounderHelper:
             * `b (o3)`
             * `b (o4)`
             If this map is `None`, the `unified_planning` grounding algorithm is applied.
+        :param prune_actions: When ``True`` (and the ``grounding_actions_map`` is ``None``), only the parameters
+            reachable from the initial state in the delete relaxation of the problem are used to ground the actions;
+            otherwise every parameters combination is grounded.
+        :param workers: The number of processes used by the :func:`get_grounded_actions` method; when greater
+            than ``1``, the parameters of every action are partitioned across a pool of processes that ground the
+            actions independently and send them back in a compact form.
         """
         assert isinstance(problem, Problem)
         self._problem = problem
         self._grounding_actions_map = grounding_actions_map
+        self._prune_actions = prune_actions
+        self._workers = workers
+        self._reachable_parameters: Optional[
+            Dict[Action, List[Tuple[FNode, ...]]]
+        ] = None
         # grounded_actions is a map from an Action of the original problem and it's parameters
         # to the grounded instance of the Action with the given parameters.
         # When the grounded instance of the Action is None, it means that the resulting grounding
@@ -118,7 +139,7 @@ class GrounderHelper:
         key = (action, tuple(parameters))
         value = self._grounded_actions.get(key, 0)
         if value != 0:  # The action is already created
-            assert isinstance(value, up.model.InstantaneousAction) or value is None
+            assert isinstance(value, Action) or value is None
             return value
         else:
             # if the action does not have parameters, it does not need to be grounded.
@@ -154,12 +175,73 @@ class GrounderHelper:
             creates an invalid or meaningless `Action` (invalid if it has conflicting `Effects`,
             meaningless if it has no `effects` or contradicting `conditions`).
         """
+        if self._workers > 1:
+            self._ground_in_parallel()
         for old_action in self._problem.actions:
             for grounded_params in self.get_possible_parameters(old_action):
                 assert isinstance(grounded_params, tuple)
                 new_action = self.ground_action(old_action, grounded_params)
                 yield (old_action, grounded_params, new_action)
 
+    def _ground_in_parallel(self):
+        """
+        Grounds all the actions not grounded yet with a pool of processes and stores
+        the results in the grounded actions cache.
+        """
+        tasks = []
+        for action_index, action in enumerate(self._problem.actions):
+            if len(action.parameters) == 0:
+                continue
+            parameters_list = [
+                p
+                for p in self.get_possible_parameters(action)
+                if (action, p) not in self._grounded_actions
+            ]
+            # every worker gets multiple chunks, to balance the load
+            chunk_size = max(
+                1, min(_MAX_CHUNK_SIZE, len(parameters_list) // (self._workers * 4))
+            )
+            for start in range(0, len(parameters_list), chunk_size):
+                tasks.append(
+                    (action, parameters_list[start : start + chunk_size], action_index)
+                )
+        if not tasks:
+            return
+        encoded_tasks = [
+            (
+                action_index,
+                [
+                    tuple(
+                        (
+                            p.node_type,
+                            p.object().name
+                            if p.is_object_exp()
+                            else p.constant_value(),
+                        )
+                        for p in params
+                    )
+                    for params in chunk
+                ],
+            )
+            for _, chunk, action_index in tasks
+        ]
+        codec = _GroundedActionsCodec(self._problem)
+        with Pool(
+            self._workers, initializer=_init_grounding_worker, initargs=(self._problem,)
+        ) as pool:
+            for (action, chunk, _), (table, encoded_actions) in zip(
+                tasks, pool.imap(_ground_parameters_chunk, encoded_tasks)
+            ):
+                expressions = codec.decode_table(table)
+                for params, encoded_action in zip(chunk, encoded_actions):
+                    if encoded_action is None:
+                        self._grounded_actions[(action, params)] = None
+                    elif encoded_action is not False:
+                        self._grounded_actions[(action, params)] = codec.decode_action(
+                            encoded_action, expressions
+                        )
+                    # the actions that can't be encoded are grounded by ground_action
+
     def get_possible_parameters(self, action: Action) -> Iterator[Tuple[FNode, ...]]:
         """
         Takes in input an `Action` and returns the iterator over all the possible parameters compatible with the given
@@ -181,7 +263,17 @@ class GrounderHelper:
         else:
             # contains the type of every parameter of the action
             type_list: List[Type] = [param.type for param in action.parameters]
-            if self._grounding_actions_map is None:
+            if self._grounding_actions_map is None and self._prune_actions:
+                if self._reachable_parameters is None:
+                    self._reachable_parameters = _RelaxedReachabilityAnalysis(
+                        self._problem
+                    ).get_reachable_parameters()
+                reachable_parameters = self._reachable_parameters.get(action, None)
+            else:
+                reachable_parameters = None
+            if reachable_parameters is not None:
+                res = iter(reachable_parameters)
+            elif self._grounding_actions_map is None:
                 # a list containing the list of object in the self._problem of the given type.
                 # So, if the self._problem has 2 Locations l1 and l2, and 2 Robots r1 and r2, and
                 # the action move_to takes as parameters a Robot and a Location,
@@ -208,6 +300,453 @@ class GrounderHelper:
         return res
 
 
+class _RelaxedReachabilityAnalysis:
+    """
+    This class computes, for every `Action` of a :class:`~unified_planning.model.Problem`, the
+    parameters tuples that are reachable from the initial state in the delete relaxation of the problem.
+
+    Only the boolean fluents are considered: a boolean fluent instance is reachable if it is
+    `True` in the initial state or if it is set by an effect of a reachable action instance;
+    an action instance is reachable if all the boolean fluent instances in the positive literals
+    of its conditions are reachable. Every other condition (negative literals, numeric
+    conditions, disjunctions, quantifiers...) is ignored, as well as the conditions of
+    the conditional effects, so the analysis over-approximates the reachable action instances.
+
+    The parameters of an action are bound incrementally, joining the literals of its conditions
+    with the reachable fluent instances; static fluents are never modified, so their literals
+    restrict the parameters to the instances that are `True` in the initial state.
+    """
+
+    def __init__(self, problem: Problem):
+        self._problem = problem
+        self._domains: Dict[Type, List[FNode]] = {}
+        # The fluents whose reachable instances can't be computed, because they are set by simulated
+        # effects or with arguments that are not parameters or constants; all their instances are
+        # considered reachable and their literals are ignored.
+        self._unconstrained_fluents: Set[Fluent] = set()
+        # Map from every action to the tuples (fluent, args) of the positive literals of its
+        # conditions and of the boolean fluents it might set to True.
+        self._literals: Dict[Action, List[Tuple[Fluent, Tuple[FNode, ...]]]] = {}
+        self._add_effects: Dict[Action, List[Tuple[Fluent, Tuple[FNode, ...]]]] = {}
+        for action in problem.actions:
+            if isinstance(action, InstantaneousAction):
+                conditions = action.preconditions
+                effects = action.effects
+                if action.simulated_effect is not None:
+                    self._unconstrained_fluents.update(
+                        f.fluent() for f in action.simulated_effect.fluents
+                    )
+            elif isinstance(action, DurativeAction):
+                # only the conditions that must hold when the action starts are used, the
+                # others might be supported by the effects of the action itself
+                conditions = [
+                    c
+                    for i, cl in action.conditions.items()
+                    if i.lower.is_from_start()
+                    and i.lower.delay == 0
+                    and not i.is_left_open()
+                    for c in cl
+                ]
+                effects = [e for el in action.effects.values() for e in el]
+                for se in action.simulated_effects.values():
+                    self._unconstrained_fluents.update(f.fluent() for f in se.fluents)
+            else:
+                # Unknown kind of action, it's not pruned
+                continue
+            self._literals[action] = self._get_literals(action, conditions)
+            self._add_effects[action] = self._get_add_effects(action, effects)
+        for el in problem.timed_effects.values():
+            for e in el:
+                self._unconstrained_fluents.add(e.fluent.fluent())
+
+    def _is_atom(self, action: Action, fluent_exp: FNode) -> bool:
+        """Returns `True` if all the arguments of the given fluent expression are parameters or constants."""
+        return all(
+            (a.is_parameter_exp() and a.parameter() in action.parameters)
+            or a.is_constant()
+            for a in fluent_exp.args
+        )
+
+    def _get_literals(
+        self, action: Action, conditions: List[FNode]
+    ) -> List[Tuple[Fluent, Tuple[FNode, ...]]]:
+        literals = []
+        stack = list(conditions)
+        while stack:
+            c = stack.pop()
+            if c.is_and():
+                stack.extend(c.args)
+            elif c.is_fluent_exp() and self._is_atom(action, c):
+                literals.append((c.fluent(), c.args))
+        return literals
+
+    def _get_add_effects(
+        self, action: Action, effects: List["up.model.Effect"]
+    ) -> List[Tuple[Fluent, Tuple[FNode, ...]]]:
+        add_effects = []
+        for e in effects:
+            fluent_exp = e.fluent
+            if not fluent_exp.type.is_bool_type() or e.value.is_false():
+                continue
+            if self._is_atom(action, fluent_exp):
+                add_effects.append((fluent_exp.fluent(), fluent_exp.args))
+            else:
+                self._unconstrained_fluents.add(fluent_exp.fluent())
+        return add_effects
+
+    def _get_domain(self, type: Type) -> List[FNode]:
+        domain = self._domains.get(type, None)
+        if domain is None:
+            size = domain_size(self._problem, type)
+            domain = [domain_item(self._problem, type, j) for j in range(size)]
+            self._domains[type] = domain
+        return domain
+
+    def _get_bindings(
+        self,
+        action: Action,
+        atoms: Dict[Fluent, Set[Tuple[FNode, ...]]],
+    ) -> Iterator[Tuple[FNode, ...]]:
+        """
+        Returns all the parameters tuples of the given action that satisfy the action's
+        literals with the given reachable fluent instances.
+        """
+        params = action.parameters
+        param_index = {p: i for i, p in enumerate(params)}
+        domains = [set(self._get_domain(p.type)) for p in params]
+        literals = [
+            l for l in self._literals[action] if l[0] not in self._unconstrained_fluents
+        ]
+        bound: Set[int] = set()
+        # every binding is a list containing the value of every parameter, None if unbound
+        bindings: List[List[Optional[FNode]]] = [[None] * len(params)]
+        while literals and bindings:
+            # the next literal joined is the one with the most arguments already bound
+            def bound_args(literal: Tuple[Fluent, Tuple[FNode, ...]]) -> int:
+                return sum(
+                    1
+                    for a in literal[1]
+                    if not a.is_parameter_exp() or param_index[a.parameter()] in bound
+                )
+
+            literal = max(literals, key=bound_args)
+            literals.remove(literal)
+            fluent, args = literal
+            bound_positions = [
+                i
+                for i, a in enumerate(args)
+                if not a.is_parameter_exp() or param_index[a.parameter()] in bound
+            ]
+            free_positions = [
+                (i, param_index[a.parameter()])
+                for i, a in enumerate(args)
+                if a.is_parameter_exp() and param_index[a.parameter()] not in bound
+            ]
+            # index the reachable instances of the fluent on the bound arguments
+            atoms_index: Dict[Tuple[FNode, ...], List[Tuple[FNode, ...]]] = {}
+            for atom in atoms.get(fluent, ()):
+                key = tuple(atom[i] for i in bound_positions)
+                atoms_index.setdefault(key, []).append(atom)
+            bound_params = [
+                param_index[args[i].parameter()] if args[i].is_parameter_exp() else None
+                for i in bound_positions
+            ]
+            new_bindings = []
+            for binding in bindings:
+                key = tuple(
+                    args[i] if p is None else binding[p]
+                    for i, p in zip(bound_positions, bound_params)
+                )
+                for atom in atoms_index.get(key, ()):
+                    new_binding = list(binding)
+                    for i, p in free_positions:
+                        value = atom[i]
+                        old_value = new_binding[p]
+                        if (old_value is None and value not in domains[p]) or (
+                            old_value is not None and old_value != value
+                        ):
+                            break
+                        new_binding[p] = value
+                    else:
+                        new_bindings.append(new_binding)
+            bindings = new_bindings
+            bound.update(p for _, p in free_positions)
+        # the parameters not bound by any literal can take every value of their domain
+        free_domains = [
+            self._get_domain(p.type) if i not in bound else [None]
+            for i, p in enumerate(params)
+        ]
+        for binding in bindings:
+            for values in product(*free_domains):
+                yield tuple(
+                    cast(FNode, b if v is None else v) for b, v in zip(binding, values)
+                )
+
+    def get_reachable_parameters(self) -> Dict[Action, List[Tuple[FNode, ...]]]:
+        """
+        Computes the reachable parameters of every action; the actions not in the
+        resulting map can't be analyzed and must be entirely grounded.
+
+        :return: The map from every action to the list of its reachable parameters tuples,
+            sorted in the same order of the cartesian product of the parameters domains.
+        """
+        atoms: Dict[Fluent, Set[Tuple[FNode, ...]]] = {}
+        for f_exp, v in self._problem.explicit_initial_values.items():
+            if v.is_true():
+                atoms.setdefault(f_exp.fluent(), set()).add(f_exp.args)
+        # the instances not explicitly set of the fluents with a default value
+        # different from False might be True in the initial state
+        for f, default in self._problem.fluents_defaults.items():
+            if f.type.is_bool_type() and not default.is_false():
+                self._unconstrained_fluents.add(f)
+        reachable: Dict[Action, Set[Tuple[FNode, ...]]] = {
+            a: set() for a in self._literals
+        }
+        # Number of reachable instances of every fluent when the action was last evaluated;
+        # the bindings of an action change only if the instances of its literals change.
+        last_evaluation: Dict[Action, Optional[List[int]]] = {
+            a: None for a in self._literals
+        }
+        changed = True
+        while changed:
+            changed = False
+            for action, literals in self._literals.items():
+                sizes = [len(atoms.get(f, ())) for f, _ in literals]
+                if sizes == last_evaluation[action]:
+                    continue
+                last_evaluation[action] = sizes
+                action_reachable = reachable[action]
+                params = action.parameters
+                for binding in self._get_bindings(action, atoms):
+                    if binding in action_reachable:
+                        continue
+                    action_reachable.add(binding)
+                    subs = dict(zip(params, binding))
+                    for fluent, args in self._add_effects[action]:
+                        atom = tuple(
+                            subs[a.parameter()] if a.is_parameter_exp() else a
+                            for a in args
+                        )
+                        fluent_atoms = atoms.setdefault(fluent, set())
+                        if atom not in fluent_atoms:
+                            fluent_atoms.add(atom)
+                            changed = True
+        res: Dict[Action, List[Tuple[FNode, ...]]] = {}
+        for action, action_reachable in reachable.items():
+            positions = [
+                {item: j for j, item in enumerate(self._get_domain(p.type))}
+                for p in action.parameters
+            ]
+            res[action] = sorted(
+                action_reachable,
+                key=lambda params: [pos[v] for pos, v in zip(positions, params)],
+            )
+        return res
+
+
+# Maximum number of parameters tuples sent to a parallel grounding worker in a single task
+_MAX_CHUNK_SIZE = 1000
+
+
+class _NotEncodableError(Exception):
+    """Raised when a grounded action can't be encoded by the `_GroundedActionsCodec`."""
+
+    pass
+
+
+class _GroundedActionsCodec:
+    """
+    This class converts the grounded actions of a :class:`~unified_planning.model.Problem` to and
+    from a compact, picklable form, used to send the grounded actions from the parallel grounding
+    workers to the main process.
+
+    The expressions of a batch of actions are stored in a single table, where every expression
+    is a tuple `(node_type, payload, args)`: the `args` are indexes of previous entries of the
+    table and the `payload` is a raw value or the name of a fluent or of an object, so the
+    decoded expressions are created directly in the `Environment` of the decoding problem.
+    Actions with simulated effects or expressions containing variables can't be encoded.
+    """
+
+    def __init__(self, problem: Problem):
+        self._em = problem.environment.expression_manager
+        self._environment = problem.environment
+        self._fluents = {f.name: f for f in problem.fluents}
+        self._objects = {o.name: o for o in problem.all_objects}
+        self._table: List[Tuple[OperatorKind, Any, Tuple[int, ...]]] = []
+        self._encoded: Dict[FNode, int] = {}
+
+    def encode_expression(self, expression: FNode) -> int:
+        """Adds the given expression to the table and returns its index."""
+        res = self._encoded.get(expression, None)
+        if res is not None:
+            return res
+        args = tuple(self.encode_expression(a) for a in expression.args)
+        payload: Any = None
+        if expression.is_fluent_exp():
+            payload = expression.fluent().name
+        elif expression.is_object_exp():
+            payload = expression.object().name
+        elif expression.is_constant():
+            payload = expression.constant_value()
+        elif expression.node_type in (
+            OperatorKind.PARAM_EXP,
+            OperatorKind.VARIABLE_EXP,
+            OperatorKind.EXISTS,
+            OperatorKind.FORALL,
+            OperatorKind.DOT,
+            OperatorKind.TIMING_EXP,
+        ):
+            raise _NotEncodableError
+        res = len(self._table)
+        self._table.append((expression.node_type, payload, args))
+        self._encoded[expression] = res
+        return res
+
+    def encode_action(self, action: Action) -> Tuple:
+        """Returns the encoded form of the given grounded action."""
+
+        def encode_effect(e: "up.model.Effect") -> Tuple[int, int, int, EffectKind]:
+            return (
+                self.encode_expression(e.fluent),
+                self.encode_expression(e.value),
+                self.encode_expression(e.condition),
+                e.kind,
+            )
+
+        if isinstance(action, InstantaneousAction):
+            if action.simulated_effect is not None:
+                raise _NotEncodableError
+            return (
+                action.name,
+                [self.encode_expression(c) for c in action.preconditions],
+                [encode_effect(e) for e in action.effects],
+            )
+        elif isinstance(action, DurativeAction):
+            if action.simulated_effects:
+                raise _NotEncodableError
+            duration = action.duration
+            return (
+                action.name,
+                [
+                    (i, [self.encode_expression(c) for c in cl])
+                    for i, cl in action.conditions.items()
+                ],
+                [
+                    (t, [encode_effect(e) for e in el])
+                    for t, el in action.effects.items()
+                ],
+                (
+                    self.encode_expression(duration.lower),
+                    self.encode_expression(duration.upper),
+                    duration.is_left_open(),
+                    duration.is_right_open(),
+                ),
+            )
+        raise _NotEncodableError
+
+    def pop_table(self) -> List[Tuple[OperatorKind, Any, Tuple[int, ...]]]:
+        """Returns the table of the encoded expressions and starts a new one."""
+        table = self._table
+        self._table = []
+        self._encoded = {}
+        return table
+
+    def decode_table(
+        self, table: List[Tuple[OperatorKind, Any, Tuple[int, ...]]]
+    ) -> List[FNode]:
+        """Returns the expressions stored in the given table."""
+        expressions: List[FNode] = []
+        for node_type, payload, args in table:
+            if node_type == OperatorKind.FLUENT_EXP:
+                payload = self._fluents[payload]
+            elif node_type == OperatorKind.OBJECT_EXP:
+                payload = self._objects[payload]
+            expressions.append(
+                self._em.create_node(
+                    node_type, tuple(expressions[a] for a in args), payload
+                )
+            )
+        return expressions
+
+    def decode_action(self, encoded_action: Tuple, expressions: List[FNode]) -> Action:
+        """Returns the grounded action encoded with the given expressions table."""
+
+        def decode_effect(
+            encoded_effect: Tuple[int, int, int, EffectKind]
+        ) -> "up.model.Effect":
+            fluent, value, condition, kind = encoded_effect
+            return Effect(
+                expressions[fluent], expressions[value], expressions[condition], kind
+            )
+
+        if len(encoded_action) == 3:
+            name, preconditions, effects = encoded_action
+            action = InstantaneousAction(name, _env=self._environment)
+            action._set_preconditions([expressions[c] for c in preconditions])
+            for e in effects:
+                action._add_effect_instance(decode_effect(e))
+            return action
+        name, conditions, timed_effects, duration = encoded_action
+        durative_action = DurativeAction(name, _env=self._environment)
+        lower, upper, is_left_open, is_right_open = duration
+        durative_action.set_duration_constraint(
+            DurationInterval(
+                expressions[lower], expressions[upper], is_left_open, is_right_open
+            )
+        )
+        for interval, cl in conditions:
+            durative_action._set_conditions(interval, [expressions[c] for c in cl])
+        for timing, el in timed_effects:
+            for e in el:
+                durative_action._add_effect_instance(timing, decode_effect(e))
+        return durative_action
+
+
+# The problem and the codec used by the parallel grounding worker processes
+_worker_data: Optional[Tuple[Problem, Simplifier, _GroundedActionsCodec]] = None
+
+
+def _init_grounding_worker(problem: Problem):
+    global _worker_data
+    _worker_data = (
+        problem,
+        Simplifier(problem.environment, problem),
+        _GroundedActionsCodec(problem),
+    )
+
+
+def _ground_parameters_chunk(
+    task: Tuple[int, List[Tuple[Tuple[OperatorKind, Any], ...]]]
+) -> Tuple[List[Tuple[OperatorKind, Any, Tuple[int, ...]]], List[Any]]:
+    """
+    Grounds an action of the worker's problem with a chunk of parameters.
+
+    :param task: The index of the action in the problem and the list of parameters, where every
+        parameter is given as a couple `(node_type, payload)`.
+    :return: The table of the expressions and, for every parameters tuple, the encoded grounded action;
+        `None` if the action grounds to an invalid action or `False` if it can't be encoded.
+    """
+    assert _worker_data is not None
+    problem, simplifier, codec = _worker_data
+    action_index, parameters_list = task
+    action = problem.actions[action_index]
+    results: List[Any] = []
+    for parameters in parameters_list:
+        expressions = codec.decode_table([(k, p, tuple()) for k, p in parameters])
+        subs: Dict[Expression, Expression] = dict(zip(action.parameters, expressions))
+        grounded_action = create_action_with_given_subs(
+            problem, action, simplifier, subs
+        )
+        if grounded_action is None:
+            results.append(None)
+            continue
+        try:
+            results.append(codec.encode_action(grounded_action))
+        except _NotEncodableError:
+            results.append(False)
+    return codec.pop_table(), results
+
+
 class Grounder(engines.engine.Engine, CompilerMixin):
     """
     Grounder class: the `Grounder` takes a :class:`~unified_planning.model.Problem` where the :class:`Actions <unified_planning.model.Action>`
@@ -222,16 +761,26 @@ class Grounder(engines.engine.Engine, CompilerMixin):
     the integration of external grounders inside the library. To see a practical example, checkout the :class:`~unified_planning.engines.compilers.TarskiGrounder` `_compile`
     implementation.
 
+    When the ``prune_actions`` flag is set (the default), only the action instances reachable from the initial
+    state in the delete relaxation of the `Problem` are grounded; the reachability analysis over-approximates the
+    reachable action instances, so no `Plan` of the original `Problem` is lost.
+
+    When ``workers`` is greater than ``1``, the actions are grounded in parallel by a pool of processes.
+
     This `Compiler` supports only the the `GROUNDING` :class:`~unified_planning.engines.CompilationKind`.
     """
 
     def __init__(
         self,
         grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None,
+        prune_actions: bool = True,
+        workers: int = 1,
     ):
         engines.engine.Engine.__init__(self)
         CompilerMixin.__init__(self, CompilationKind.GROUNDING)
         self._grounding_actions_map = grounding_actions_map
+        self._prune_actions = prune_actions
+        self._workers = workers
 
     @property
     def name(self):
@@ -320,7 +869,9 @@ class Grounder(engines.engine.Engine, CompilerMixin):
         assert isinstance(
             problem, Problem
         ), "The given problem is not a class supported by the Grounder"
-        grounder_helper = GrounderHelper(problem, self._grounding_actions_map)
+        grounder_helper = GrounderHelper(
+            problem, self._grounding_actions_map, self._prune_actions, self._workers
+        )
         trace_back_map: Dict[Action, Tuple[Action, List[FNode]]] = {}
 
         new_problem = problem.clone()
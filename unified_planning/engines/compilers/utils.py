@@ -159,7 +159,8 @@ def create_action_with_given_subs(
     c_subs = cast(Dict[Parameter, FNode], subs)
     if isinstance(old_action, InstantaneousAction):
         new_action = InstantaneousAction(
-            get_fresh_name(problem, old_action.name, naming_list)
+            get_fresh_name(problem, old_action.name, naming_list),
+            _env=problem.environment,
         )
         for p in old_action.preconditions:
             new_action.add_precondition(p.substitute(subs))
@@ -197,7 +198,8 @@ def create_action_with_given_subs(
         return new_action
     elif isinstance(old_action, DurativeAction):
         new_durative_action = DurativeAction(
-            get_fresh_name(problem, old_action.name, naming_list)
+            get_fresh_name(problem, old_action.name, naming_list),
+            _env=problem.environment,
         )
         old_duration = old_action.duration
         new_duration = DurationInterval(
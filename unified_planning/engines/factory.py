@@ -37,7 +37,20 @@ from unified_planning.engines.mixins.sequential_simulator import (
     SequentialSimulatorMixin,
 )
 from unified_planning.engines.engine import OperationMode
-from typing import IO, Any, Dict, Tuple, Optional, List, Union, Type, Sequence, cast
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    Optional,
+    List,
+    Union,
+    Type,
+    Sequence,
+    cast,
+)
 from pathlib import PurePath
 
 
@@ -742,6 +755,63 @@ class Factory:
             optimality_guarantee,
         )
 
+    def solve_many(
+        self,
+        problems: Iterable["up.model.AbstractProblem"],
+        *,
+        name: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        optimality_guarantee: Optional[Union["OptimalityGuarantee", str]] = None,
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        use_threads: bool = False,
+    ) -> Iterator[Tuple[int, "up.engines.results.PlanGenerationResult"]]:
+        """
+        Solves all the given ``problems`` with oneshot planners scheduled over a
+        pool of workers, yielding every result as soon as it is available.
+
+        The planner is the one called ``name`` or, if ``name`` is ``None``, the one
+        selected for every problem by its kind and the ``optimality_guarantee``, as
+        in :func:`OneshotPlanner <unified_planning.engines.Factory.OneshotPlanner>`.
+        Every worker instantiates the planners once and reuses them for all the
+        problems it solves. The problems are consumed lazily from the iterable.
+
+        Example: ``for i, res in factory.solve_many(problems, name="tamer", timeout=10)``
+
+        :param problems: The problems to solve.
+        :param name: The name of the planner to use.
+        :param params: The planner dependent options.
+        :param optimality_guarantee: The optimality guarantee required to the planner.
+        :param timeout: The timeout given to the planner for every problem.
+        :param max_workers: The maximum number of problems solved at the same time;
+            by default the number of CPUs.
+        :param use_threads: If ``True``, the workers are threads instead of processes.
+            Threads are better suited to planners that run in an external process,
+            like the :class:`~unified_planning.engines.PDDLPlanner` subclasses,
+            while processes avoid the `GIL` for the planners that run in Python.
+        :return: An iterator over the pairs ``(index, result)``, where ``index`` is
+            the position of the solved problem in ``problems``, in order of completion.
+        """
+        if isinstance(optimality_guarantee, str):
+            try:
+                optimality_guarantee = OptimalityGuarantee[optimality_guarantee.upper()]
+            except KeyError:
+                raise UPUsageError(
+                    f"{optimality_guarantee} is not a valid OptimalityGuarantee."
+                )
+        from unified_planning.engines.batch import solve_many
+
+        return solve_many(
+            self,
+            problems,
+            name,
+            params,
+            optimality_guarantee,
+            timeout,
+            max_workers,
+            use_threads,
+        )
+
     def AnytimePlanner(
         self,
         *,
@@ -13,6 +13,7 @@
 # limitations under the License.
 #
 
+import heapq
 import time
 import unified_planning as up
 import unified_planning.engines.mixins as mixins
@@ -26,7 +27,18 @@ from unified_planning.engines.results import (
 )
 from unified_planning.engines.mixins.oneshot_planner import OptimalityGuarantee
 from unified_planning.utils import powerset
-from typing import Type, IO, Optional, Union, List, Tuple, Callable
+from typing import (
+    AbstractSet,
+    Type,
+    IO,
+    Iterator,
+    FrozenSet,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Callable,
+)
 from fractions import Fraction
 
 
@@ -37,9 +49,21 @@ class OversubscriptionPlanner(MetaEngine, mixins.OneshotPlannerMixin):
     An oversubscription :class:`~unified_planning.model.Problem` is a `Problem` with some optional `goals`, where
     each one of those `goals` has a gain. The optimal :class:`~unified_planning.plans.Plan` is the one that maximizes the
     total gain by achieving some or all the optional goals.
+
+    By default, the subsets of the optional goals are all generated and sorted by
+    gain, and the underlying engine is called on each of them, requiring the goals of
+    the subset and the negation of the other goals, until a subset is solved.
+
+    With the ``incremental_search`` parameter set to ``True`` (and all the gains positive),
+    the subsets are instead generated lazily, by decreasing gain, and the goals outside
+    of the subset are not negated; so, when a subset is proven unsolvable, all its
+    supersets are skipped. When the subset with all the optional goals is unsolvable,
+    every single optional goal is also checked, so the goals that can't be achieved
+    prune all the subsets containing them.
     """
 
     def __init__(self, *args, **kwargs):
+        self._incremental_search = kwargs.pop("incremental_search", False)
         MetaEngine.__init__(self, *args, **kwargs)
         mixins.OneshotPlannerMixin.__init__(self)
 
@@ -111,7 +135,6 @@ class OversubscriptionPlanner(MetaEngine, mixins.OneshotPlannerMixin):
     ) -> "PlanGenerationResult":
         assert isinstance(problem, up.model.Problem)
         assert isinstance(self.engine, mixins.OneshotPlannerMixin)
-        em = problem.environment.expression_manager
         if len(problem.quality_metrics) == 0:
             goals: List = []
         else:
@@ -125,30 +148,55 @@ class OversubscriptionPlanner(MetaEngine, mixins.OneshotPlannerMixin):
                 ),
             )
             goals = list(qm.goals.items())
-        q = []
-        for l in powerset(goals):
-            weight: Union[Fraction, int] = 0
-            sg = []
-            for g, c in l:
-                weight += c
-                sg.append(g)
-            q.append((weight, sg))
-        q.sort(reverse=True, key=lambda t: t[0])
+        incremental = self._incremental_search and all(c > 0 for _, c in goals)
+        # the sets of goals proven unsolvable, used only by the incremental search
+        nogoods: List[FrozenSet[int]] = []
+        subsets: Iterator[FrozenSet[int]]
+        if incremental:
+            subsets = _subsets_by_decreasing_gain([c for _, c in goals], nogoods)
+        else:
+            q = []
+            for l in powerset(range(len(goals))):
+                weight: Union[Fraction, int] = sum(goals[i][1] for i in l)
+                q.append((weight, frozenset(l)))
+            q.sort(reverse=True, key=lambda t: t[0])
+            subsets = iter([sg for _, sg in q])
+        deadline = None if timeout is None else time.time() + timeout
         incomplete = False
-        for t in q:
-            new_problem = problem.clone()
-            new_problem.clear_quality_metrics()
-            for g, _ in goals:
-                if isinstance(g, tuple):
-                    goal = g[1] if g[1] in t[1] else em.Not(g[1])
-                    new_problem.add_timed_goal(g[0], goal)
-                else:
-                    goal = g if g in t[1] else em.Not(g)
-                    new_problem.add_goal(goal)
-            start = time.time()
-            res = self.engine.solve(new_problem, heuristic, timeout, output_stream)
-            if timeout is not None:
-                timeout -= min(timeout, time.time() - start)
+        singletons_checked = not incremental or len(goals) < 2
+        for subset in subsets:
+            if not singletons_checked and len(subset) < len(goals):
+                # the subset with all the goals was not solved, so the goals that
+                # can't be achieved alone are searched
+                singletons_checked = True
+                for i in range(len(goals)):
+                    if deadline is not None and deadline <= time.time():
+                        return PlanGenerationResult(
+                            PlanGenerationResultStatus.TIMEOUT, None, self.name
+                        )
+                    new_problem = self._subset_problem(problem, goals, {i}, False)
+                    res = self.engine.solve(
+                        new_problem,
+                        heuristic,
+                        _remaining_time(deadline),
+                        output_stream,
+                    )
+                    if res.status == PlanGenerationResultStatus.TIMEOUT:
+                        return PlanGenerationResult(
+                            PlanGenerationResultStatus.TIMEOUT, None, self.name
+                        )
+                    elif res.status == PlanGenerationResultStatus.UNSOLVABLE_PROVEN:
+                        nogoods.append(frozenset([i]))
+                if any(ng <= subset for ng in nogoods):
+                    continue
+            if deadline is not None and deadline <= time.time():
+                return PlanGenerationResult(
+                    PlanGenerationResultStatus.TIMEOUT, None, self.name
+                )
+            new_problem = self._subset_problem(problem, goals, subset, not incremental)
+            res = self.engine.solve(
+                new_problem, heuristic, _remaining_time(deadline), output_stream
+            )
             if res.status in up.engines.results.POSITIVE_OUTCOMES:
                 if incomplete or len(goals) == 0:
                     status = PlanGenerationResultStatus.SOLVED_SATISFICING
@@ -172,8 +220,94 @@ class OversubscriptionPlanner(MetaEngine, mixins.OneshotPlannerMixin):
                 PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY,
             ]:
                 incomplete = True
+            elif (
+                incremental
+                and res.status == PlanGenerationResultStatus.UNSOLVABLE_PROVEN
+            ):
+                nogoods.append(subset)
         if incomplete:
             status = PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY
         else:
             status = PlanGenerationResultStatus.UNSOLVABLE_PROVEN
         return PlanGenerationResult(status, None, self.name)
+
+    def _subset_problem(
+        self,
+        problem: "up.model.Problem",
+        goals: List[Tuple[Union["up.model.FNode", Tuple], Union[Fraction, int]]],
+        subset: AbstractSet[int],
+        negate_others: bool,
+    ) -> "up.model.Problem":
+        """
+        Returns a copy of the given problem, without quality metrics, where the goals
+        with an index in the given subset are required; if negate_others is True, the
+        negation of the other goals is also required.
+        """
+        em = problem.environment.expression_manager
+        new_problem = problem.clone()
+        new_problem.clear_quality_metrics()
+        for i, (g, _) in enumerate(goals):
+            if i not in subset and not negate_others:
+                continue
+            if isinstance(g, tuple):
+                goal = g[1] if i in subset else em.Not(g[1])
+                new_problem.add_timed_goal(g[0], goal)
+            else:
+                goal = g if i in subset else em.Not(g)
+                new_problem.add_goal(goal)
+        return new_problem
+
+
+def _remaining_time(deadline: Optional[float]) -> Optional[float]:
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.time())
+
+
+def _subsets_by_decreasing_gain(
+    gains: List[Union[Fraction, int]], nogoods: List[FrozenSet[int]]
+) -> Iterator[FrozenSet[int]]:
+    """
+    Lazily yields the subsets of the indexes of the given positive gains, by decreasing
+    total gain, skipping the supersets of the nogoods.
+
+    The subsets are the complements of the removed sets of indexes, generated by increasing
+    removed gain: every removed set, with the removed indexes sorted by gain, is generated
+    either by extending a removed set with the next index or by replacing its last index
+    with the next one; so at most two sets are added to the heap for every yielded subset.
+    The nogoods are checked when a subset is yielded, so the nogoods added while the subsets
+    are consumed are used to skip the following subsets.
+    """
+    all_goals = frozenset(range(len(gains)))
+    order = sorted(all_goals, key=lambda i: gains[i])
+    yield all_goals
+    heap: List[Tuple[Union[Fraction, int], int, int, FrozenSet[int]]] = []
+    if order:
+        heap.append((gains[order[0]], 0, 0, frozenset([order[0]])))
+    counter = 1
+    while heap:
+        removed_gain, _, last, removed = heapq.heappop(heap)
+        subset = all_goals - removed
+        if not any(ng <= subset for ng in nogoods):
+            yield subset
+        if last + 1 < len(order):
+            current, next_index = order[last], order[last + 1]
+            heapq.heappush(
+                heap,
+                (
+                    removed_gain + gains[next_index],
+                    counter,
+                    last + 1,
+                    removed | {next_index},
+                ),
+            )
+            heapq.heappush(
+                heap,
+                (
+                    removed_gain - gains[current] + gains[next_index],
+                    counter + 1,
+                    last + 1,
+                    (removed - {current}) | {next_index},
+                ),
+            )
+            counter += 2
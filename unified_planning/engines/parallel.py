@@ -14,7 +14,11 @@
 #
 
 
+import pickle
+import queue
 import warnings
+from collections import OrderedDict
+from functools import lru_cache
 import unified_planning as up
 import unified_planning.engines as engines
 from unified_planning.plans import Plan
@@ -27,8 +31,17 @@ from unified_planning.engines.results import (
     ValidationResult,
     PlanGenerationResult,
 )
-from typing import IO, Dict, List, Optional, Tuple, Callable, cast
-from multiprocessing import Process, Queue
+from typing import IO, Any, Dict, List, Optional, Set, Tuple, Callable, cast
+from multiprocessing import Process, Queue, Value
+
+# Number of problems that every persistent worker keeps deserialized, so that
+# calls on the same problem (for example validating many plans) ship it once.
+_SHIPPED_PROBLEMS = 4
+# Seconds given to the workers still busy on a cancelled call to get back
+# before being terminated and restarted, when a new call is submitted.
+_CANCELLATION_GRACE_PERIOD = 1.0
+# Seconds between two checks on the liveness of the workers while waiting
+_POLLING_PERIOD = 0.5
 
 
 class Parallel(
@@ -41,12 +54,18 @@ class Parallel(
 
     The `Engines` run the same command in parallel and the first definitive :class:`Result <unified_planning.engines.Result>` returned
     by the `Engine` is returned to the user.
+
+    By default, every call spawns a new process for every `Engine`. With
+    :func:`persistent_workers <unified_planning.engines.Parallel.persistent_workers>`
+    the processes are instead started once and keep their `Engine` instances
+    across the calls, until the `Parallel` is destroyed.
     """
 
     def __init__(
         self,
         factory: "up.engines.factory.Factory",
         engines: List[Tuple[str, Dict[str, str]]],
+        persistent_workers: bool = False,
     ):
         up.engines.engine.Engine.__init__(self)
         up.engines.mixins.OneshotPlannerMixin.__init__(self)
@@ -55,6 +74,36 @@ class Parallel(
         self.error_on_failed_checks = False
         self.engines = engines
         self._factory = factory
+        self._pool: Optional[_WorkersPool] = None
+        self._persistent_workers = persistent_workers
+
+    @property
+    def persistent_workers(self) -> bool:
+        """
+        Returns ``True`` if this `Parallel` runs its `Engines` in long-lived
+        worker processes.
+
+        The workers are started at the first call and keep their `Engine`
+        instances warm; every `Problem` is serialized (in the protobuf format when
+        available) and shipped to them only once. When a definitive result is
+        found, the losing workers are cancelled cooperatively: their result is
+        discarded and they are terminated only if they are still busy when
+        the next call is submitted.
+        """
+        return self._persistent_workers
+
+    @persistent_workers.setter
+    def persistent_workers(self, new_value: bool):
+        """Sets whether this `Parallel` runs its `Engines` in long-lived workers."""
+        if not new_value and self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        self._persistent_workers = new_value
+
+    def destroy(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     @property
     def name(self) -> str:
@@ -75,6 +124,12 @@ class Parallel(
         return True
 
     def _run_parallel(self, fname, *args) -> List[Result]:
+        if self._persistent_workers:
+            if self._pool is None:
+                self._pool = _WorkersPool(self._factory, self.engines)
+            return self._pool.run(
+                fname, self.skip_checks, self.error_on_failed_checks, *args
+            )
         signaling_queue: Queue = Queue()
         processes = []
         for idx, (engine_name, opts) in enumerate(self.engines):
@@ -216,3 +271,321 @@ def _run(
             signaling_queue.put((idx, ex))
             return
         signaling_queue.put((idx, local_res))
+
+
+@lru_cache(maxsize=None)
+def _protobuf_available() -> bool:
+    """Returns ``True`` if the protobuf package is installed."""
+    # the grpc modules import the engines, so they are imported lazily
+    try:
+        import unified_planning.grpc.proto_writer
+    except ImportError:
+        return False
+    return True
+
+
+def _serialize_problem(problem: "up.model.AbstractProblem") -> Tuple[bool, bytes]:
+    """
+    Serializes the given problem in the protobuf format, when available and
+    supported by the problem, otherwise with pickle.
+
+    :return: If the protobuf format was used and the serialized problem.
+    """
+    if _protobuf_available():
+        from unified_planning.grpc.proto_writer import ProtobufWriter
+
+        try:
+            return True, ProtobufWriter().convert(problem).SerializeToString()
+        except Exception:
+            # the protobuf format does not support every problem feature
+            pass
+    return False, pickle.dumps(problem)
+
+
+def _deserialize_problem(is_protobuf: bool, data: bytes) -> "up.model.AbstractProblem":
+    if is_protobuf:
+        import unified_planning.grpc.generated.unified_planning_pb2 as proto
+        from unified_planning.grpc.proto_reader import ProtobufReader
+
+        msg = proto.Problem()
+        msg.ParseFromString(data)
+        return ProtobufReader().convert(msg)
+    return pickle.loads(data)
+
+
+def _serialize_plan(plan: Plan, protobuf: bool) -> Tuple[bool, Any]:
+    """
+    Serializes the given plan in the protobuf format if ``protobuf`` is ``True``
+    and the format supports the plan, otherwise the plan is returned as it is.
+
+    :return: If the protobuf format was used and the serialized plan.
+    """
+    if protobuf:
+        from unified_planning.grpc.proto_writer import ProtobufWriter
+
+        try:
+            return True, ProtobufWriter().convert(plan).SerializeToString()
+        except Exception:
+            pass
+    return False, plan
+
+
+def _deserialize_plan(
+    is_protobuf: bool, data: Any, problem: "up.model.AbstractProblem"
+) -> Plan:
+    if is_protobuf:
+        import unified_planning.grpc.generated.unified_planning_pb2 as proto
+        from unified_planning.grpc.proto_reader import ProtobufReader
+
+        msg = proto.Plan()
+        msg.ParseFromString(data)
+        return ProtobufReader().convert(msg, problem)
+    if isinstance(problem, up.model.Problem):
+        # the plan refers to the actions and objects of the caller's problem
+        return problem.normalize_plan(data)
+    return data
+
+
+class _WorkersPool:
+    """
+    The long-lived worker processes of a `Parallel` engine; every worker
+    runs one of the engines.
+
+    Every call is identified by an increasing id. The problems are shipped to
+    the workers with a key; every worker keeps the last `_SHIPPED_PROBLEMS`
+    problems, and this class mirrors their caches to know when a problem must
+    be shipped again.
+    """
+
+    def __init__(
+        self,
+        factory: "up.engines.factory.Factory",
+        engines: List[Tuple[str, Dict[str, str]]],
+    ):
+        self._factory = factory
+        self._engines = engines
+        self._results: Queue = Queue()
+        # The id of the last cancelled call, read by the workers to skip the
+        # tasks of the calls that already have a result
+        self._cancelled = Value("q", 0, lock=False)
+        self._processes: List[Optional[Process]] = [None for _ in engines]
+        self._tasks: List[Optional[Queue]] = [None for _ in engines]
+        self._shipped: List["OrderedDict[int, None]"] = [OrderedDict() for _ in engines]
+        # The workers that did not answer their last call yet
+        self._busy: Set[int] = set()
+        self._calls = 0
+        # The problems shipped to the workers: key -> (problem, clone, serialized)
+        self._problems: "OrderedDict[int, Tuple[Any, Any, Tuple[bool, bytes]]]" = (
+            OrderedDict()
+        )
+        self._problem_keys = 0
+        for idx in range(len(engines)):
+            self._start_worker(idx)
+
+    def _start_worker(self, idx: int):
+        engine_name, options = self._engines[idx]
+        tasks: Queue = Queue()
+        process = Process(
+            name=str(idx),
+            target=_serve,
+            args=(
+                idx,
+                self._factory,
+                engine_name,
+                options,
+                tasks,
+                self._results,
+                self._cancelled,
+            ),
+            daemon=True,
+        )
+        process.start()
+        self._processes[idx] = process
+        self._tasks[idx] = tasks
+        self._shipped[idx].clear()
+
+    def _stop_worker(self, idx: int):
+        process = self._processes[idx]
+        if process is not None:
+            process.terminate()
+            process.join()
+        self._processes[idx] = None
+        self._busy.discard(idx)
+
+    def _problem_key(self, problem: "up.model.AbstractProblem") -> int:
+        for key, (shipped, clone, _) in self._problems.items():
+            # a problem modified after being shipped must be shipped again
+            if shipped is problem and problem == clone:
+                self._problems.move_to_end(key)
+                return key
+        self._problem_keys += 1
+        key = self._problem_keys
+        self._problems[key] = (problem, problem.clone(), _serialize_problem(problem))
+        while len(self._problems) > _SHIPPED_PROBLEMS:
+            self._problems.popitem(last=False)
+        return key
+
+    def _wait_busy_workers(self):
+        """Waits for the workers still busy on a cancelled call, for at most
+        `_CANCELLATION_GRACE_PERIOD` seconds, then restarts the others."""
+        while self._busy:
+            try:
+                idx, call, _ = self._results.get(
+                    block=True, timeout=_CANCELLATION_GRACE_PERIOD
+                )
+            except queue.Empty:
+                break
+            self._busy.discard(idx)
+        for idx in list(self._busy):
+            self._stop_worker(idx)
+            self._start_worker(idx)
+
+    def run(
+        self, fname: str, skip_checks: bool, error_on_failed_checks: bool, *args
+    ) -> List[Result]:
+        self._wait_busy_workers()
+        for idx, process in enumerate(self._processes):
+            if process is None or not process.is_alive():
+                self._start_worker(idx)
+        self._calls += 1
+        call = self._calls
+        problem, other_args = args[0], args[1:]
+        key = self._problem_key(problem)
+        if fname == "validate":
+            task_args = (
+                _serialize_plan(other_args[0], self._problems[key][2][0]),
+            ) + tuple(other_args[1:])
+        else:
+            task_args = other_args
+        for idx, tasks in enumerate(self._tasks):
+            assert tasks is not None
+            shipped = self._shipped[idx]
+            if key in shipped:
+                shipped.move_to_end(key)
+                serialized = None
+            else:
+                # the worker applies the same eviction policy on its side
+                shipped[key] = None
+                while len(shipped) > _SHIPPED_PROBLEMS:
+                    shipped.popitem(last=False)
+                serialized = self._problems[key][2]
+            tasks.put(
+                (
+                    call,
+                    fname,
+                    skip_checks,
+                    error_on_failed_checks,
+                    key,
+                    serialized,
+                    task_args,
+                )
+            )
+            self._busy.add(idx)
+        results: List[Result] = []
+        while self._busy:
+            try:
+                idx, res_call, res = self._results.get(
+                    block=True, timeout=_POLLING_PERIOD
+                )
+            except queue.Empty:
+                for idx in list(self._busy):
+                    process = self._processes[idx]
+                    if process is None or not process.is_alive():
+                        # a crashed worker is restarted at the next call
+                        self._busy.discard(idx)
+                        self._shipped[idx].clear()
+                continue
+            self._busy.discard(idx)
+            if res_call != call:
+                continue
+            if isinstance(res, BaseException):
+                self._cancelled.value = call
+                raise res
+            assert isinstance(res, Result)
+            if res.is_definitive_result(*other_args):
+                self._cancelled.value = call
+                return [res]
+            results.append(res)
+        return results
+
+    def shutdown(self):
+        for idx, tasks in enumerate(self._tasks):
+            process = self._processes[idx]
+            if tasks is not None and process is not None and idx not in self._busy:
+                tasks.put(None)
+        for idx, process in enumerate(self._processes):
+            if process is not None:
+                process.join(timeout=_CANCELLATION_GRACE_PERIOD)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+            self._processes[idx] = None
+        self._busy.clear()
+
+
+def _serve(
+    idx: int,
+    factory: "up.engines.factory.Factory",
+    engine_name: str,
+    options: Dict[str, str],
+    tasks: Queue,
+    results: Queue,
+    cancelled,
+):
+    EngineClass = factory.engine(engine_name)
+    problems: "OrderedDict[int, up.model.AbstractProblem]" = OrderedDict()
+    # The engine instances, by the environment of the problems they work on:
+    # the problems shipped with protobuf all share the environment of the
+    # worker, while every problem shipped with pickle has its own copy
+    engines_instances: Dict[
+        "up.environment.Environment", "up.engines.engine.Engine"
+    ] = {}
+    try:
+        while True:
+            task = tasks.get(block=True)
+            if task is None:
+                return
+            (
+                call,
+                fname,
+                skip_checks,
+                error_on_failed_checks,
+                key,
+                serialized,
+                args,
+            ) = task
+            if serialized is not None:
+                problems[key] = _deserialize_problem(*serialized)
+                while len(problems) > _SHIPPED_PROBLEMS:
+                    problems.popitem(last=False)
+                environments = {p.environment for p in problems.values()}
+                for env in list(engines_instances):
+                    if env not in environments:
+                        engines_instances.pop(env).destroy()
+            else:
+                problems.move_to_end(key)
+            if call <= cancelled.value:
+                # the call already has a definitive result
+                results.put((idx, call, None))
+                continue
+            problem = problems[key]
+            s = engines_instances.get(problem.environment, None)
+            if s is None:
+                # the engines that do not take the environment from the problem
+                # use the default one
+                up.environment.GLOBAL_ENVIRONMENT = problem.environment
+                s = EngineClass(**options)
+                engines_instances[problem.environment] = s
+            if fname == "validate":
+                args = (_deserialize_plan(*args[0], problem),) + tuple(args[1:])
+            s.skip_checks = skip_checks
+            s.error_on_failed_checks = error_on_failed_checks
+            try:
+                local_res = getattr(s, fname)(problem, *args)
+            except Exception as ex:
+                results.put((idx, call, ex))
+                continue
+            results.put((idx, call, local_res))
+    finally:
+        for s in engines_instances.values():
+            s.destroy()
@@ -71,17 +71,33 @@ class PDDLAnytimePlanner(engines.pddl_planner.PDDLPlanner, mixins.AnytimePlanner
     that can be invocated through a subprocess call.
     """
 
-    def __init__(self, needs_requirements=True, rewrite_bool_assignments=False):
+    def __init__(
+        self,
+        needs_requirements=True,
+        rewrite_bool_assignments=False,
+        in_memory=False,
+        cache_domain=False,
+    ):
         """
         :param self: The PDDLEngine instance.
         :param needs_requirements: Flag defining if the Engine needs the PDDL requirements.
         :param rewrite_bool_assignments: Flag defining if the non-constant boolean assignments
             will be rewritten as conditional effects in the PDDL file submitted to the Engine.
+        :param in_memory: Flag defining if the PDDL files submitted to the Engine are written in a
+            scratch directory on a memory-backed filesystem, reused by every ``solve``; see
+            :class:`~unified_planning.engines.PDDLPlanner`.
+        :param cache_domain: Flag defining if the PDDL domains are kept in a
+            :class:`~unified_planning.io.PDDLDomainCache`; see
+            :class:`~unified_planning.engines.PDDLPlanner`.
         """
         engines.engine.Engine.__init__(self)
         mixins.AnytimePlannerMixin.__init__(self)
         engines.pddl_planner.PDDLPlanner.__init__(
-            self, needs_requirements, rewrite_bool_assignments
+            self,
+            needs_requirements,
+            rewrite_bool_assignments,
+            in_memory,
+            cache_domain,
         )
 
     @abstractmethod
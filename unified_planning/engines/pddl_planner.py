@@ -18,6 +18,7 @@ from abc import ABCMeta, abstractmethod
 import asyncio
 from asyncio.subprocess import PIPE
 import select
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -34,10 +35,21 @@ from unified_planning.engines.results import (
     PlanGenerationResult,
     PlanGenerationResultStatus,
 )
-from unified_planning.io import PDDLWriter, PDDLReader
+from unified_planning.io import PDDLWriter, PDDLReader, PDDLDomainCache
 from asyncio.subprocess import PIPE
+from contextlib import nullcontext
 from fractions import Fraction
-from typing import IO, Any, Callable, Optional, List, Tuple, Union, cast
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ContextManager,
+    Optional,
+    List,
+    Tuple,
+    Union,
+    cast,
+)
 
 # This module implements two different mechanisms to execute a PDDL planner in a
 # subprocess, processing the output in real-time and imposing a timeout.
@@ -58,6 +70,18 @@ ENV_USE_ASYNCIO = os.environ.get("UP_USE_ASYNCIO_PDDL_PLANNER")
 if ENV_USE_ASYNCIO is not None:
     USE_ASYNCIO_ON_UNIX = ENV_USE_ASYNCIO.lower() in ["true", "1"]
 
+# The memory-backed filesystem where the PDDLPlanners created with the
+# in_memory flag keep their scratch directory. If it is not available, the
+# default temporary directory is used instead.
+RAMDISK_DIR = "/dev/shm"
+
+
+def _scratch_parent_dir() -> Optional[str]:
+    """Returns the directory where the in-memory scratch directories are created."""
+    if os.path.isdir(RAMDISK_DIR) and os.access(RAMDISK_DIR, os.W_OK | os.X_OK):
+        return RAMDISK_DIR
+    return None
+
 
 class PDDLPlanner(engines.engine.Engine, mixins.OneshotPlannerMixin):
     """
@@ -65,21 +89,60 @@ class PDDLPlanner(engines.engine.Engine, mixins.OneshotPlannerMixin):
     that can be invocated through a subprocess call.
     """
 
-    def __init__(self, needs_requirements=True, rewrite_bool_assignments=False):
+    def __init__(
+        self,
+        needs_requirements=True,
+        rewrite_bool_assignments=False,
+        in_memory=False,
+        cache_domain=False,
+    ):
         """
         :param self: The PDDLEngine instance.
         :param needs_requirements: Flag defining if the Engine needs the PDDL requirements.
         :param rewrite_bool_assignments: Flag defining if the non-constant boolean assignments
             will be rewritten as conditional effects in the PDDL file submitted to the Engine.
+        :param in_memory: Flag defining if the PDDL files submitted to the Engine are written in a
+            scratch directory on a memory-backed filesystem (``/dev/shm``, when available), created
+            once and reused by every ``solve`` of this Engine, instead of a new temporary directory
+            for every ``solve``. The scratch directory is removed by the ``destroy`` method.
+        :param cache_domain: Flag defining if the PDDL domains are kept in a
+            :class:`~unified_planning.io.PDDLDomainCache`, so the domain shared by many solved
+            problems is rendered only once. With the ``in_memory`` flag, the domain file in the
+            scratch directory is also reused until the domain changes.
         """
         engines.engine.Engine.__init__(self)
         mixins.OneshotPlannerMixin.__init__(self)
         self._mode_running = OperationMode.ONESHOT_PLANNER
         self._needs_requirements = needs_requirements
         self._rewrite_bool_assignments = rewrite_bool_assignments
+        self._in_memory = in_memory
+        self._scratch_dir: Optional[str] = None
+        # the content of the domain file in the scratch directory
+        self._scratch_domain: Optional[str] = None
+        self._domain_cache: Optional[PDDLDomainCache] = (
+            PDDLDomainCache() if cache_domain else None
+        )
         self._process = None
         self._writer = None
 
+    def destroy(self):
+        if self._scratch_dir is not None:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
+            self._scratch_dir = None
+            self._scratch_domain = None
+
+    def _get_scratch_dir(self) -> str:
+        """
+        Returns the scratch directory of this Engine, creating it the first time;
+        it is used only when the Engine is created with the ``in_memory`` flag.
+        """
+        if self._scratch_dir is None or not os.path.isdir(self._scratch_dir):
+            self._scratch_dir = tempfile.mkdtemp(
+                prefix="up_pddl_", dir=_scratch_parent_dir()
+            )
+            self._scratch_domain = None
+        return self._scratch_dir
+
     @abstractmethod
     def _get_cmd(
         self, domain_filename: str, problem_filename: str, plan_filename: str
@@ -157,6 +220,38 @@ class PDDLPlanner(engines.engine.Engine, mixins.OneshotPlannerMixin):
         reader = PDDLReader(problem.environment)
         return reader.parse_plan_string(problem, plan_str, get_item_named)
 
+    def _plan_from_output(
+        self,
+        problem: "up.model.Problem",
+        planner_output: str,
+        get_item_named: Callable[
+            [str],
+            Union[
+                "up.model.Type",
+                "up.model.Action",
+                "up.model.Fluent",
+                "up.model.Object",
+                "up.model.Parameter",
+                "up.model.Variable",
+            ],
+        ],
+    ) -> Optional["up.plans.Plan"]:
+        """
+        Takes a problem, the standard output of the engine and a map of renaming and returns
+        the plan printed by the engine, or ``None`` if the output does not contain a plan.
+        When this method returns a plan, the plan file is not read.
+
+        | Note: the default implementation always returns ``None``; it must be overridden only
+            by the engines that print the plan on the standard output.
+
+        :param problem: The up.model.problem.Problem instance for which the plan is generated.
+        :param planner_output: The standard output of the engine.
+        :param get_item_named: A function that takes a name and returns the original up.model element instance
+            linked to that renaming.
+        :return: The up.plans.Plan printed by the engine, if any.
+        """
+        return None
+
     def _solve(
         self,
         problem: "up.model.AbstractProblem",
@@ -166,15 +261,34 @@ class PDDLPlanner(engines.engine.Engine, mixins.OneshotPlannerMixin):
     ) -> "up.engines.results.PlanGenerationResult":
         assert isinstance(problem, up.model.Problem)
         self._writer = PDDLWriter(
-            problem, self._needs_requirements, self._rewrite_bool_assignments
+            problem,
+            self._needs_requirements,
+            self._rewrite_bool_assignments,
+            self._domain_cache,
         )
         plan = None
         logs: List["up.engines.results.LogMessage"] = []
-        with tempfile.TemporaryDirectory() as tempdir:
+        if self._in_memory:
+            scratch_dir = self._get_scratch_dir()
+            tempdir_context: ContextManager[str] = nullcontext(scratch_dir)
+        else:
+            tempdir_context = tempfile.TemporaryDirectory()
+        with tempdir_context as tempdir:
             domain_filename = os.path.join(tempdir, "domain.pddl")
             problem_filename = os.path.join(tempdir, "problem.pddl")
             plan_filename = os.path.join(tempdir, "plan.txt")
-            self._writer.write_domain(domain_filename)
+            if self._in_memory and os.path.exists(plan_filename):
+                # left there by the previous solve in the scratch directory
+                os.remove(plan_filename)
+            if self._in_memory:
+                domain = self._writer.get_domain()
+                # the domain file is reused if the domain did not change
+                if domain != self._scratch_domain:
+                    with open(domain_filename, "w") as domain_file:
+                        domain_file.write(domain)
+                    self._scratch_domain = domain
+            else:
+                self._writer.write_domain(domain_filename)
             self._writer.write_problem(problem_filename)
             if self._mode_running == OperationMode.ONESHOT_PLANNER:
                 cmd = self._get_cmd(domain_filename, problem_filename, plan_filename)
@@ -231,7 +345,10 @@ class PDDLPlanner(engines.engine.Engine, mixins.OneshotPlannerMixin):
             logs.append(
                 up.engines.results.LogMessage(LogLevel.ERROR, "".join(proc_err))
             )
-            if os.path.isfile(plan_filename):
+            plan = self._plan_from_output(
+                problem, "".join(proc_out), self._writer.get_item_named
+            )
+            if plan is None and os.path.isfile(plan_filename):
                 plan = self._plan_from_file(
                     problem, plan_filename, self._writer.get_item_named
                 )
@@ -35,7 +35,9 @@ from unified_planning.model import (
     Fluent,
     FNode,
     ExpressionManager,
+    State,
     UPState,
+    CompactState,
     Problem,
     MinimizeActionCosts,
     MinimizeExpressionOnFinalState,
@@ -43,8 +45,15 @@ from unified_planning.model import (
     Oversubscription,
 )
 from unified_planning.model.types import _RealType
-from unified_planning.model.walkers import StateEvaluator, ExpressionQuantifiersRemover
+from unified_planning.model.effect import EffectKind
+from unified_planning.model.walkers import (
+    StateEvaluator,
+    CompiledStateEvaluator,
+    ExpressionQuantifiersRemover,
+)
+from unified_planning.model.walkers.state_evaluator import CompiledExpression
 from typing import (
+    Any,
     Callable,
     Dict,
     Iterator,
@@ -85,13 +94,31 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
 
     This SequentialSimulator, when considering if a state is goal or not, ignores the
     quality metrics.
+
+    By default the states are represented with the :class:`~unified_planning.model.UPState`;
+    when the ``compact_states`` flag is set, the :class:`~unified_planning.model.CompactState`
+    is used instead, that indexes every grounded fluent of the problem once and offers
+    constant time lookups and hashable states.
+
+    When the ``compiled`` flag is set (it implies ``compact_states``), the conditions and
+    the effects of every grounded action are compiled into closures that work directly
+    on the :class:`~unified_planning.model.CompactState` storage, so the applicability checks
+    and the successor generation do not create any expression. The semantic is the same
+    of the default mode; actions with simulated effects are always evaluated in the default way.
     """
 
     def __init__(
-        self, problem: "up.model.Problem", error_on_failed_checks: bool = True, **kwargs
+        self,
+        problem: "up.model.Problem",
+        error_on_failed_checks: bool = True,
+        compact_states: bool = False,
+        compiled: bool = False,
+        **kwargs,
     ):
         Engine.__init__(self)
         self.error_on_failed_checks = error_on_failed_checks
+        self._compact_states = compact_states or compiled
+        self._compiled = compiled
         SequentialSimulatorMixin.__init__(self, problem)
         pk = problem.kind
         if not Grounder.supports(pk):
@@ -104,7 +131,18 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         self._grounder = GrounderHelper(problem)
         self._actions = set(self._problem.actions)
         self._se = StateEvaluator(self._problem)
-        self._initial_state: Optional[UPState] = None
+        self._initial_state: Optional[State] = None
+        self._fluents_index: Optional[up.model.state.GroundFluentsIndex] = None
+        self._successor_generator: Optional[_SuccessorGenerator] = None
+        # Compiled mode data structures, populated lazily.
+        self._compiled_evaluator: Optional[CompiledStateEvaluator] = None
+        self._compiled_actions: Dict[
+            Tuple["up.model.Action", Tuple[FNode, ...]], Optional[_CompiledAction]
+        ] = {}
+        self._compiled_state_invariants: Optional[
+            List[Tuple[FNode, CompiledExpression]]
+        ] = None
+        self._compiled_goals: Optional[List[Tuple[FNode, CompiledExpression]]] = None
 
         # Add state invariants without quantifiers to get all the grounded
         # fluent instances that might modify the state invariants
@@ -164,16 +202,187 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         ), "Supported_kind not respected"
         return grounded_act
 
+    def _check_state_class(self, state: "up.model.State"):
+        """
+        Raises an exception if the given state is not of the class created by this simulator.
+
+        :param state: The state to check.
+        :raises UPUsageError: If the state is not of the class used by this simulator.
+        """
+        state_class = CompactState if self._compact_states else UPState
+        if not isinstance(state, state_class):
+            raise UPUsageError(
+                f"The UPSequentialSimulator uses the {state_class.__name__} but {type(state).__name__} is given."
+            )
+        if (
+            isinstance(state, CompactState)
+            and state.index is not self._get_fluents_index()
+        ):
+            raise UPUsageError(
+                "The given CompactState was not created by this UPSequentialSimulator."
+            )
+
+    def _get_fluents_index(self) -> "up.model.state.GroundFluentsIndex":
+        """Returns the index used to create the CompactStates of this simulator."""
+        if self._fluents_index is None:
+            assert isinstance(self._problem, Problem), "supported_kind not respected"
+            self._fluents_index = up.model.state.GroundFluentsIndex(self._problem)
+        return self._fluents_index
+
+    def _get_successor_generator(self) -> "_SuccessorGenerator":
+        """Returns the index of the grounded actions used to get the applicable actions."""
+        if self._successor_generator is None:
+            self._successor_generator = _SuccessorGenerator(
+                self._problem.environment.expression_manager
+            )
+            for (
+                original_action,
+                params,
+                g_action,
+            ) in self._grounder.get_grounded_actions():
+                if g_action is not None:
+                    assert isinstance(g_action, up.model.InstantaneousAction)
+                    self._successor_generator.add_action(
+                        original_action, params, g_action
+                    )
+        return self._successor_generator
+
+    def _get_compiled_evaluator(self) -> CompiledStateEvaluator:
+        """Returns the walker used to compile the expressions in compiled mode."""
+        if self._compiled_evaluator is None:
+            assert isinstance(self._problem, Problem), "supported_kind not respected"
+            self._compiled_evaluator = CompiledStateEvaluator(
+                self._problem, self._get_fluents_index()
+            )
+        return self._compiled_evaluator
+
+    def _get_compiled_action(
+        self, action: "up.model.Action", params: Tuple["up.model.FNode", ...]
+    ) -> Optional["_CompiledAction"]:
+        """
+        Returns the compiled version of the given action grounded with the given parameters.
+
+        :param action: The action to ground and compile.
+        :param params: The parameters used to ground the action.
+        :return: The compiled action; None if the action must be evaluated in the default
+            way, because it grounds to an invalid action, it has simulated effects or it
+            contains expressions that can't be compiled.
+        """
+        key = (action, params)
+        if key in self._compiled_actions:
+            return self._compiled_actions[key]
+        grounded_action = self._ground_action(action, params)
+        compiled_action: Optional[_CompiledAction] = None
+        if grounded_action is not None and grounded_action.simulated_effect is None:
+            evaluator = self._get_compiled_evaluator()
+            try:
+                compiled_action = _CompiledAction(
+                    [(c, evaluator.compile(c)) for c in grounded_action.preconditions],
+                    [
+                        (
+                            e.kind,
+                            e.fluent.type.is_bool_type(),
+                            evaluator.compile_fluent_position(e.fluent),
+                            evaluator.compile(e.condition)
+                            if e.is_conditional()
+                            else None,
+                            evaluator.compile(e.value),
+                            e.fluent,
+                        )
+                        for e in grounded_action.effects
+                    ],
+                )
+            except NotImplementedError:
+                compiled_action = None
+        self._compiled_actions[key] = compiled_action
+        return compiled_action
+
+    def _get_compiled_state_invariants(self) -> List[Tuple[FNode, CompiledExpression]]:
+        """Returns the state invariants of the problem, together with their compiled version."""
+        if self._compiled_state_invariants is None:
+            evaluator = self._get_compiled_evaluator()
+            self._compiled_state_invariants = [
+                (si, evaluator.compile(si)) for si in self._state_invariants
+            ]
+        return self._compiled_state_invariants
+
+    def _compiled_successor(
+        self, state: CompactState, compiled_action: "_CompiledAction"
+    ) -> CompactState:
+        """
+        Applies the effects of the given compiled action in the given state; has the same
+        semantic of the :func:`_evaluate_effect` method applied to all the action's effects.
+
+        :param state: The state in which the effects are evaluated.
+        :param compiled_action: The compiled action to apply.
+        :return: The new state, the state invariants are not checked.
+        :raises UPConflictingEffectsException: If to the same fluent are assigned 2 different
+            values.
+        """
+        bool_values: Dict[int, bool] = {}
+        slot_values: Dict[int, Any] = {}
+        assigned_slots: Set[int] = set()
+        slots = state._slots
+        for (
+            kind,
+            is_bool,
+            position,
+            condition,
+            value,
+            fluent,
+        ) in compiled_action.effects:
+            if condition is not None and not condition(state):
+                continue
+            pos = position(state)
+            new_value = value(state)
+            if is_bool:
+                # solve with add-after-delete logic
+                if not bool_values.get(pos, False):
+                    bool_values[pos] = new_value
+            elif kind == EffectKind.ASSIGN:
+                old_value = slot_values.get(pos, _NOT_ASSIGNED)
+                if old_value is not _NOT_ASSIGNED and new_value != old_value:
+                    raise UPConflictingEffectsException(
+                        f"The fluent {fluent} is modified by 2 different assignments in the same action."
+                    )
+                elif old_value is not _NOT_ASSIGNED and pos not in assigned_slots:
+                    raise UPConflictingEffectsException(
+                        f"The fluent {fluent} is modified by 1 assignments and an increase/decrease in the same action."
+                    )
+                assigned_slots.add(pos)
+                slot_values[pos] = new_value
+            else:
+                if pos in assigned_slots:
+                    raise UPConflictingEffectsException(
+                        f"The fluent {fluent} is modified by an assignment and an increase/decrease in the same action."
+                    )
+                old_value = slot_values.get(pos, _NOT_ASSIGNED)
+                if old_value is _NOT_ASSIGNED:
+                    old_value = slots[pos]
+                if kind == EffectKind.INCREASE:
+                    slot_values[pos] = old_value + new_value
+                elif kind == EffectKind.DECREASE:
+                    slot_values[pos] = old_value - new_value
+                else:
+                    raise NotImplementedError
+        return state._make_child_from_positions(bool_values, slot_values)
+
     def _get_initial_state(self) -> "up.model.State":
         """
         Returns the problem's initial state.
 
         NOTE: Every method that requires a state assumes that it's the same class
-        of the state given here, therefore an up.model.UPState.
+        of the state given here, therefore an up.model.UPState or an up.model.CompactState
+        if the ``compact_states`` flag is set.
         """
         assert isinstance(self._problem, Problem), "supported_kind not respected"
         if self._initial_state is None:
-            self._initial_state = UPState(self._problem.initial_values)
+            if self._compact_states:
+                self._initial_state = self._get_fluents_index().create_state(
+                    self._problem.initial_values
+                )
+            else:
+                self._initial_state = UPState(self._problem.initial_values)
             for si in self._state_invariants:
                 if not self._se.evaluate(si, self._initial_state).bool_constant_value():
                     raise UPProblemDefinitionError(
@@ -261,10 +470,20 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         action, params = self._get_action_and_parameters(
             action_or_action_instance, parameters
         )
-        if not isinstance(state, up.model.UPState):
-            raise UPUsageError(
-                f"The UPSequentialSimulator uses the UPState but {type(state).__name__} is given."
-            )
+        self._check_state_class(state)
+        assert isinstance(state, (UPState, CompactState))
+        if self._compiled:
+            assert isinstance(state, CompactState)
+            compiled_action = self._get_compiled_action(action, params)
+            if compiled_action is not None:
+                new_compact_state = self._compiled_successor(state, compiled_action)
+                for _, csi in self._get_compiled_state_invariants():
+                    if not csi(new_compact_state):
+                        raise UPInvalidActionError(
+                            "The given action is not applicable because it violates state invariants.",
+                            "Bounded numeric types are checked as state invariants.",
+                        )
+                return new_compact_state
         grounded_action = self._ground_action(action, params)
         if grounded_action is None:
             raise UPInvalidActionError("Apply_unsafe got an inapplicable action.")
@@ -400,7 +619,9 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         :param state: the `state` where the formulas are evaluated.
         :return: an `Iterator` of applicable actions + parameters.
         """
-        for original_action, params, _ in self._grounder.get_grounded_actions():
+        for original_action, params in self._get_successor_generator().get_candidates(
+            state
+        ):
             if self._is_applicable(state, original_action, params):
                 yield (original_action, params)
 
@@ -435,6 +656,14 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
             action_or_action_instance,
             parameters,
         )
+        if self._compiled:
+            self._check_state_class(state)
+            assert isinstance(state, CompactState)
+            compiled_action = self._get_compiled_action(action, params)
+            if compiled_action is not None:
+                return self._get_compiled_unsatisfied_conditions(
+                    state, compiled_action, early_termination, full_check
+                )
         g_action = self._ground_action(action, params)
         if g_action is None:
             raise UPInvalidActionError(
@@ -532,10 +761,8 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
                                     "Conflicting effects should be caught above"
                                 )
 
-            if not isinstance(state, up.model.UPState):
-                raise UPUsageError(
-                    f"The UPSequentialSimulator uses the UPState but {type(state).__name__} is given."
-                )
+            self._check_state_class(state)
+            assert isinstance(state, (UPState, CompactState))
             new_partial_state = state.make_child(updated_values)
             for si in self._state_invariants:
                 if not self._se.evaluate(si, new_partial_state).bool_constant_value():
@@ -546,6 +773,44 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
                         break
         return unsatisfied_conditions, reason
 
+    def _get_compiled_unsatisfied_conditions(
+        self,
+        state: CompactState,
+        compiled_action: "_CompiledAction",
+        early_termination: bool,
+        full_check: bool,
+    ) -> Tuple[List["up.model.FNode"], Optional[InapplicabilityReasons]]:
+        """
+        Compiled mode version of the :func:`get_unsatisfied_conditions` method.
+
+        When ``full_check`` is set, the effects of the action are entirely applied to detect
+        conflicting effects and the state invariants are checked in the resulting state.
+        """
+        reason: Optional[InapplicabilityReasons] = None
+        unsatisfied_conditions = []
+        for c, compiled_c in compiled_action.preconditions:
+            if not compiled_c(state):
+                unsatisfied_conditions.append(c)
+                reason = InapplicabilityReasons.VIOLATES_CONDITIONS
+                if early_termination:
+                    return unsatisfied_conditions, reason
+        if full_check:
+            try:
+                new_state = self._compiled_successor(state, compiled_action)
+            except UPConflictingEffectsException:
+                return (
+                    unsatisfied_conditions,
+                    InapplicabilityReasons.CONFLICTING_EFFECTS,
+                )
+            for si, compiled_si in self._get_compiled_state_invariants():
+                if not compiled_si(new_state):
+                    unsatisfied_conditions.append(si)
+                    if reason is None:
+                        reason = InapplicabilityReasons.VIOLATES_STATE_INVARIANTS
+                    if early_termination:
+                        break
+        return unsatisfied_conditions, reason
+
     def get_unsatisfied_goals(
         self, state: "up.model.State", early_termination: bool = False
     ) -> List["up.model.FNode"]:
@@ -558,6 +823,20 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         :return: The list of all the `goals` that evaluated to `False` or the list containing the first `goal` evaluated to `False` if the flag `early_termination` is set.
         """
         unsatisfied_goals = []
+        if self._compiled:
+            self._check_state_class(state)
+            if self._compiled_goals is None:
+                evaluator = self._get_compiled_evaluator()
+                self._compiled_goals = [
+                    (g, evaluator.compile(g))
+                    for g in cast(up.model.Problem, self._problem).goals
+                ]
+            for g, compiled_g in self._compiled_goals:
+                if not compiled_g(state):
+                    unsatisfied_goals.append(g)
+                    if early_termination:
+                        break
+            return unsatisfied_goals
         for g in cast(up.model.Problem, self._problem).goals:
             g_eval = self._se.evaluate(g, state).bool_constant_value()
             if not g_eval:
@@ -622,6 +901,209 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         return problem_kind <= UPSequentialSimulator.supported_kind()
 
 
+# Marker for the fluents not yet assigned by an action in the compiled mode
+_NOT_ASSIGNED = object()
+
+
+class _CompiledAction:
+    """
+    Grounded action compiled by the :class:`~unified_planning.engines.UPSequentialSimulator`
+    in compiled mode.
+
+    The `preconditions` are the couples of the grounded precondition and its compiled version;
+    the `effects` are tuples containing the `EffectKind`, a flag telling if the fluent is boolean,
+    the closure returning the fluent position in the state, the compiled condition (or `None` if
+    the effect is unconditional), the compiled value and the effect's fluent.
+    """
+
+    __slots__ = ["preconditions", "effects"]
+
+    def __init__(
+        self,
+        preconditions: List[Tuple[FNode, CompiledExpression]],
+        effects: List[
+            Tuple[
+                EffectKind,
+                bool,
+                Callable[[CompactState], int],
+                Optional[CompiledExpression],
+                CompiledExpression,
+                FNode,
+            ]
+        ],
+    ):
+        self.preconditions = preconditions
+        self.effects = effects
+
+
+class _SuccessorGeneratorNode:
+    """Node of the trie used by the `_SuccessorGenerator`."""
+
+    __slots__ = ["actions", "children"]
+
+    def __init__(self):
+        # The grounded actions whose literals are all on the path to this node,
+        # stored with their insertion number, to keep the grounding order.
+        self.actions: List[
+            Tuple[int, "up.model.Action", Tuple["up.model.FNode", ...]]
+        ] = []
+        # Map from a fluent instance to the map from its value to the child node.
+        self.children: Dict[FNode, Dict[FNode, "_SuccessorGeneratorNode"]] = {}
+
+
+class _SuccessorGenerator:
+    """
+    Precondition index over the grounded actions of a problem, used by the
+    :class:`~unified_planning.engines.UPSequentialSimulator` to avoid the evaluation
+    of every grounded action in every state.
+
+    Every grounded action is inserted in a trie, following the sorted list of its
+    preconditions that are literals; a literal is a fluent instance with constant arguments
+    that must have a given value: a boolean fluent, the negation of a boolean fluent or the
+    equality between an object fluent and an object. The trie is visited following only
+    the values that the fluent instances have in the state, so the actions whose literals
+    are violated are never reached; the reached actions are only candidates, their other
+    conditions, effects and the state invariants still need to be checked.
+
+    Static preconditions are already removed by the grounding (an action with a false static
+    precondition grounds to `None` and is not inserted). The index is updated incrementally
+    with the :func:`add_action` and :func:`remove_action` methods.
+    """
+
+    def __init__(self, expression_manager: ExpressionManager):
+        self._em = expression_manager
+        self._root = _SuccessorGeneratorNode()
+        # Global order of the fluent instances, used to sort the literals of every action
+        # so that actions sharing literals share the path in the trie.
+        self._fluents_order: Dict[FNode, int] = {}
+        self._paths: Dict[
+            Tuple["up.model.Action", Tuple["up.model.FNode", ...]],
+            Tuple[int, List[Tuple[FNode, FNode]]],
+        ] = {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def _get_literals(
+        self, grounded_action: "up.model.InstantaneousAction"
+    ) -> List[Tuple[FNode, FNode]]:
+        """Returns the sorted list of the literals of the given action's preconditions."""
+        literals: Dict[FNode, FNode] = {}
+        stack = list(grounded_action.preconditions)
+        while stack:
+            c = stack.pop()
+            if c.is_and():
+                stack.extend(c.args)
+                continue
+            fluent_exp, value = None, None
+            if c.is_fluent_exp():
+                fluent_exp, value = c, self._em.TRUE()
+            elif c.is_not() and c.arg(0).is_fluent_exp():
+                fluent_exp, value = c.arg(0), self._em.FALSE()
+            elif c.is_equals():
+                left, right = c.arg(0), c.arg(1)
+                if right.is_fluent_exp():
+                    left, right = right, left
+                if left.is_fluent_exp() and right.is_object_exp():
+                    fluent_exp, value = left, right
+            if fluent_exp is None or not all(a.is_constant() for a in fluent_exp.args):
+                continue
+            # if the action has contradicting literals only the first one is indexed,
+            # the full check of the candidate will discard the action
+            literals.setdefault(fluent_exp, value)
+            self._fluents_order.setdefault(fluent_exp, len(self._fluents_order))
+        sorted_literals = list(literals.items())
+        sorted_literals.sort(key=lambda literal: self._fluents_order[literal[0]])
+        return sorted_literals
+
+    def add_action(
+        self,
+        action: "up.model.Action",
+        parameters: Tuple["up.model.FNode", ...],
+        grounded_action: "up.model.InstantaneousAction",
+    ):
+        """
+        Adds the given grounded action to the index.
+
+        :param action: The original action of the problem.
+        :param parameters: The parameters used to ground the `action`.
+        :param grounded_action: The result of the grounding of the `action` with the
+            given `parameters`.
+        """
+        key = (action, parameters)
+        if key in self._paths:
+            return
+        literals = self._get_literals(grounded_action)
+        node = self._root
+        for fluent_exp, value in literals:
+            node = node.children.setdefault(fluent_exp, {}).setdefault(
+                value, _SuccessorGeneratorNode()
+            )
+        node.actions.append((self._counter, action, parameters))
+        self._paths[key] = (self._counter, literals)
+        self._counter += 1
+
+    def remove_action(
+        self,
+        action: "up.model.Action",
+        parameters: Tuple["up.model.FNode", ...],
+    ):
+        """
+        Removes the given grounded action from the index; does nothing if the
+        action is not in the index.
+
+        :param action: The original action of the problem.
+        :param parameters: The parameters used to ground the `action`.
+        """
+        path = self._paths.pop((action, parameters), None)
+        if path is None:
+            return
+        number, literals = path
+        visited = [self._root]
+        for fluent_exp, value in literals:
+            visited.append(visited[-1].children[fluent_exp][value])
+        node = visited[-1]
+        node.actions = [a for a in node.actions if a[0] != number]
+        # remove the nodes left empty
+        for (fluent_exp, value), parent, node in reversed(
+            list(zip(literals, visited, visited[1:]))
+        ):
+            if node.actions or node.children:
+                break
+            branches = parent.children[fluent_exp]
+            del branches[value]
+            if not branches:
+                del parent.children[fluent_exp]
+
+    def get_candidates(
+        self, state: "up.model.State"
+    ) -> List[Tuple["up.model.Action", Tuple["up.model.FNode", ...]]]:
+        """
+        Returns the grounded actions whose literals are satisfied in the given state,
+        in the order they were added to the index.
+
+        :param state: The state used to visit the index.
+        :return: The list of the candidate `action + parameters`.
+        """
+        candidates = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            candidates.extend(node.actions)
+            for fluent_exp, branches in node.children.items():
+                try:
+                    child = branches.get(state.get_value(fluent_exp), None)
+                except UPUsageError:
+                    # the fluent instance has no value in the state; the actions
+                    # requiring it can't be applied
+                    continue
+                if child is not None:
+                    stack.append(child)
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [(action, parameters) for _, action, parameters in candidates]
+
+
 def evaluate_quality_metric(
     simulator: SequentialSimulatorMixin,
     quality_metric: "up.model.PlanQualityMetric",
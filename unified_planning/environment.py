@@ -21,7 +21,7 @@ such as the :func:`ExpressionManager <unified_planning.Environment.expression_ma
 
 
 import sys
-from typing import IO, Optional
+from typing import IO, Callable, Dict, Optional
 import unified_planning
 
 
@@ -142,6 +142,76 @@ class Environment:
         """Sets the stream where the :class:`Engines <unified_planning.engines.Engine>` :func:`credits <unified_planning.engines.Engine.get_credits>` are printed."""
         self._credits_stream = new_credits_stream
 
+    def set_walkers_memoization(
+        self,
+        memoization_factory: Optional[
+            Callable[[], "unified_planning.model.walkers.Memoization"]
+        ],
+    ):
+        """
+        Sets the memoization policy of the walkers that live as long as this
+        `Environment`: the `TypeChecker`, the `Simplifier`, the `FreeVarsExtractor`,
+        the `FreeVarsOracle` and the `NamesExtractor`. The `Substituter` is not affected, because its
+        memoization is cleared after every substitution.
+
+        Example: ``env.set_walkers_memoization(lambda: LRUMemoization(10000))``
+        bounds every walker to `10000` memoized results.
+
+        :param memoization_factory: The function called to create the new
+            memoization of every walker; ``None`` restores the default unbounded
+            memoization.
+        """
+        for walker in self._memoized_walkers().values():
+            walker.set_memoization(
+                None if memoization_factory is None else memoization_factory()
+            )
+
+    def set_weak_interning(self, enabled: bool = True):
+        """
+        Enables or disables the weak interning of the expressions, so that the
+        expressions not referenced anymore by any live object (for example
+        by the problems that were discarded) are freed.
+
+        Enabling it also sets a :class:`~unified_planning.model.walkers.WeakMemoization`
+        to the walkers of this `Environment`, otherwise their memoization would
+        keep the expressions alive; disabling it restores the default memoization.
+
+        :param enabled: ``True`` to intern the expressions through weak references,
+            ``False`` to keep every created expression alive.
+        """
+        import unified_planning.model.walkers
+
+        self._expression_manager.weak_interning = enabled
+        self.set_walkers_memoization(
+            unified_planning.model.walkers.WeakMemoization if enabled else None
+        )
+
+    def walkers_memoization_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Returns, for every walker that lives as long as this `Environment`, the
+        number of memoization ``hits``, ``misses`` and the current ``size`` of
+        its memoization.
+        """
+        return {
+            name: {
+                "hits": walker.memoization_hits,
+                "misses": walker.memoization_misses,
+                "size": len(walker.memoization),
+            }
+            for name, walker in self._memoized_walkers().items()
+        }
+
+    def _memoized_walkers(
+        self,
+    ) -> Dict[str, "unified_planning.model.walkers.DagWalker"]:
+        return {
+            "type_checker": self._tc,
+            "simplifier": self._simplifier,
+            "free_vars_extractor": self._free_vars_extractor,
+            "free_vars_oracle": self._free_vars_oracle,
+            "names_extractor": self._names_extractor,
+        }
+
 
 GLOBAL_ENVIRONMENT: Optional[Environment] = None
 
@@ -1,5 +1,5 @@
 from unified_planning.io.pddl_reader import PDDLReader
-from unified_planning.io.pddl_writer import PDDLWriter
+from unified_planning.io.pddl_writer import PDDLWriter, PDDLDomainCache
 from unified_planning.io.anml_writer import ANMLWriter
 from unified_planning.io.anml_reader import ANMLReader
 from unified_planning.io.ma_pddl_writer import MAPDDLWriter
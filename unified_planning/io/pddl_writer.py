@@ -38,6 +38,7 @@ from unified_planning.exceptions import (
     UPTypeError,
     UPProblemDefinitionError,
     UPException,
+    UPUsageError,
 )
 from unified_planning.model.types import _UserType
 from unified_planning.plans import (
@@ -46,7 +47,20 @@ from unified_planning.plans import (
     Plan,
     ActionInstance,
 )
-from typing import Callable, Dict, IO, List, Optional, Set, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    IO,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+from collections import OrderedDict
 from io import StringIO
 from functools import reduce
 
@@ -323,6 +337,76 @@ class ConverterToPDDLString(walkers.DagWalker):
         return f"(= {args[0]} {args[1]})"
 
 
+# A domain stored in the PDDLDomainCache:
+# (domain without the header, names of the domain's items, domain objects)
+_CachedDomain = Tuple[str, Dict[Any, str], Dict[_UserType, Set[Object]]]
+
+
+class PDDLDomainCache:
+    """
+    This class stores the `PDDL` domains rendered by the :class:`~unified_planning.io.PDDLWriter`
+    instances that share it, so the domain shared by many problems is rendered only once.
+
+    A domain is reused by every problem that has the same environment, types, fluents, actions,
+    quality metrics and :class:`~unified_planning.model.ProblemKind`, and that is written with
+    the same flags; for those problems, the writer renders only the `PDDL` problem.
+    Together with the text of the domain, the cache stores the names chosen for the
+    domain's items, so the names of the objects of a problem are chosen avoiding those; this
+    means that, when a name collides, the names chosen might differ from the ones chosen by
+    a writer without cache, but they are always consistent between the domain and the problem.
+
+    :param max_size: The maximum number of domains kept; the least recently used ones are evicted.
+    """
+
+    def __init__(self, max_size: int = 8):
+        if max_size < 1:
+            raise UPUsageError("The max_size of a PDDLDomainCache must be positive.")
+        self.max_size = max_size
+        self._domains: "OrderedDict[Hashable, _CachedDomain]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def clear(self):
+        """Removes all the domains stored in this cache."""
+        self._domains.clear()
+
+    def _key(self, writer: "PDDLWriter") -> Hashable:
+        problem = writer.problem
+        return (
+            problem.environment,
+            tuple(problem.user_types),
+            tuple(problem.fluents),
+            tuple(problem.actions),
+            tuple(problem.quality_metrics),
+            writer.problem_kind,
+            writer.needs_requirements,
+            writer.rewrite_bool_assignments,
+        )
+
+    def _get(self, key: Hashable) -> Optional[_CachedDomain]:
+        entry = self._domains.get(key, None)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._domains.move_to_end(key)
+        return entry
+
+    def _store(
+        self,
+        key: Hashable,
+        domain_body: str,
+        renamings: Dict[Any, str],
+        domain_objects: Dict[_UserType, Set[Object]],
+    ):
+        self._domains[key] = (domain_body, renamings, domain_objects)
+        if len(self._domains) > self.max_size:
+            self._domains.popitem(last=False)
+
+
 class PDDLWriter:
     """
     This class can be used to write a :class:`~unified_planning.model.Problem` in `PDDL`.
@@ -330,6 +414,8 @@ class PDDLWriter:
     needs_requirements determines if the printed problem must have the :requirements,
     rewrite_bool_assignments determines if this writer will write
     non constant boolean assignment as conditional effects.
+    Optionally, the constructor takes a :class:`~unified_planning.io.PDDLDomainCache`;
+    if the domain of the problem is already in the cache, only the problem is rendered.
     """
 
     def __init__(
@@ -337,11 +423,15 @@ class PDDLWriter:
         problem: "up.model.Problem",
         needs_requirements: bool = True,
         rewrite_bool_assignments: bool = False,
+        domain_cache: Optional[PDDLDomainCache] = None,
     ):
         self.problem = problem
         self.problem_kind = self.problem.kind
         self.needs_requirements = needs_requirements
         self.rewrite_bool_assignments = rewrite_bool_assignments
+        self.domain_cache = domain_cache
+        # the domain without the header, rendered or taken from the domain_cache
+        self._domain_body: Optional[str] = None
         # otn represents the old to new renamings
         self.otn_renamings: Dict[
             Union[
@@ -378,14 +468,80 @@ class PDDLWriter:
             raise UPProblemDefinitionError(
                 "PDDL2.1 does not support timed effects or timed goals."
             )
-        obe = ObjectsExtractor()
         out.write("(define ")
         if self.problem.name is None:
             name = "pddl"
         else:
             name = _get_pddl_name(self.problem)
         out.write(f"(domain {name}-domain)\n")
+        if self.domain_cache is not None:
+            out.write(self._get_domain_body())
+        else:
+            self._write_domain_body(out)
 
+    def _get_domain_body(self) -> str:
+        """
+        Returns the domain without the header, taking it from the domain_cache when possible;
+        it must be called before any other name is mangled by this writer.
+        """
+        if self._domain_body is not None:
+            return self._domain_body
+        assert self.domain_cache is not None
+        key = self.domain_cache._key(self)
+        entry = self.domain_cache._get(key)
+        if entry is None:
+            assert len(self.otn_renamings) == 0
+            body = StringIO()
+            self._write_domain_body(body)
+            self._domain_body = body.getvalue()
+            assert self.domain_objects is not None
+            self.domain_cache._store(
+                key, self._domain_body, dict(self.otn_renamings), self.domain_objects
+            )
+        else:
+            self._domain_body, renamings, domain_objects = entry
+            # the cached names refer to the items of the problem that populated the
+            # cache, that are equal to the items of this problem
+            for item, new_name in renamings.items():
+                item = self._get_equal_item(item)
+                self.otn_renamings[item] = new_name
+                self.nto_renamings[new_name] = item
+            self.domain_objects = {
+                ut: {self.problem.object(o.name) for o in os}
+                for ut, os in domain_objects.items()
+            }
+        return self._domain_body
+
+    def _get_equal_item(
+        self,
+        item: Union[
+            "up.model.Type",
+            "up.model.Action",
+            "up.model.Fluent",
+            "up.model.Object",
+            "up.model.Parameter",
+            "up.model.Variable",
+        ],
+    ) -> Union[
+        "up.model.Type",
+        "up.model.Action",
+        "up.model.Fluent",
+        "up.model.Object",
+        "up.model.Parameter",
+        "up.model.Variable",
+    ]:
+        """Returns the item of this writer's problem that is equal to the given item."""
+        if isinstance(item, up.model.Fluent):
+            return self.problem.fluent(item.name)
+        elif isinstance(item, up.model.Action):
+            return self.problem.action(item.name)
+        elif isinstance(item, up.model.Object):
+            return self.problem.object(item.name)
+        # types, parameters and variables are not owned by the problem
+        return item
+
+    def _write_domain_body(self, out: IO[str]):
+        obe = ObjectsExtractor()
         if self.needs_requirements:
             out.write(" (:requirements :strips")
             if self.problem_kind.has_flat_typing():
@@ -646,6 +802,9 @@ class PDDLWriter:
             name = _get_pddl_name(self.problem)
         out.write(f"(define (problem {name}-problem)\n")
         out.write(f" (:domain {name}-domain)\n")
+        if self.domain_cache is not None:
+            # the names of the domain are chosen before the names of the objects
+            self._get_domain_body()
         if self.domain_objects is None:
             # This method populates the self._domain_objects map
             self._populate_domain_objects(ObjectsExtractor())
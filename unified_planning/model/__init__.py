@@ -38,7 +38,7 @@ from unified_planning.model.problem import Problem
 from unified_planning.model.contingent_problem import ContingentProblem
 from unified_planning.model.delta_stn import DeltaSimpleTemporalNetwork
 from unified_planning.model.problem_kind import ProblemKind
-from unified_planning.model.state import State, UPState
+from unified_planning.model.state import State, UPState, CompactState
 from unified_planning.model.timing import (
     Timepoint,
     TimepointKind,
@@ -101,6 +101,7 @@ __all__ = [
     "ProblemKind",
     "State",
     "UPState",
+    "CompactState",
     "Timepoint",
     "TimepointKind",
     "Timing",
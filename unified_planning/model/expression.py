@@ -27,8 +27,19 @@ from unified_planning.exceptions import (
     UPExpressionDefinitionError,
     UPValueError,
 )
+import weakref
 from fractions import Fraction
-from typing import Optional, Iterable, List, Union, Dict, Tuple, Iterator, Sequence
+from typing import (
+    Optional,
+    Iterable,
+    List,
+    Union,
+    Dict,
+    Tuple,
+    Iterator,
+    Sequence,
+    MutableMapping,
+)
 
 BoolExpression = Union[
     "up.model.fnode.FNode",
@@ -72,12 +83,137 @@ def uniform_numeric_constant(value: NumericConstant) -> Union[Fraction, int]:
     return number
 
 
+class TrustedExpressionBuilder:
+    """
+    Fast-path constructors of the :class:`ExpressionManager`, available as its
+    ``trusted`` attribute.
+
+    They are meant for the code that builds expressions in tight loops from
+    values that are already ``FNode`` of the right ``Environment``, like compilers
+    and simulators: the arguments are not promoted nor checked, and the type
+    checking of every created expression is deferred to the first access to its
+    ``type``, that raises the usual ``UPTypeError`` if the expression is not
+    well-formed. Since the expressions are shared, an ill-formed expression
+    created here is returned as it is also by the checked constructors.
+
+    The n-ary constructors take a single ``Sequence`` of arguments and, like the
+    ones of the ``ExpressionManager``, return the neutral element or the only
+    argument when less than two arguments are given.
+    """
+
+    def __init__(self, manager: "ExpressionManager"):
+        self._manager = manager
+        self._create_node = manager.create_node
+
+    def create_nodes(
+        self,
+        node_type: OperatorKind,
+        args_list: Iterable[Tuple["up.model.fnode.FNode", ...]],
+        payload=None,
+    ) -> List["up.model.fnode.FNode"]:
+        """
+        Creates one expression of the given ``node_type`` and ``payload`` for every
+        tuple of arguments in ``args_list``.
+
+        :param node_type: The ``OperatorKind`` of all the created expressions.
+        :param args_list: The arguments of every expression to create.
+        :param payload: The payload shared by all the created expressions.
+        :return: The created expressions, in the same order of ``args_list``.
+        """
+        create_node = self._create_node
+        return [create_node(node_type, args, payload, False) for args in args_list]
+
+    def And(self, args: Sequence["up.model.fnode.FNode"]) -> "up.model.fnode.FNode":
+        """Returns the conjunction of the given ``args``."""
+        if len(args) > 1:
+            return self._create_node(OperatorKind.AND, tuple(args), None, False)
+        return args[0] if args else self._manager.true_expression
+
+    def Or(self, args: Sequence["up.model.fnode.FNode"]) -> "up.model.fnode.FNode":
+        """Returns the disjunction of the given ``args``."""
+        if len(args) > 1:
+            return self._create_node(OperatorKind.OR, tuple(args), None, False)
+        return args[0] if args else self._manager.false_expression
+
+    def Plus(self, args: Sequence["up.model.fnode.FNode"]) -> "up.model.fnode.FNode":
+        """Returns the sum of the given ``args``."""
+        if len(args) > 1:
+            return self._create_node(OperatorKind.PLUS, tuple(args), None, False)
+        return args[0] if args else self._manager.Int(0)
+
+    def Times(self, args: Sequence["up.model.fnode.FNode"]) -> "up.model.fnode.FNode":
+        """Returns the product of the given ``args``."""
+        if len(args) > 1:
+            return self._create_node(OperatorKind.TIMES, tuple(args), None, False)
+        return args[0] if args else self._manager.Int(1)
+
+    def Not(self, arg: "up.model.fnode.FNode") -> "up.model.fnode.FNode":
+        """Returns the negation of ``arg``, removing double negations."""
+        if arg.node_type == OperatorKind.NOT:
+            return arg.arg(0)
+        return self._create_node(OperatorKind.NOT, (arg,), None, False)
+
+    def Implies(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left -> right``."""
+        return self._create_node(OperatorKind.IMPLIES, (left, right), None, False)
+
+    def Iff(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left <-> right``."""
+        return self._create_node(OperatorKind.IFF, (left, right), None, False)
+
+    def Equals(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left == right``."""
+        return self._create_node(OperatorKind.EQUALS, (left, right), None, False)
+
+    def LE(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left <= right``."""
+        return self._create_node(OperatorKind.LE, (left, right), None, False)
+
+    def LT(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left < right``."""
+        return self._create_node(OperatorKind.LT, (left, right), None, False)
+
+    def Minus(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left - right``."""
+        return self._create_node(OperatorKind.MINUS, (left, right), None, False)
+
+    def Div(
+        self, left: "up.model.fnode.FNode", right: "up.model.fnode.FNode"
+    ) -> "up.model.fnode.FNode":
+        """Returns ``left / right``."""
+        return self._create_node(OperatorKind.DIV, (left, right), None, False)
+
+    def FluentExp(
+        self,
+        fluent: "up.model.fluent.Fluent",
+        args: Sequence["up.model.fnode.FNode"] = tuple(),
+    ) -> "up.model.fnode.FNode":
+        """Returns the expression of ``fluent`` applied to ``args``."""
+        if fluent.arity != len(args):
+            raise UPExpressionDefinitionError(
+                f"In FluentExp, fluent: {fluent.name} has arity {fluent.arity} but {len(args)} parameters were passed."
+            )
+        return self._create_node(OperatorKind.FLUENT_EXP, tuple(args), fluent, False)
+
+
 class ExpressionManager(object):
     """ExpressionManager is responsible for the creation of all expressions."""
 
     def __init__(self, environment: "up.environment.Environment"):
         self.environment = environment
-        self.expressions: Dict[
+        self.expressions: MutableMapping[
             "up.model.fnode.FNodeContent", "up.model.fnode.FNode"
         ] = {}
         self._next_free_id = 1
@@ -88,8 +224,45 @@ class ExpressionManager(object):
         self.false_expression = self.create_node(
             node_type=OperatorKind.BOOL_CONSTANT, args=tuple(), payload=False
         )
+        self.trusted = TrustedExpressionBuilder(self)
         return
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # WeakValueDictionaries are not picklable
+        state["expressions"] = dict(self.expressions)
+        state["_weak_interning"] = self.weak_interning
+        return state
+
+    def __setstate__(self, state):
+        weak_interning = state.pop("_weak_interning")
+        self.__dict__.update(state)
+        self.weak_interning = weak_interning
+
+    @property
+    def weak_interning(self) -> bool:
+        """
+        Returns ``True`` if the expressions are interned through weak references.
+
+        By default, every expression created is kept alive by this
+        `ExpressionManager` for the whole life of the `Environment`. With weak
+        interning, an expression is freed as soon as nothing else references it;
+        while it is alive, creating an equivalent expression still returns the
+        same object, and the ids of new expressions are never reused.
+
+        Note that the walkers of the `Environment` keep alive the expressions
+        they memoized; see :func:`Environment.set_weak_interning <unified_planning.environment.Environment.set_weak_interning>`.
+        """
+        return isinstance(self.expressions, weakref.WeakValueDictionary)
+
+    @weak_interning.setter
+    def weak_interning(self, enabled: bool):
+        """Sets the interning of the expressions to use weak references or not."""
+        if enabled and not self.weak_interning:
+            self.expressions = weakref.WeakValueDictionary(self.expressions)
+        elif not enabled and self.weak_interning:
+            self.expressions = dict(self.expressions)
+
     def _polymorph_args_to_iterator(
         self, *args: Union[Expression, Iterable[Expression]]
     ) -> Iterator[Expression]:
@@ -118,8 +291,16 @@ class ExpressionManager(object):
         :return: The resulting list of FNode.
         """
         res = []
+        FNode = up.model.fnode.FNode
         for e in self._polymorph_args_to_iterator(*args):
-            if isinstance(e, up.model.fluent.Fluent):
+            if isinstance(e, FNode):
+                # most of the arguments are already expressions, so they are
+                # checked before all the other promotable classes
+                assert (
+                    e.environment == self.environment
+                ), "Expression has a different environment of the expression manager"
+                res.append(e)
+            elif isinstance(e, up.model.fluent.Fluent):
                 assert (
                     e.environment == self.environment
                 ), "Fluent has a different environment of the expression manager"
@@ -182,6 +363,7 @@ class ExpressionManager(object):
                 Tuple["up.model.variable.Variable", ...],
             ]
         ] = None,
+        check: bool = True,
     ) -> "up.model.fnode.FNode":
         """
         Creates the unified_planning expressions if it hasn't been created yet in the environment. Otherwise
@@ -191,6 +373,8 @@ class ExpressionManager(object):
         :param args: The direct sons in this expression tree; a tuple of expressions.
         :param payload: In some OperationKind contains the information about the expression; for an INT_EXP
             contains the integer, for a FLUENT_EXP the fluent etc.
+        :param check: If ``False``, the ``args`` are trusted to belong to this ``Environment`` and the type
+            checking of the created expression is deferred to the first access to its ``type``.
         :return: The created expression.
         """
         content = up.model.fnode.FNodeContent(node_type, args, payload)
@@ -198,13 +382,14 @@ class ExpressionManager(object):
         if res is not None:
             return res
         else:
-            assert all(
+            assert not check or all(
                 a.environment == self.environment for a in args
             ), "2 FNode in the same expression have different environments"
             n = up.model.fnode.FNode(content, self._next_free_id, self.environment)
             self._next_free_id += 1
             self.expressions[content] = n
-            self.environment.type_checker.get_type(n)
+            if check:
+                self.environment.type_checker.get_type(n)
             return n
 
     def And(
@@ -37,7 +37,7 @@ class FNode(object):
     be instantiated or modified by the user.
     """
 
-    __slots__ = ["_content", "_node_id", "_env"]
+    __slots__ = ["_content", "_node_id", "_env", "__weakref__"]
 
     def __init__(self, content: FNodeContent, node_id: int, environment: Environment):
         self._content = content
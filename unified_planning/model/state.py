@@ -14,8 +14,11 @@
 #
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from fractions import Fraction
+from typing import Any, Dict, List, Optional, Tuple
 import unified_planning as up
+from unified_planning.model.fluent import get_all_fluent_exp
+from unified_planning.model.operators import OperatorKind
 from unified_planning.exceptions import UPUsageError, UPValueError
 
 
@@ -120,3 +123,231 @@ class UPState(State):
             return UPState(complete_values)
         # Otherwise just return a new UPState with self as ancestor
         return UPState(updated_values, self)
+
+
+class GroundFluentsIndex:
+    """
+    This class assigns a fixed position to every grounded fluent instance of a
+    :class:`~unified_planning.model.Problem`; it is the shared layout of all the
+    :class:`~unified_planning.model.CompactState` created from it.
+
+    Boolean fluent instances are mapped to a bit position, while all the other
+    fluent instances (numeric and object fluents) are mapped to a slot that
+    contains the raw constant value (an `int`, a `Fraction` or an `Object`).
+    """
+
+    def __init__(self, problem: "up.model.Problem"):
+        self._environment = problem.environment
+        self._bool_index: Dict["up.model.FNode", int] = {}
+        self._value_index: Dict["up.model.FNode", int] = {}
+        for f in problem.fluents:
+            if f.type.is_bool_type():
+                index = self._bool_index
+            else:
+                index = self._value_index
+            for f_exp in get_all_fluent_exp(problem, f):
+                index[f_exp] = len(index)
+        self._bytes_size = (len(self._bool_index) + 7) // 8
+
+    @property
+    def environment(self) -> "up.environment.Environment":
+        """Returns the `Environment` of the indexed fluents."""
+        return self._environment
+
+    @property
+    def bool_fluents(self) -> Dict["up.model.FNode", int]:
+        """Returns the map from every boolean fluent instance to its bit position."""
+        return self._bool_index
+
+    @property
+    def value_fluents(self) -> Dict["up.model.FNode", int]:
+        """Returns the map from every non-boolean fluent instance to its slot."""
+        return self._value_index
+
+    def payload_to_fnode(self, payload: Any) -> "up.model.FNode":
+        """
+        Returns the constant expression corresponding to the raw value stored in a
+        slot of a `CompactState`.
+
+        :param payload: The raw value; an `int`, a `Fraction` or an `Object`.
+        :return: The constant `FNode` with the given payload.
+        """
+        em = self._environment.expression_manager
+        if type(payload) is int:
+            node_type = OperatorKind.INT_CONSTANT
+        elif type(payload) is Fraction:
+            node_type = OperatorKind.REAL_CONSTANT
+        else:
+            node_type = OperatorKind.OBJECT_EXP
+        return em.create_node(node_type=node_type, args=tuple(), payload=payload)
+
+    def create_state(
+        self, values: Dict["up.model.FNode", "up.model.FNode"]
+    ) -> "CompactState":
+        """
+        Creates a new `CompactState` with the given values; every fluent instance
+        indexed by this class must have a value in the given map.
+
+        :param values: The map from every grounded fluent to its value.
+        :return: The created `CompactState`.
+        """
+        bits = bytearray(self._bytes_size)
+        slots: List[Any] = [None] * len(self._value_index)
+        for f_exp, pos in self._bool_index.items():
+            value = values.get(f_exp, None)
+            if value is None:
+                raise UPUsageError(
+                    f"The given values do not contain a value for {f_exp}"
+                )
+            if value.bool_constant_value():
+                bits[pos >> 3] |= 1 << (pos & 7)
+        for f_exp, pos in self._value_index.items():
+            value = values.get(f_exp, None)
+            if value is None:
+                raise UPUsageError(
+                    f"The given values do not contain a value for {f_exp}"
+                )
+            slots[pos] = value.constant_value()
+        return CompactState(self, bytes(bits), tuple(slots))
+
+
+class CompactState(State):
+    """
+    Array-backed implementation of the `State` interface.
+
+    The layout of the state is defined by a :class:`~unified_planning.model.state.GroundFluentsIndex`:
+    boolean values are packed in a `bytes` object (one bit per fluent instance) and every
+    other value is stored as a raw constant in a `tuple`. Lookups are `O(1)` and children
+    share the storage of their parent that is not modified by the update.
+
+    `CompactStates` are hashable and 2 of them are equal if they are defined on
+    the same index and they assign the same values to all the fluent instances.
+    """
+
+    __slots__ = ["_index", "_bits", "_slots", "_hash"]
+
+    def __init__(
+        self,
+        index: GroundFluentsIndex,
+        bits: bytes,
+        slots: Tuple[Any, ...],
+    ):
+        """
+        Creates a new `CompactState`. This constructor is for internal use only,
+        use :func:`GroundFluentsIndex.create_state <unified_planning.model.state.GroundFluentsIndex.create_state>` instead.
+        """
+        self._index = index
+        self._bits = bits
+        self._slots = slots
+        self._hash: Optional[int] = None
+
+    def __repr__(self) -> str:
+        mappings = {f: self.get_value(f) for f in self._index.bool_fluents}
+        mappings.update((f, self.get_value(f)) for f in self._index.value_fluents)
+        return str(mappings)
+
+    def __eq__(self, oth: object) -> bool:
+        if not isinstance(oth, CompactState):
+            return False
+        return (
+            self._index is oth._index
+            and self._bits == oth._bits
+            and self._slots == oth._slots
+        )
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self._bits, self._slots))
+        return self._hash
+
+    @property
+    def index(self) -> GroundFluentsIndex:
+        """Returns the `GroundFluentsIndex` defining the layout of this state."""
+        return self._index
+
+    def get_value(self, fluent: "up.model.FNode") -> "up.model.FNode":
+        """
+        This method retrieves the value of the given fluent in the `State`.
+        NOTE that the searched fluent must be indexed by the state's `GroundFluentsIndex`,
+        otherwise an exception is raised.
+
+        :params fluent: The fluent searched for in the `CompactState`.
+        :return: The value set for the given fluent.
+        """
+        index = self._index
+        pos = index._bool_index.get(fluent, None)
+        if pos is not None:
+            em = index._environment.expression_manager
+            if self._bits[pos >> 3] & (1 << (pos & 7)):
+                return em.true_expression
+            return em.false_expression
+        pos = index._value_index.get(fluent, None)
+        if pos is None:
+            raise UPUsageError(
+                f"The state {self} does not have a value for the value {fluent}"
+            )
+        return index.payload_to_fnode(self._slots[pos])
+
+    def make_child(
+        self,
+        updated_values: Dict["up.model.FNode", "up.model.FNode"],
+    ) -> "CompactState":
+        """
+        Returns a different `CompactState` in which every value in updated_values.keys() is evaluated as his mapping
+        in new the `updated_values` dict and every other value is evaluated as in `self`.
+
+        :param updated_values: The dictionary that contains the `values` that need to be updated in the new `CompactState`.
+        :return: The new `CompactState` created.
+        """
+        index = self._index
+        bits: Optional[bytearray] = None
+        slots: Optional[List[Any]] = None
+        for f, v in updated_values.items():
+            pos = index._bool_index.get(f, None)
+            if pos is not None:
+                if bits is None:
+                    bits = bytearray(self._bits)
+                if v.bool_constant_value():
+                    bits[pos >> 3] |= 1 << (pos & 7)
+                else:
+                    bits[pos >> 3] &= ~(1 << (pos & 7))
+                continue
+            pos = index._value_index.get(f, None)
+            if pos is None:
+                raise UPUsageError(
+                    f"The fluent {f} is not indexed in the state's GroundFluentsIndex"
+                )
+            if slots is None:
+                slots = list(self._slots)
+            slots[pos] = v.constant_value()
+        return CompactState(
+            index,
+            self._bits if bits is None else bytes(bits),
+            self._slots if slots is None else tuple(slots),
+        )
+
+    def _make_child_from_positions(
+        self,
+        bool_values: Dict[int, bool],
+        slot_values: Dict[int, Any],
+    ) -> "CompactState":
+        """
+        Same as :func:`make_child <unified_planning.model.CompactState.make_child>`, but the updated
+        values are given with their positions in the state's `GroundFluentsIndex` and
+        their raw values. For internal use only.
+        """
+        bits, slots = self._bits, self._slots
+        if bool_values:
+            new_bits = bytearray(bits)
+            for pos, value in bool_values.items():
+                if value:
+                    new_bits[pos >> 3] |= 1 << (pos & 7)
+                else:
+                    new_bits[pos >> 3] &= ~(1 << (pos & 7))
+            bits = bytes(new_bits)
+        if slot_values:
+            new_slots = list(slots)
+            for pos, value in slot_values.items():
+                new_slots[pos] = value
+            slots = tuple(new_slots)
+        return CompactState(self._index, bits, slots)
@@ -74,6 +74,10 @@ class _BoolType(Type):
         """Returns true iff is boolean type."""
         return True
 
+    def __reduce__(self):
+        # the type checker compares the types with the BOOL singleton
+        return "BOOL"
+
 
 class _TimeType(Type):
     """Represent the type for an absolute Time"""
@@ -85,6 +89,9 @@ class _TimeType(Type):
         """Returns true iff is boolean type."""
         return True
 
+    def __reduce__(self):
+        return "TIME"
+
 
 class _UserType(Type):
     """Represents the user type."""
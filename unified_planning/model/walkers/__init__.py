@@ -14,6 +14,12 @@
 #
 
 from unified_planning.model.walkers.dag import DagWalker
+from unified_planning.model.walkers.memoization import (
+    Memoization,
+    LRUMemoization,
+    SizeCappedMemoization,
+    WeakMemoization,
+)
 from unified_planning.model.walkers.generic import handles
 from unified_planning.model.walkers.dnf import Dnf, Nnf
 from unified_planning.model.walkers.expression_quantifiers_remover import (
@@ -24,7 +30,10 @@ from unified_planning.model.walkers.linear_checker import LinearChecker
 from unified_planning.model.walkers.operators_extractor import OperatorsExtractor
 from unified_planning.model.walkers.quantifier_simplifier import QuantifierSimplifier
 from unified_planning.model.walkers.simplifier import Simplifier
-from unified_planning.model.walkers.state_evaluator import StateEvaluator
+from unified_planning.model.walkers.state_evaluator import (
+    StateEvaluator,
+    CompiledStateEvaluator,
+)
 from unified_planning.model.walkers.substituter import Substituter
 from unified_planning.model.walkers.type_checker import TypeChecker
 from unified_planning.model.walkers.free_vars import FreeVarsExtractor
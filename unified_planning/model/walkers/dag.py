@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Dict, Optional, Union
 from unified_planning.model.walkers.generic import Walker
+from unified_planning.model.walkers.memoization import Memoization
 from unified_planning.model.fnode import FNode
 
 
@@ -27,19 +29,47 @@ class DagWalker(Walker):
     :func _get_key needs to be defined if additional arguments via
     keywords need to be shared. This function should return the key to
     be used in memoization. See substituter for an example.
+    The memoization policy can be changed with :func:`set_memoization`, to
+    bound the memory used by walkers that live as long as the `Environment`.
     """
 
-    def __init__(self, invalidate_memoization=False):
+    def __init__(
+        self,
+        invalidate_memoization=False,
+        memoization: Optional[Memoization] = None,
+    ):
         """The flag ``invalidate_memoization`` can be used to clear the cache
         after the walk has been completed: the cache is one-time use.
+        The optional ``memoization`` defines the memoization policy; by
+        default every result is kept in a plain `dict`.
         """
         Walker.__init__(self)
 
-        self.memoization = {}
+        self.memoization: Union[Dict, Memoization] = {}
         self.invalidate_memoization = invalidate_memoization
         self.stack = []
+        self.memoization_hits = 0
+        self.memoization_misses = 0
+        self._walks_in_progress = 0
+        if memoization is not None:
+            self.set_memoization(memoization)
         return
 
+    def set_memoization(self, memoization: Optional[Memoization]):
+        """
+        Replaces the memoization of this walker with the given one, discarding
+        all the results memoized so far.
+
+        :param memoization: The new memoization policy, ``None`` restores the
+            default unbounded memoization.
+        """
+        self.memoization = {} if memoization is None else memoization
+
+    def reset_memoization_stats(self):
+        """Resets the ``memoization_hits`` and ``memoization_misses`` counters."""
+        self.memoization_hits = 0
+        self.memoization_misses = 0
+
     def _get_children(self, expression: FNode):
         return expression.args
 
@@ -50,7 +80,10 @@ class DagWalker(Walker):
             # Add only if not memoized already
             key = self._get_key(s, **kwargs)
             if key not in self.memoization:
+                self.memoization_misses += 1
                 self.stack.append((False, s))
+            else:
+                self.memoization_hits += 1
 
     def _compute_node_result(self, expression: FNode, **kwargs):
         """Apply function to the node and memoize the result.
@@ -96,12 +129,23 @@ class DagWalker(Walker):
 
     def walk(self, expression: FNode, **kwargs):
         if expression in self.memoization:
+            self.memoization_hits += 1
             return self.memoization[expression]
-
-        res = self.iter_walk(expression, **kwargs)
-
-        if self.invalidate_memoization:
-            self.memoization.clear()
+        self.memoization_misses += 1
+
+        # the memoization is trimmed only when the outermost walk is completed,
+        # because the results of the children are read back during the walk
+        self._walks_in_progress += 1
+        try:
+            res = self.iter_walk(expression, **kwargs)
+        finally:
+            self._walks_in_progress -= 1
+
+        if self._walks_in_progress == 0:
+            if self.invalidate_memoization:
+                self.memoization.clear()
+            elif isinstance(self.memoization, Memoization):
+                self.memoization.trim()
         return res
 
     def _get_key(self, expression: FNode, **kwargs):
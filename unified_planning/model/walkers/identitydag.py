@@ -35,21 +35,24 @@ class IdentityDagWalker(walkers.dag.DagWalker):
         walkers.dag.DagWalker.__init__(self, invalidate_memoization)
         self.environment = environment
         self.manager = environment.expression_manager
+        # the rebuilt expressions have the same structure of well-formed ones,
+        # so the arguments don't need to be promoted nor checked again
+        self.trusted = self.manager.trusted
 
     def walk_and(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.And(args)
+        return self.trusted.And(args)
 
     def walk_or(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Or(args)
+        return self.trusted.Or(args)
 
     def walk_not(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Not(args[0])
+        return self.trusted.Not(args[0])
 
     def walk_implies(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Implies(args[0], args[1])
+        return self.trusted.Implies(args[0], args[1])
 
     def walk_iff(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Iff(args[0], args[1])
+        return self.trusted.Iff(args[0], args[1])
 
     def walk_exists(self, expression: FNode, args: List[FNode], **kwargs) -> FNode:
         return self.manager.Exists(args[0], *expression.variables())
@@ -58,28 +61,28 @@ class IdentityDagWalker(walkers.dag.DagWalker):
         return self.manager.Forall(args[0], *expression.variables())
 
     def walk_equals(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Equals(args[0], args[1])
+        return self.trusted.Equals(args[0], args[1])
 
     def walk_le(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.LE(args[0], args[1])
+        return self.trusted.LE(args[0], args[1])
 
     def walk_lt(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.LT(args[0], args[1])
+        return self.trusted.LT(args[0], args[1])
 
     def walk_plus(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Plus(args)
+        return self.trusted.Plus(args)
 
     def walk_times(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Times(args)
+        return self.trusted.Times(args)
 
     def walk_minus(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Minus(args[0], args[1])
+        return self.trusted.Minus(args[0], args[1])
 
     def walk_div(self, expression: FNode, args: List[FNode], **kwargs):
-        return self.manager.Div(args[0], args[1])
+        return self.trusted.Div(args[0], args[1])
 
     def walk_fluent_exp(self, expression: FNode, args: List[FNode], **kwargs) -> FNode:
-        return self.manager.FluentExp(expression.fluent(), tuple(args))
+        return self.trusted.FluentExp(expression.fluent(), args)
 
     def walk_dot(self, expression: FNode, args: List[FNode], **kwargs) -> FNode:
         return self.manager.Dot(expression.agent(), args[0])
@@ -0,0 +1,176 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+This module defines the memoization policies that can be plugged into a
+:class:`~unified_planning.model.walkers.DagWalker`.
+
+By default a `DagWalker` memoizes the result of every expression it walks in a
+plain `dict`, that grows for the whole life of the walker. The policies defined
+here bound that memory; the `DagWalker` calls their `trim` method every time
+an outermost walk is completed, so the results needed during a walk are never
+evicted while the walk is in progress.
+"""
+
+import weakref
+from itertools import islice
+from typing import Any, Hashable, Iterator
+from unified_planning.exceptions import UPValueError
+from unified_planning.model.fnode import FNode
+
+
+class Memoization(dict):
+    """
+    Base class of the memoization policies of the `DagWalker`.
+
+    A `Memoization` is a `dict` from the memoization keys to the walker results;
+    the only difference is the `trim` method, that is called by the walker
+    after every outermost walk and that must bring the memoization back within
+    the bounds defined by the policy.
+    Since a memoization is just a cache, its pickled copies are always empty.
+    """
+
+    def trim(self):
+        """Evicts the entries exceeding the bounds of this policy."""
+        pass
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+class LRUMemoization(Memoization):
+    """
+    Memoization that keeps at most `max_size` entries after every walk,
+    evicting the least recently used ones.
+
+    :param max_size: The maximum number of entries kept between two walks.
+    """
+
+    def __init__(self, max_size: int):
+        Memoization.__init__(self)
+        if max_size < 0:
+            raise UPValueError("The max_size of a memoization can't be negative.")
+        self.max_size = max_size
+
+    def __getitem__(self, key: Hashable) -> Any:
+        # dicts keep the insertion order, so re-inserting the accessed key
+        # moves it to the end and the first keys are the least recently used
+        value = dict.pop(self, key)
+        dict.__setitem__(self, key, value)
+        return value
+
+    def trim(self):
+        excess = len(self) - self.max_size
+        if excess > 0:
+            for key in list(islice(iter(self), excess)):
+                dict.__delitem__(self, key)
+
+    def __reduce__(self):
+        return (self.__class__, (self.max_size,))
+
+
+class SizeCappedMemoization(Memoization):
+    """
+    Memoization that is completely cleared when it exceeds `max_size` entries
+    at the end of a walk.
+
+    This is cheaper than the :class:`LRUMemoization`, because accessing an
+    entry does not update any recency information.
+
+    :param max_size: The maximum number of entries kept between two walks.
+    """
+
+    def __init__(self, max_size: int):
+        Memoization.__init__(self)
+        if max_size < 0:
+            raise UPValueError("The max_size of a memoization can't be negative.")
+        self.max_size = max_size
+
+    def trim(self):
+        if len(self) > self.max_size:
+            self.clear()
+
+    def __reduce__(self):
+        return (self.__class__, (self.max_size,))
+
+
+class _KeyItself:
+    """Marker stored in place of a result that is the key itself."""
+
+    pass
+
+
+_KEY_ITSELF = _KeyItself()
+
+
+class WeakMemoization(Memoization):
+    """
+    Memoization that holds the `FNode` keys through weak references, so an
+    entry disappears as soon as its expression is not referenced anywhere else.
+
+    Results that would keep their own key alive (a set containing the key, like
+    the free variables of a fluent expression) and keys that are not an `FNode`
+    (for example the keys built by walkers that define a custom `_get_key`) are
+    kept only until the end of the walk.
+    """
+
+    def __init__(self):
+        Memoization.__init__(self)
+        self._weak: "weakref.WeakKeyDictionary[FNode, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __contains__(self, key: object) -> bool:
+        if isinstance(key, FNode) and key in self._weak:
+            return True
+        return dict.__contains__(self, key)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        if isinstance(key, FNode):
+            try:
+                value = self._weak[key]
+            except KeyError:
+                return dict.__getitem__(self, key)
+            # results equal to the key are not stored, otherwise the value
+            # would keep the key alive
+            return key if value is _KEY_ITSELF else value
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        if not isinstance(key, FNode) or (
+            isinstance(value, (set, frozenset)) and key in value
+        ):
+            dict.__setitem__(self, key, value)
+        else:
+            self._weak[key] = _KEY_ITSELF if value is key else value
+
+    def __delitem__(self, key: Hashable):
+        if isinstance(key, FNode) and key in self._weak:
+            del self._weak[key]
+        else:
+            dict.__delitem__(self, key)
+
+    def __len__(self) -> int:
+        return len(self._weak) + dict.__len__(self)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        yield from list(self._weak.keys())
+        yield from list(dict.keys(self))
+
+    def clear(self):
+        self._weak.clear()
+        dict.clear(self)
+
+    def trim(self):
+        dict.clear(self)
@@ -14,11 +14,19 @@
 #
 
 
-from typing import Dict, List, Optional
+from fractions import Fraction
+from typing import Any, Callable, Dict, List, Optional, Union
 import unified_planning as up
+import unified_planning.model.walkers as walkers
 from unified_planning.model.fnode import FNode
 from unified_planning.model.expression import Expression
-from unified_planning.exceptions import UPProblemDefinitionError
+from unified_planning.model.fluent import get_all_fluent_exp
+from unified_planning.model.operators import OperatorKind
+from unified_planning.exceptions import UPProblemDefinitionError, UPUsageError
+from unified_planning.model.walkers.dag import DagWalker
+from unified_planning.model.walkers.expression_quantifiers_remover import (
+    ExpressionQuantifiersRemover,
+)
 from unified_planning.model.walkers.quantifier_simplifier import QuantifierSimplifier
 
 
@@ -81,3 +89,234 @@ class StateEvaluator(QuantifierSimplifier):
         raise UPProblemDefinitionError(
             f"The StateEvaluator.evaluate should only be called on grounded expressions."
         )
+
+
+# A compiled expression takes a CompactState and returns the raw constant value
+# of the expression in the state (a bool, an int, a Fraction or an Object).
+CompiledExpression = Callable[["up.model.state.CompactState"], Any]
+
+
+class CompiledStateEvaluator(DagWalker):
+    """
+    Compiles grounded expressions into `Python` closures that evaluate the expression
+    directly on the storage of a :class:`~unified_planning.model.CompactState`.
+
+    The compiled closures have the same semantic of the :class:`~unified_planning.model.walkers.StateEvaluator`,
+    but they do not create any `FNode` during the evaluation; the result of a closure
+    is the raw value of the expression (the ``constant_value`` of the `FNode` the
+    `StateEvaluator` would return).
+
+    Quantifiers are expanded at compilation time using the objects of the
+    :class:`~unified_planning.model.Problem` given at construction time, so the
+    `Problem` can not be modified after the creation of this class.
+    """
+
+    def __init__(
+        self,
+        problem: "up.model.problem.Problem",
+        fluents_index: "up.model.state.GroundFluentsIndex",
+    ):
+        DagWalker.__init__(self)
+        self._problem = problem
+        self._index = fluents_index
+        self._quantifiers_remover = ExpressionQuantifiersRemover(problem.environment)
+
+    def compile(self, expression: "FNode") -> CompiledExpression:
+        """
+        Returns the closure evaluating the given grounded expression.
+
+        :param expression: The grounded expression to compile.
+        :return: The closure that takes a `CompactState` created by the `GroundFluentsIndex`
+            given at construction time and returns the value of the expression in that state.
+        :raises NotImplementedError: If the expression contains operators that can't
+            be evaluated in a state, like parameters or temporal operators.
+        """
+        if expression not in self.memoization:
+            expression = self._quantifiers_remover.remove_quantifiers(
+                expression, self._problem
+            )
+        return self.walk(expression)
+
+    @walkers.handles(
+        OperatorKind.BOOL_CONSTANT,
+        OperatorKind.INT_CONSTANT,
+        OperatorKind.REAL_CONSTANT,
+        OperatorKind.OBJECT_EXP,
+    )
+    def walk_constant(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        value = expression.constant_value()
+        return lambda state: value
+
+    def walk_fluent_exp(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        if all(a.is_constant() for a in expression.args):
+            return self._compile_fluent_lookup(expression)
+        position = self.compile_fluent_position(expression)
+        if expression.fluent().type.is_bool_type():
+
+            def evaluate_bool_fluent(state):
+                pos = position(state)
+                return state._bits[pos >> 3] & (1 << (pos & 7)) != 0
+
+            return evaluate_bool_fluent
+        return lambda state: state._slots[position(state)]
+
+    def compile_fluent_position(
+        self, fluent_exp: "FNode"
+    ) -> Callable[["up.model.state.CompactState"], int]:
+        """
+        Returns the closure computing the position, in the `GroundFluentsIndex` given at
+        construction time, of the given fluent expression; the position is the bit position
+        for boolean fluents and the slot for all the other fluents.
+
+        :param fluent_exp: The grounded fluent expression; the arguments can be non-constant
+            expressions, in which case they are evaluated in the state.
+        :return: The closure that takes a `CompactState` and returns the position of the fluent.
+        """
+        assert fluent_exp.is_fluent_exp()
+        if fluent_exp.fluent().type.is_bool_type():
+            index = self._index.bool_fluents
+        else:
+            index = self._index.value_fluents
+        if all(a.is_constant() for a in fluent_exp.args):
+            pos = index.get(fluent_exp, None)
+            if pos is not None:
+                return lambda state: pos
+        positions: Dict[tuple, int] = {}
+        for f_exp in get_all_fluent_exp(self._problem, fluent_exp.fluent()):
+            f_pos = index.get(f_exp, None)
+            if f_pos is not None:
+                positions[tuple(a.constant_value() for a in f_exp.args)] = f_pos
+        args = [self.compile(a) for a in fluent_exp.args]
+
+        def evaluate_position(state):
+            key = tuple(a(state) for a in args)
+            pos = positions.get(key, None)
+            if pos is None:
+                raise UPUsageError(
+                    f"The state {state} does not have a value for the value {fluent_exp.fluent().name}{key}"
+                )
+            return pos
+
+        return evaluate_position
+
+    def _compile_fluent_lookup(self, fluent_exp: "FNode") -> CompiledExpression:
+        pos = self._index.bool_fluents.get(fluent_exp, None)
+        if pos is not None:
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            return lambda state: state._bits[byte] & mask != 0
+        pos = self._index.value_fluents.get(fluent_exp, None)
+        if pos is not None:
+            return lambda state: state._slots[pos]
+
+        def missing_fluent(state):
+            raise UPUsageError(
+                f"The state {state} does not have a value for the value {fluent_exp}"
+            )
+
+        return missing_fluent
+
+    def walk_and(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        if len(args) == 2:
+            left, right = args
+            return lambda state: left(state) and right(state)
+        return lambda state: all(a(state) for a in args)
+
+    def walk_or(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        if len(args) == 2:
+            left, right = args
+            return lambda state: left(state) or right(state)
+        return lambda state: any(a(state) for a in args)
+
+    def walk_not(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        (arg,) = args
+        return lambda state: not arg(state)
+
+    def walk_implies(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: not left(state) or right(state)
+
+    def walk_iff(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: left(state) == right(state)
+
+    def walk_equals(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: left(state) == right(state)
+
+    def walk_le(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: left(state) <= right(state)
+
+    def walk_lt(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: left(state) < right(state)
+
+    def walk_plus(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        def evaluate_plus(state):
+            res = 0
+            for a in args:
+                res += a(state)
+            # consistent with the Simplifier, a sum equal to 0 is the integer 0
+            return 0 if res == 0 else res
+
+        return evaluate_plus
+
+    def walk_minus(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+        return lambda state: left(state) - right(state)
+
+    def walk_times(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        def evaluate_times(state):
+            res = 1
+            for a in args:
+                value = a(state)
+                # consistent with the Simplifier, a product with a 0 is the integer 0
+                if value == 0:
+                    return 0
+                res *= value
+            # consistent with the Simplifier, a product equal to 1 is the integer 1
+            return 1 if res == 1 else res
+
+        return evaluate_times
+
+    def walk_div(
+        self, expression: "FNode", args: List[CompiledExpression]
+    ) -> CompiledExpression:
+        left, right = args
+
+        def evaluate_div(state):
+            l, r = left(state), right(state)
+            value: Union[int, Fraction]
+            if type(l) is int and type(r) is int and l % r == 0:
+                value = l // r
+            else:
+                value = Fraction(l, r)
+            return value
+
+        return evaluate_div
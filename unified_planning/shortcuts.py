@@ -32,7 +32,18 @@ from unified_planning.engines import (
     AnytimeGuarantee,
 )
 from unified_planning.plans import PlanKind
-from typing import IO, Any, Iterable, Union, Dict, Optional, Sequence, List
+from typing import (
+    IO,
+    Any,
+    Iterable,
+    Iterator,
+    Union,
+    Dict,
+    Optional,
+    Sequence,
+    List,
+    Tuple,
+)
 from fractions import Fraction
 
 
@@ -555,6 +566,37 @@ def OneshotPlanner(
     )
 
 
+def solve_many(
+    problems: Iterable["up.model.AbstractProblem"],
+    *,
+    name: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+    optimality_guarantee: Optional[Union["up.engines.OptimalityGuarantee", str]] = None,
+    timeout: Optional[float] = None,
+    max_workers: Optional[int] = None,
+    use_threads: bool = False,
+) -> Iterator[Tuple[int, "up.engines.PlanGenerationResult"]]:
+    """
+    Solves all the given ``problems`` over a pool of workers, yielding the pairs
+    ``(index, result)`` in order of completion, where ``index`` is the position
+    of the solved problem in ``problems``.
+
+    e.g. ``for i, res in solve_many(problems, name='tamer', timeout=10, max_workers=4)``
+
+    See :func:`Factory.solve_many <unified_planning.engines.Factory.solve_many>`
+    for the description of the parameters.
+    """
+    return get_environment().factory.solve_many(
+        problems,
+        name=name,
+        params=params,
+        optimality_guarantee=optimality_guarantee,
+        timeout=timeout,
+        max_workers=max_workers,
+        use_threads=use_threads,
+    )
+
+
 def AnytimePlanner(
     *,
     name: Optional[str] = None,
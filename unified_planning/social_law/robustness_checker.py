@@ -40,6 +40,7 @@ from unified_planning.engines.results import *
 from unified_planning.engines.sequential_simulator import UPSequentialSimulator
 from unified_planning.model.multi_agent.ma_centralizer import MultiAgentProblemCentralizer
 from functools import partial
+from concurrent.futures import ProcessPoolExecutor
 from unified_planning.engines.compilers.utils import replace_action
 import unified_planning.model.problem_kind
 import unified_planning.social_law
@@ -64,27 +65,71 @@ class SocialLawRobustnessResult(Result):
     status : SocialLawRobustnessStatus
     counter_example : Optional["up.plans.Plan"]
     counter_example_orig_actions : Optional["up.plans.Plan"]
+    sap_cache_hits : int
+    sap_cache_misses : int
 
     def __init__(self, 
                 status : SocialLawRobustnessStatus, 
                 counter_example : Optional["up.plans.Plan"], 
-                counter_example_orig_actions : Optional["up.plans.Plan"]):
+                counter_example_orig_actions : Optional["up.plans.Plan"],
+                sap_cache_hits : int = 0,
+                sap_cache_misses : int = 0):
         self.status = status
         self.counter_example = counter_example
         self.counter_example_orig_actions = counter_example_orig_actions
+        self.sap_cache_hits = sap_cache_hits
+        self.sap_cache_misses = sap_cache_misses
+
+    @property
+    def sap_cache_hit_rate(self) -> Optional[float]:
+        """The fraction of the single agent projections whose solvability was found in the cache, None if no projection was checked."""
+        total = self.sap_cache_hits + self.sap_cache_misses
+        if total == 0:
+            return None
+        return self.sap_cache_hits / total
     
 
+def _solve_single_agent_projection(planner_name : Optional[str], problem : Problem) -> PlanGenerationResultStatus:
+    with OneshotPlanner(name=planner_name, problem_kind=problem.kind) as planner:
+        return planner.solve(problem).status
+
+
 
 class SocialLawRobustnessChecker(engines.engine.Engine, mixins.OneshotPlannerMixin):
     '''social law robustness checker class:
     This class checks if a given MultiAgentProblemWithWaitfor is robust or not.
     '''
-    def __init__(self, planner_name : str = None, robustness_verifier_name : str = None, save_pddl_prefix = None):
+    def __init__(self, planner_name : str = None, robustness_verifier_name : str = None, save_pddl_prefix = None, num_workers : int = 1):
         engines.engine.Engine.__init__(self)
         mixins.OneshotPlannerMixin.__init__(self)
+        if num_workers < 1:
+            raise up.exceptions.UPUsageError("SocialLawRobustnessChecker requires at least one worker.")
         self._planner_name = planner_name
         self._robustness_verifier_name = robustness_verifier_name
         self._save_pddl_prefix = save_pddl_prefix
+        self._num_workers = num_workers
+        self._executor : Optional[ProcessPoolExecutor] = None
+        # The solvability of the single agent projections already solved; the projections
+        # are compared structurally, so the projection of an agent untouched by a social law
+        # is found again when checking the next social law
+        self._sap_cache : Dict[Problem, bool] = {}
+        self._robustness_verifiers : Dict[ProblemKind, engines.engine.Engine] = {}
+        self.sap_cache_hits = 0
+        self.sap_cache_misses = 0
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def destroy(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def clear_sap_cache(self):
+        """Forgets the solvability of the single agent projections solved so far."""
+        self._sap_cache.clear()
         
 
     @property
@@ -117,6 +162,9 @@ class SocialLawRobustnessChecker(engines.engine.Engine, mixins.OneshotPlannerMix
         return self._status
 
     def is_single_agent_solvable(self, problem : MultiAgentProblem) -> bool:
+        """Returns True if the single agent projections of all the agents are solvable.
+        The projections not found in the cache are solved at the same time when num_workers > 1."""
+        to_solve : List[Problem] = []
         for agent in problem.agents:
             sap = SingleAgentProjection(agent)        
             result = sap.compile(problem)
@@ -126,17 +174,45 @@ class SocialLawRobustnessChecker(engines.engine.Engine, mixins.OneshotPlannerMix
                 w.write_domain(unified_planning.social_law.name_separator.join([self._save_pddl_prefix, "sap",  agent.name,  "domain.pddl"]))
                 w.write_problem(unified_planning.social_law.name_separator.join([self._save_pddl_prefix, "sap",  agent.name,  "problem.pddl"]))
 
-            with OneshotPlanner(name=self._planner_name, problem_kind=result.problem.kind) as planner:
-                presult = planner.solve(result.problem)
-                if presult.status not in unified_planning.engines.results.POSITIVE_OUTCOMES:                    
+            solvable = self._sap_cache.get(result.problem, None)
+            if solvable is None:
+                self.sap_cache_misses = self.sap_cache_misses + 1
+                to_solve.append(result.problem)
+            else:
+                self.sap_cache_hits = self.sap_cache_hits + 1
+                if not solvable:
                     return False
-        return True
+
+        if self._num_workers > 1 and len(to_solve) > 1:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._num_workers)
+            futures = [self._executor.submit(_solve_single_agent_projection, self._planner_name, p) for p in to_solve]
+            statuses = (f.result() for f in futures)
+        else:
+            statuses = (_solve_single_agent_projection(self._planner_name, p) for p in to_solve)
+
+        all_solvable = True
+        for sap_problem, status in zip(to_solve, statuses):
+            solvable = status in unified_planning.engines.results.POSITIVE_OUTCOMES
+            if solvable or status in [PlanGenerationResultStatus.UNSOLVABLE_PROVEN, PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY]:
+                # the other outcomes (timeouts, errors...) might change in another run
+                self._sap_cache[sap_problem] = solvable
+            if not solvable:
+                all_solvable = False
+                if self._num_workers == 1:
+                    # solving the other projections one by one is not needed
+                    break
+        return all_solvable
 
     def multi_agent_robustness_counterexample(self, problem : MultiAgentProblemWithWaitfor) -> SocialLawRobustnessResult:
-        rbv = Compiler(
-            name = self._robustness_verifier_name,
-            problem_kind = problem.kind, 
-            compilation_kind=CompilationKind.MA_SL_ROBUSTNESS_VERIFICATION)
+        # the verifiers are kept, so they reuse what they computed for the previous problems
+        rbv = self._robustness_verifiers.get(problem.kind, None)
+        if rbv is None:
+            rbv = Compiler(
+                name = self._robustness_verifier_name,
+                problem_kind = problem.kind, 
+                compilation_kind=CompilationKind.MA_SL_ROBUSTNESS_VERIFICATION)
+            self._robustness_verifiers[problem.kind] = rbv
         rbv_result = rbv.compile(problem)
 
         if self._save_pddl_prefix is not None:
@@ -167,14 +243,18 @@ class SocialLawRobustnessChecker(engines.engine.Engine, mixins.OneshotPlannerMix
 
     def is_robust(self, problem : MultiAgentProblemWithWaitfor) -> SocialLawRobustnessResult:
         status =  SocialLawRobustnessStatus.ROBUST_RATIONAL
+        hits, misses = self.sap_cache_hits, self.sap_cache_misses
         # Check single agent solvability
         if not self.is_single_agent_solvable(problem):
-            return SocialLawRobustnessResult(SocialLawRobustnessStatus.NON_ROBUST_SINGLE_AGENT, None, None)
+            return SocialLawRobustnessResult(SocialLawRobustnessStatus.NON_ROBUST_SINGLE_AGENT, None, None,
+                                                self.sap_cache_hits - hits, self.sap_cache_misses - misses)
         
         # Check for rational robustness
         result = self.multi_agent_robustness_counterexample(problem)        
         if result.counter_example is not None:            
             assert(result.status in [SocialLawRobustnessStatus.NON_ROBUST_MULTI_AGENT_FAIL, SocialLawRobustnessStatus.NON_ROBUST_MULTI_AGENT_DEADLOCK])
+        result.sap_cache_hits = self.sap_cache_hits - hits
+        result.sap_cache_misses = self.sap_cache_misses - misses
         return result
 
     def _solve(self, problem: 'up.model.AbstractProblem',
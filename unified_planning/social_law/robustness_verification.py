@@ -21,7 +21,7 @@ from unified_planning.model.multi_agent import *
 from unified_planning.model import *
 from unified_planning.engines.results import CompilerResult
 from unified_planning.exceptions import UPExpressionDefinitionError, UPProblemDefinitionError
-from typing import List, Dict, Union, Optional
+from typing import List, Dict, Union, Optional, Tuple
 from unified_planning.engines.compilers.utils import replace_action, get_fresh_name
 from functools import partial
 from operator import neg
@@ -38,12 +38,17 @@ from unified_planning.engines import Credits
 from unified_planning.io.pddl_writer import PDDLWriter
 import unified_planning.model.walkers as walkers
 from unified_planning.model.walkers.identitydag import IdentityDagWalker
+from unified_planning.model.walkers.memoization import LRUMemoization
 from unified_planning.environment import get_environment
 import unified_planning.model.problem_kind
 import unified_planning.social_law
 
 
 
+# The maximum number of substituted expressions and of action copies kept by a verifier between two compilations
+SUBSTITUTIONS_CACHE_SIZE = 100000
+ACTION_COPIES_CACHE_SIZE = 10000
+
 credits = Credits('Robustness Verification',
                   'Technion Cognitive Robotics Lab (cf. https://github.com/TechnionCognitiveRoboticsLab)',
                   'karpase@technion.ac.il',
@@ -123,23 +128,53 @@ class FluentMap():
 
     
 class FluentMapSubstituter(IdentityDagWalker):
-    """Performs substitution according to the given FluentMap"""
+    """Performs substitution according to the given FluentMap
+
+    If a substitutions cache is given, the substitutions are memoized there and can be shared by the substituters
+    of many problems: the result of a substitution depends on the fluent map prefix, on the local agent and on the names
+    of the environment and local agent fluents, that are part of the key of every cached substitution."""
 
-    def __init__(self, problem : MultiAgentProblem ,env: "unified_planning.environment.Environment"):
+    def __init__(self, problem : MultiAgentProblem ,env: "unified_planning.environment.Environment", substitutions : Optional[Dict] = None):
         IdentityDagWalker.__init__(self, env, True)
         self.problem = problem
         self.env = env
         self.manager = env.expression_manager
         self.type_checker = env.type_checker
+        self._substitutions = substitutions
+        self._env_fluents = set(problem.ma_environment.fluents)
+        self._env_signature = frozenset(f.name for f in self._env_fluents)
+        self._agents_fluents : Dict[str, Tuple[set, frozenset]] = {}
 
     def _get_key(self, expression, **kwargs):
         return expression
 
+    def agent_fluents(self, agent : Agent) -> Tuple[set, frozenset]:
+        """Returns the fluents of the given agent and the signature of their names."""
+        res = self._agents_fluents.get(agent.name, None)
+        if res is None:
+            fluents = set(agent.fluents)
+            res = (fluents, frozenset(f.name for f in fluents))
+            self._agents_fluents[agent.name] = res
+        return res
+
+    def signature(self, local_agent: Optional[Agent]) -> tuple:
+        """Returns what, besides the fluent map, determines the substitutions done with the given local agent."""
+        if local_agent is None:
+            return (None, self._env_signature)
+        return (local_agent.name, self._env_signature, self.agent_fluents(local_agent)[1])
+
     def substitute(self, expression: FNode, fmap: FluentMap, local_agent: Agent) -> FNode:
         """
         Performs substitution into the given expression, according to the given FluentMap
         """
-        return self.walk(expression, fmap=fmap, local_agent = local_agent)
+        if self._substitutions is None:
+            return self.walk(expression, fmap=fmap, local_agent = local_agent)
+        key = (expression, fmap.prefix, fmap._override_type, self.signature(local_agent))
+        res = self._substitutions.get(key, None)
+        if res is None:
+            res = self.walk(expression, fmap=fmap, local_agent = local_agent)
+            self._substitutions[key] = res
+        return res
 
     def walk_dot(self, expression: FNode, args: List[FNode], **kwargs) -> FNode:
         agent = expression.agent()
@@ -147,11 +182,11 @@ class FluentMapSubstituter(IdentityDagWalker):
         return kwargs["fmap"].get_agent_version(agent, fact)                    
 
     def walk_fluent_exp(self, expression: FNode, args: List[FNode], **kwargs) -> FNode:
-        if expression.fluent() in self.problem.ma_environment.fluents:
+        if expression.fluent() in self._env_fluents:
             return kwargs["fmap"].get_environment_version(expression)
         
         local_agent = kwargs["local_agent"]
-        if local_agent is not None and expression.fluent() in local_agent.fluents:
+        if local_agent is not None and expression.fluent() in self.agent_fluents(local_agent)[0]:
             return kwargs["fmap"].get_agent_version(local_agent, expression)
         return expression
 
@@ -163,6 +198,30 @@ class RobustnessVerifier(engines.engine.Engine, CompilerMixin):
         engines.engine.Engine.__init__(self)
         CompilerMixin.__init__(self, CompilationKind.MA_SL_ROBUSTNESS_VERIFICATION)
         self.act_pred = None        
+        # The substituted expressions and the action copies are kept between compilations, so verifying
+        # again a problem that differs in a few actions (e.g. during social law synthesis) only
+        # recomputes what changed
+        self._substitutions = LRUMemoization(SUBSTITUTIONS_CACHE_SIZE)
+        self._action_copies = LRUMemoization(ACTION_COPIES_CACHE_SIZE)
+
+    def clear_cache(self):
+        """Forgets the substitutions and the action copies computed by the previous compilations."""
+        self._substitutions.clear()
+        self._action_copies.clear()
+
+    def create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : Action, prefix : str) -> Action:
+        """Returns a new copy of an action, with name prefix_action_name, and duplicates the local preconditions/effects.
+        The copies are cached: a copy depends only on the action, on its waitfor preconditions and on the fluents substitution."""
+        key = (agent.name, action, prefix, tuple(problem.waitfor.get_preconditions_wait(agent.name, action.name)), self.fsub.signature(agent))
+        new_action = self._action_copies.get(key, None)
+        if new_action is None:
+            new_action = self._create_action_copy(problem, agent, action, prefix)
+            self._action_copies[key] = new_action
+        # the cached copy is never given away, because the caller modifies the copy
+        return new_action.clone()
+
+    def _create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : Action, prefix : str) -> Action:
+        raise NotImplementedError
         
     @staticmethod
     def get_credits(**kwargs) -> Optional['Credits']:
@@ -239,7 +298,9 @@ class RobustnessVerifier(engines.engine.Engine, CompilerMixin):
             self.local_fluent_map[agent] = FluentMap("l-" + agent.name)
             self.local_fluent_map[agent].add_facts(problem, new_problem)
 
-        self.fsub = FluentMapSubstituter(problem, new_problem.environment)
+        self._substitutions.trim()
+        self._action_copies.trim()
+        self.fsub = FluentMapSubstituter(problem, new_problem.environment, self._substitutions)
 
         # Initial state
         eiv = problem.explicit_initial_values     
@@ -269,7 +330,7 @@ class InstantaneousActionRobustnessVerifier(RobustnessVerifier):
     def supports(problem_kind):
         return problem_kind <= InstantaneousActionRobustnessVerifier.supported_kind()
 
-    def create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : InstantaneousAction, prefix : str):
+    def _create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : InstantaneousAction, prefix : str):
         """Create a new copy of an action, with name prefix_action_name, and duplicates the local preconditions/effects
         """
         d = {}
@@ -641,7 +702,7 @@ class DurativeActionRobustnessVerifier(RobustnessVerifier):
         return (c_start, c_overall, c_end)
 
 
-    def create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : DurativeAction, prefix : str):
+    def _create_action_copy(self, problem: MultiAgentProblemWithWaitfor, agent : Agent , action : DurativeAction, prefix : str):
         """Create a new copy of an action, with name prefix_action_name, and duplicates the local preconditions/effects
         """
         d = {}
@@ -21,7 +21,7 @@ from unified_planning.model import Parameter, Fluent, InstantaneousAction, probl
 from unified_planning.shortcuts import *
 from unified_planning.exceptions import UPProblemDefinitionError
 from unified_planning.model import Problem, InstantaneousAction, DurativeAction, Action
-from typing import Type, List, Dict, Callable, OrderedDict, Tuple
+from typing import Type, List, Dict, Callable, Iterable, OrderedDict, Tuple
 from enum import Enum, auto
 from unified_planning.io import PDDLWriter, PDDLReader
 from unified_planning.engines import Credits
@@ -268,7 +268,17 @@ class SocialLaw(engines.engine.Engine, CompilerMixin):
             action.add_precondition(precondition)
 
         # Add waitfor annotations
-        for agent_name, action_name, precondition_fluent_name, pre_condition_args in self.added_waitfors:
+        self._add_waitfors(new_problem, self.added_waitfors)
+
+        # Disallow actions
+        self._disallow_actions(new_problem, self.disallowed_actions)
+
+        return CompilerResult(
+            new_problem, partial(replace_action, map=new_to_old), self.name
+        )
+
+    def _add_waitfors(self, new_problem : MultiAgentProblemWithWaitfor, waitfors : Iterable[Tuple[str, str, str, Tuple[str]]]):
+        for agent_name, action_name, precondition_fluent_name, pre_condition_args in waitfors:
             agent = new_problem.agent(agent_name)
             action = agent.action(action_name)
             if agent.has_fluent(precondition_fluent_name):
@@ -289,8 +299,8 @@ class SocialLaw(engines.engine.Engine, CompilerMixin):
             precondition = FluentExp(precondition_fluent, pre_condition_arg_objs)
             new_problem.waitfor.annotate_as_waitfor(agent_name, action_name, precondition)
 
-        # Disallow actions
-        for agent_name, action_name, disallowed_args in self.disallowed_actions:
+    def _disallow_actions(self, new_problem : MultiAgentProblemWithWaitfor, disallowed_actions : Iterable[Tuple[str, str, Tuple[str]]]):
+        for agent_name, action_name, disallowed_args in disallowed_actions:
             agent = new_problem.agent(agent_name)
             action = agent.action(action_name)
             
@@ -312,7 +322,67 @@ class SocialLaw(engines.engine.Engine, CompilerMixin):
             new_problem.set_initial_value(
                 Dot(agent, FluentExp(allowed_fluent, arg_objs)), 
                 False
-            )            
+            )
+
+    def extends(self, parent : "SocialLaw") -> bool:
+        """Returns True if this social law only adds waitfors and disallowed actions to the given parent social law."""
+        return parent.added_waitfors.issubset(self.added_waitfors) and \
+            parent.disallowed_actions.issubset(self.disallowed_actions) and \
+            parent.new_fluents == self.new_fluents and \
+            parent.new_fluent_initial_val == self.new_fluent_initial_val and \
+            parent.added_action_parameters == self.added_action_parameters and \
+            parent.added_preconditions == self.added_preconditions and \
+            parent.new_objects == self.new_objects
+
+    def compile_from_parent(self, problem : MultiAgentProblem, parent : "SocialLaw", parent_result : CompilerResult) -> CompilerResult:
+        """Compiles the given problem with this social law, starting from the result of the compilation of the same
+        problem with the parent social law, and applying only the waitfors and disallowed actions missing in the parent.
+
+        The actions untouched by the difference are shared with the parent compiled problem, instead of being cloned.
+        If this social law does not extend the parent (see extends), the problem is compiled from scratch."""
+        if not self.extends(parent):
+            return self.compile(problem)
+        parent_problem = parent_result.problem
+        assert isinstance(parent_problem, MultiAgentProblemWithWaitfor)
+        new_disallowed_actions = self.disallowed_actions.difference(parent.disallowed_actions)
+        # the actions getting the "allowed" precondition must be cloned, the others are shared
+        modified_actions = set()
+        for agent_name, action_name, _ in new_disallowed_actions:
+            if not parent_problem.agent(agent_name).has_fluent("allowed__" + action_name):
+                modified_actions.add((agent_name, action_name))
+
+        new_problem = MultiAgentProblemWithWaitfor()
+        new_problem.name = f'{self.name}_{problem.name}'
+
+        for f in parent_problem.ma_environment.fluents:
+            default_val = parent_problem.ma_environment.fluents_defaults[f]
+            new_problem.ma_environment.add_fluent(f, default_initial_value=default_val)
+        for ag in parent_problem.agents:
+            new_ag = up.model.multi_agent.Agent(ag.name, new_problem)
+            for f in ag.fluents:
+                default_val = ag.fluents_defaults[f]
+                new_ag.add_fluent(f, default_initial_value=default_val)
+            for a in ag.actions:
+                new_action = a.clone() if (ag.name, a.name) in modified_actions else a
+                new_ag.add_action(new_action)
+            new_problem.add_agent(new_ag)
+        new_problem._user_types = parent_problem._user_types[:]
+        new_problem._user_types_hierarchy = parent_problem._user_types_hierarchy.copy()
+        new_problem._objects = parent_problem._objects[:]
+        new_problem._initial_value = parent_problem._initial_value.copy()
+        new_problem._goals = parent_problem._goals[:]
+        new_problem._initial_defaults = parent_problem._initial_defaults.copy()
+        new_problem._waitfor = parent_problem.waitfor.clone()
+
+        self._add_waitfors(new_problem, self.added_waitfors.difference(parent.added_waitfors))
+        self._disallow_actions(new_problem, new_disallowed_actions)
+
+        # the map is built once the actions are not modified anymore
+        new_to_old: Dict[Action, Action] = {}
+        for new_ag in new_problem.agents:
+            ag = problem.agent(new_ag.name)
+            for a in new_ag.actions:
+                new_to_old[a] = (ag, ag.action(a.name))
 
         return CompilerResult(
             new_problem, partial(replace_action, map=new_to_old), self.name
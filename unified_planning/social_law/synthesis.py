@@ -23,7 +23,7 @@ from unified_planning.social_law.robustness_checker import SocialLawRobustnessCh
 from unified_planning.model import Parameter, Fluent, InstantaneousAction, problem_kind
 from unified_planning.exceptions import UPProblemDefinitionError
 from unified_planning.model import Problem, InstantaneousAction, DurativeAction, Action
-from typing import Type, List, Dict, Callable, OrderedDict, Set
+from typing import Type, List, Dict, Callable, OrderedDict, Set, Iterator, Optional, Tuple
 from enum import Enum, auto
 from unified_planning.io import PDDLWriter, PDDLReader
 from unified_planning.engines import Credits
@@ -42,6 +42,7 @@ import queue
 from dataclasses import dataclass, field
 from typing import Any
 from itertools import chain, combinations
+from concurrent.futures import Future, ProcessPoolExecutor
 from unified_planning.model.walkers import FreeVarsExtractor
 
 credits = Credits('Social Law Synthesis',
@@ -69,10 +70,12 @@ class SearchNode:
 
     priority: int
     social_law : SocialLaw = field(compare=False)
+    parent_social_law : Optional[SocialLaw] = field(compare=False)
 
-    def __init__(self, social_law : SocialLaw, priority : int = 0):
+    def __init__(self, social_law : SocialLaw, priority : int = 0, parent_social_law : Optional[SocialLaw] = None):
         self.priority = priority
         self.social_law = social_law
+        self.parent_social_law = parent_social_law
 
 class Heuristic:
     def __init__(self):
@@ -215,19 +218,170 @@ class POQueue:
             for pref_index in prefs:
                 queue_index = queue_index + (2 ** pref_index)
             self.queues[queue_index].put(node)
+
+class _SetTrieNode:
+    __slots__ = ["children", "social_laws"]
+
+    def __init__(self):
+        self.children : Dict[int, "_SetTrieNode"] = {}
+        # The social laws ending in this node: maps the initial values of their new fluents
+        # to the other parts of the social laws, that don't take part in the subsumption
+        self.social_laws : Dict[frozenset, Set[tuple]] = {}
+
+class SocialLawIndex:
+    """ This class represents a set of social laws, indexed to find quickly if a social law is stricter than one in the set.
+
+    A social law is stricter than another if its waitfors, disallowed actions and added preconditions are supersets of
+    the ones of the other social law, and the initial values of their new fluents are the same (see SocialLaw.is_stricter_than).
+    Every waitfor, disallowed action and added precondition is mapped to an integer, and the social laws are stored
+    in a trie over the sorted integers of their constraints, so the social laws in the set that a social law is stricter
+    than are found visiting only the branches made of its own constraints."""
+
+    def __init__(self):
+        self._atom_ids : Dict[Tuple[str, Any], int] = {}
+        self._root = _SetTrieNode()
+        self._size = 0
+
+    def _atoms(self, social_law : SocialLaw) -> Iterator[Tuple[str, Any]]:
+        for w in social_law.added_waitfors:
+            yield ("w", w)
+        for a in social_law.disallowed_actions:
+            yield ("d", a)
+        for p in social_law.added_preconditions:
+            yield ("p", p)
+
+    def _rest(self, social_law : SocialLaw) -> tuple:
+        return (frozenset(social_law.new_fluents), frozenset(social_law.added_action_parameters), frozenset(social_law.new_objects))
+
+    def _find_node(self, social_law : SocialLaw) -> Optional[_SetTrieNode]:
+        ids = []
+        for atom in self._atoms(social_law):
+            atom_id = self._atom_ids.get(atom, None)
+            if atom_id is None:
+                return None
+            ids.append(atom_id)
+        node = self._root
+        for atom_id in sorted(ids):
+            next_node = node.children.get(atom_id, None)
+            if next_node is None:
+                return None
+            node = next_node
+        return node
+
+    def add(self, social_law : SocialLaw):
+        """ Adds the given social law to the set."""
+        ids = []
+        for atom in self._atoms(social_law):
+            atom_id = self._atom_ids.get(atom, None)
+            if atom_id is None:
+                atom_id = len(self._atom_ids)
+                self._atom_ids[atom] = atom_id
+            ids.append(atom_id)
+        node = self._root
+        for atom_id in sorted(ids):
+            next_node = node.children.get(atom_id, None)
+            if next_node is None:
+                next_node = _SetTrieNode()
+                node.children[atom_id] = next_node
+            node = next_node
+        rests = node.social_laws.setdefault(frozenset(social_law.new_fluent_initial_val), set())
+        rest = self._rest(social_law)
+        if rest not in rests:
+            rests.add(rest)
+            self._size = self._size + 1
+
+    def __contains__(self, social_law : SocialLaw) -> bool:
+        node = self._find_node(social_law)
+        if node is None:
+            return False
+        rests = node.social_laws.get(frozenset(social_law.new_fluent_initial_val), None)
+        return rests is not None and self._rest(social_law) in rests
+
+    def __len__(self) -> int:
+        return self._size
+
+    def has_less_strict(self, social_law : SocialLaw) -> bool:
+        """ Returns True if the given social law is stricter than (or equal to) a social law in the set."""
+        # the constraints never added to the set can't be part of a social law in the set
+        ids = sorted(self._atom_ids[atom] for atom in self._atoms(social_law) if atom in self._atom_ids)
+        initial_values = frozenset(social_law.new_fluent_initial_val)
+        # the nodes to visit, with the position in ids of the first constraint that can follow
+        stack = [(self._root, 0)]
+        while stack:
+            node, start = stack.pop()
+            if initial_values in node.social_laws:
+                return True
+            if not node.children:
+                continue
+            for i in range(start, len(ids)):
+                child = node.children.get(ids[i], None)
+                if child is not None:
+                    stack.append((child, i + 1))
+        return False
+
             
+class SocialLawCompilationCache:
+    """ This class compiles a problem with the social laws of the search, keeping the most recent compilations,
+    so a social law is compiled incrementally from its parent's compilation (see SocialLaw.compile_from_parent)
+    while the parent's compilation is still kept."""
+
+    def __init__(self, problem : MultiAgentProblemWithWaitfor, max_size : int = 64):
+        self.problem = problem
+        self.max_size = max_size
+        self._compilations : "OrderedDict[SocialLaw, CompilerResult]" = OrderedDict()
+        self.incremental_compilations = 0
+        self.full_compilations = 0
+
+    def compile(self, social_law : SocialLaw, parent_social_law : Optional[SocialLaw] = None) -> CompilerResult:
+        parent_result = None
+        if parent_social_law is not None:
+            parent_result = self._compilations.get(parent_social_law, None)
+        if parent_result is not None and social_law.extends(parent_social_law):
+            self._compilations.move_to_end(parent_social_law)
+            result = social_law.compile_from_parent(self.problem, parent_social_law, parent_result)
+            self.incremental_compilations = self.incremental_compilations + 1
+        else:
+            result = social_law.compile(self.problem)
+            self.full_compilations = self.full_compilations + 1
+        self._compilations[social_law] = result
+        if len(self._compilations) > self.max_size:
+            self._compilations.popitem(last=False)
+        return result
+
+# The compilations and the robustness checker of the worker processes, set by _init_robustness_worker
+_worker_compilations : Optional[SocialLawCompilationCache] = None
+_worker_robustness_checker : Optional[SocialLawRobustnessChecker] = None
+
+def _init_robustness_worker(problem : MultiAgentProblemWithWaitfor, robustness_checker : SocialLawRobustnessChecker):
+    global _worker_compilations, _worker_robustness_checker
+    _worker_compilations = SocialLawCompilationCache(problem)
+    _worker_robustness_checker = robustness_checker
+
+def _check_social_law(social_law : SocialLaw, parent_social_law : Optional[SocialLaw]) -> SocialLawRobustnessResult:
+    assert _worker_compilations is not None and _worker_robustness_checker is not None
+    current_problem = _worker_compilations.compile(social_law, parent_social_law).problem
+    return _worker_robustness_checker.is_robust(current_problem)
+
 class SocialLawGenerator:
-    """ This class takes in a multi agent problem (possibly with social laws), and searches for a social law which will turn it robust."""
+    """ This class takes in a multi agent problem (possibly with social laws), and searches for a social law which will turn it robust.
+    
+    With num_workers > 1, the search checks the robustness of the num_workers best open nodes at the same time, each in its own process.
+    The results are then processed in the order the nodes were taken from the open list, so the search is deterministic
+    (the heuristics see the results of a whole frontier before computing the priorities of its successors)."""
     def __init__(self, 
                     search : SocialLawGeneratorSearch = SocialLawGeneratorSearch.BFS, 
                     heuristic : Optional[Heuristic] = None,
-                    preferred_operator_heuristics : List[Heuristic] = []):
+                    preferred_operator_heuristics : List[Heuristic] = [],
+                    num_workers : int = 1):
+        if num_workers < 1:
+            raise up.exceptions.UPUsageError("SocialLawGenerator requires at least one worker.")
         self.search = search
         self.heuristic = heuristic
         self.po = preferred_operator_heuristics
         self.all_heuristics = set(preferred_operator_heuristics)
         if self.heuristic is not None:
             self.all_heuristics.add(self.heuristic)
+        self.num_workers = num_workers
 
     
     def init_counters(self):
@@ -248,6 +402,23 @@ class SocialLawGenerator:
         return [succ_sl]
 
 
+    def get_frontier(self, open : POQueue, closed : SocialLawIndex, infeasible_sap : SocialLawIndex) -> List[SearchNode]:
+        """ Takes from the open list the (at most num_workers) next nodes to check, marking them as expanded."""
+        frontier : List[SearchNode] = []
+        while not open.empty() and len(frontier) < self.num_workers:
+            current_node = open.get()
+            current_sl = current_node.social_law
+            if current_sl not in closed:
+                closed.add(current_sl)
+                self.expanded = self.expanded + 1
+                
+                # Check that this isn't stricter than a social law for while the single agent projection is not solvable
+                if infeasible_sap.has_less_strict(current_sl):
+                    continue
+
+                frontier.append(current_node)
+        return frontier
+
     def generate_social_law(self, initial_problem : MultiAgentProblemWithWaitfor):
         robustness_checker = SocialLawRobustnessChecker()        
         self.init_counters()
@@ -256,52 +427,58 @@ class SocialLawGenerator:
             h.report_current_problem(initial_problem)
 
         open = POQueue(len(self.po), self.search)
-        closed : Set[SocialLaw] = set()
-        infeasible_sap : Set[SocialLaw] = set()
+        closed = SocialLawIndex()
+        infeasible_sap = SocialLawIndex()
 
         empty_social_law = SocialLaw()
         open.put( SearchNode(empty_social_law), [1] * len(self.po) )
         self.generated = self.generated + 1
 
-        while not open.empty():
-            current_node = open.get()
-            current_sl = current_node.social_law
-            if current_sl not in closed:
-                closed.add(current_sl)
-                self.expanded = self.expanded + 1
-                
-                # Check that this isn't stricter than a social law for while the single agent projection is not solvable
-                for infeasible_sl in infeasible_sap:
-                    if current_sl.is_stricter_than(infeasible_sl):
-                        continue
-
-                current_problem = current_sl.compile(initial_problem).problem
-                robustness_result = robustness_checker.is_robust(current_problem)
-                for h in self.all_heuristics:
-                    h.report_current_node(current_node, robustness_result)
-
-                if robustness_result.status == SocialLawRobustnessStatus.ROBUST_RATIONAL:
-                    # We found a robust social law - return
-                    return current_node.social_law
-                elif robustness_result.status == SocialLawRobustnessStatus.NON_ROBUST_SINGLE_AGENT:
-                    # We made one of the single agent problems unsolvable - this is a dead end (for this simple search)
-                    infeasible_sap.add(current_sl)                    
+        # Every successor differs from its parent by a disallowed action, so it is compiled from the parent's compilation
+        compilations = SocialLawCompilationCache(initial_problem)
+        executor = None
+        futures : List[Future] = []
+        if self.num_workers > 1:
+            # the initial problem is sent once to every worker, then only the social laws are sent
+            executor = ProcessPoolExecutor(max_workers=self.num_workers,
+                                            initializer=_init_robustness_worker,
+                                            initargs=(initial_problem, robustness_checker))
+        try:
+            while not open.empty():
+                frontier = self.get_frontier(open, closed, infeasible_sap)
+                if executor is None:
+                    results = (robustness_checker.is_robust(compilations.compile(node.social_law, node.parent_social_law).problem) for node in frontier)
                 else:
-                    # We have a counter example, generate a successor for removing each of the actions that appears there                    
-                    for i, ai in enumerate(robustness_result.counter_example_orig_actions.actions):
-                        compiled_action_instance = robustness_result.counter_example.actions[i]
-                        for succ_sl in self.generate_successors(current_sl, i, ai, compiled_action_instance):
-                            succ_node = SearchNode(succ_sl)
-                            
-                            pref = list(map(lambda poh: poh.get_priority(succ_node), self.po))
-                            
-                            if self.heuristic is not None:
-                                succ_node.priority = self.heuristic.get_priority(succ_node)
-                            open.put(succ_node, pref)
-                            self.generated = self.generated + 1
-
-                        
-
-
-
-    
+                    futures = [executor.submit(_check_social_law, node.social_law, node.parent_social_law) for node in frontier]
+                    results = (f.result() for f in futures)
+
+                for current_node, robustness_result in zip(frontier, results):
+                    current_sl = current_node.social_law
+                    for h in self.all_heuristics:
+                        h.report_current_node(current_node, robustness_result)
+
+                    if robustness_result.status == SocialLawRobustnessStatus.ROBUST_RATIONAL:
+                        # We found a robust social law - return
+                        return current_node.social_law
+                    elif robustness_result.status == SocialLawRobustnessStatus.NON_ROBUST_SINGLE_AGENT:
+                        # We made one of the single agent problems unsolvable - this is a dead end (for this simple search)
+                        infeasible_sap.add(current_sl)                    
+                    else:
+                        # We have a counter example, generate a successor for removing each of the actions that appears there                    
+                        for i, ai in enumerate(robustness_result.counter_example_orig_actions.actions):
+                            compiled_action_instance = robustness_result.counter_example.actions[i]
+                            for succ_sl in self.generate_successors(current_sl, i, ai, compiled_action_instance):
+                                succ_node = SearchNode(succ_sl, parent_social_law=current_sl)
+                                
+                                pref = list(map(lambda poh: poh.get_priority(succ_node), self.po))
+                                
+                                if self.heuristic is not None:
+                                    succ_node.priority = self.heuristic.get_priority(succ_node)
+                                open.put(succ_node, pref)
+                                self.generated = self.generated + 1
+        finally:
+            if executor is not None:
+                # the checks of the nodes following a robust one are not needed anymore
+                for f in futures:
+                    f.cancel()
+                executor.shutdown()
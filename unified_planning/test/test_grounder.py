@@ -33,6 +33,7 @@ from unified_planning.test import (
 from unified_planning.test.examples import get_example_problems
 from unified_planning.engines import CompilationKind
 from unified_planning.engines.compilers import Grounder
+from unified_planning.plans import ActionInstance, PlanKind
 
 
 class TestGrounder(TestCase):
@@ -307,6 +308,115 @@ class TestGrounder(TestCase):
         for a in grounded_problem.actions:
             self.assertEqual(len(a.parameters), 0)
 
+    def test_reachability_pruning(self):
+        problem = Problem("reachability")
+        Location = UserType("Location")
+        robot_at = Fluent("robot_at", BoolType(), position=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        visited = Fluent("visited", BoolType(), position=Location)
+        locations = [Object(f"l{i}", Location) for i in range(5)]
+        move = InstantaneousAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.add_precondition(robot_at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_effect(robot_at(l_from), False)
+        move.add_effect(robot_at(l_to), True)
+        visit = InstantaneousAction("visit", position=Location)
+        position = visit.parameter("position")
+        visit.add_precondition(robot_at(position))
+        visit.add_precondition(Not(visited(position)))
+        visit.add_effect(visited(position), True)
+        problem.add_fluent(robot_at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_fluent(visited, default_initial_value=False)
+        problem.add_objects(locations)
+        problem.add_actions([move, visit])
+        problem.set_initial_value(robot_at(locations[0]), True)
+        # l0 <-> l1 -> l2, while l3 <-> l4 is unreachable
+        for i, j in [(0, 1), (1, 0), (1, 2), (3, 4), (4, 3)]:
+            problem.set_initial_value(connected(locations[i], locations[j]), True)
+        problem.add_goal(visited(locations[2]))
+
+        pruned_problem = Grounder().compile(problem, CompilationKind.GROUNDING).problem
+        full_problem = (
+            Grounder(prune_actions=False)
+            .compile(problem, CompilationKind.GROUNDING)
+            .problem
+        )
+        assert isinstance(pruned_problem, Problem)
+        assert isinstance(full_problem, Problem)
+        self.assertEqual(len(full_problem.actions), 10)
+        pruned_names = set(a.name for a in pruned_problem.actions)
+        self.assertEqual(
+            pruned_names,
+            {
+                "move_l0_l1",
+                "move_l1_l0",
+                "move_l1_l2",
+                "visit_l0",
+                "visit_l1",
+                "visit_l2",
+            },
+        )
+        self.assertTrue(pruned_names <= set(a.name for a in full_problem.actions))
+
+    def test_parallel_grounding(self):
+        for name in [
+            "robot_loader_weak_bridge",
+            "hierarchical_blocks_world",
+            "robot_fluent_of_user_type",
+            "matchcellar",
+            "timed_connected_locations",
+        ]:
+            problem = self.problems[name].problem
+            res = Grounder().compile(problem, CompilationKind.GROUNDING)
+            parallel_res = Grounder(workers=2).compile(
+                problem, CompilationKind.GROUNDING
+            )
+            self.assertEqual(res.problem, parallel_res.problem)
+            for a in parallel_res.problem.actions:
+                self.assertEqual(a.environment, problem.environment)
+                ai = parallel_res.map_back_action_instance(ActionInstance(a))
+                expected_ai = res.map_back_action_instance(
+                    ActionInstance(res.problem.action(a.name))
+                )
+                assert ai is not None and expected_ai is not None
+                self.assertEqual(ai.action, expected_ai.action)
+                self.assertEqual(ai.actual_parameters, expected_ai.actual_parameters)
+
+    def test_reachability_pruning_on_examples(self):
+        for name in [
+            "robot_loader_weak_bridge",
+            "hierarchical_blocks_world",
+            "robot_fluent_of_user_type",
+            "matchcellar",
+        ]:
+            problem, plan = self.problems[name]
+            pruned = Grounder().compile(problem, CompilationKind.GROUNDING)
+            full = Grounder(prune_actions=False).compile(
+                problem, CompilationKind.GROUNDING
+            )
+            assert isinstance(pruned.problem, Problem)
+            assert isinstance(full.problem, Problem)
+            pruned_actions = set()
+            for a in pruned.problem.actions:
+                ai = pruned.map_back_action_instance(ActionInstance(a))
+                assert ai is not None
+                pruned_actions.add((ai.action, ai.actual_parameters))
+            full_actions = set()
+            for a in full.problem.actions:
+                ai = full.map_back_action_instance(ActionInstance(a))
+                assert ai is not None
+                full_actions.add((ai.action, ai.actual_parameters))
+            self.assertTrue(pruned_actions <= full_actions)
+            # the actions of the plan are reachable
+            if plan.kind == PlanKind.TIME_TRIGGERED_PLAN:
+                plan_actions = [ai for _, ai, _ in plan.timed_actions]
+            else:
+                plan_actions = plan.actions
+            for ai in plan_actions:
+                self.assertIn((ai.action, ai.actual_parameters), pruned_actions)
+
     @skipIfEngineNotAvailable("pyperplan")
     def test_pyperplan_grounder(self):
         problem = self.problems["robot_no_negative_preconditions"].problem
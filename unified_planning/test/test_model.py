@@ -13,12 +13,16 @@
 # limitations under the License.
 
 
+import gc
+import pickle
+import time
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.exceptions import (
     UPUsageError,
     UPTypeError,
     UPConflictingEffectsException,
+    UPExpressionDefinitionError,
 )
 from unified_planning.test.examples import get_example_problems
 from unified_planning.test import TestCase, main
@@ -60,6 +64,102 @@ class TestModel(TestCase):
             "type of the object does not belong to the same environment of the object",
         )
 
+    def test_weak_interning(self):
+        env = up.environment.Environment()
+        em = env.expression_manager
+        env.set_weak_interning()
+        self.assertTrue(em.weak_interning)
+        base_size = len(em.expressions)
+
+        def build_problem():
+            Location = env.type_manager.UserType("Location")
+            at = Fluent("at", BoolType(), l=Location, environment=env)
+            locations = [Object(f"l{i}", Location, env) for i in range(20)]
+            problem = Problem("weak", env)
+            problem.add_fluent(at, default_initial_value=False)
+            problem.add_objects(locations)
+            problem.set_initial_value(at(locations[0]), True)
+            problem.add_goal(em.And([at(l) for l in locations]))
+            return problem
+
+        problem = build_problem()
+        goal = problem.goals[0]
+        self.assertIs(goal, em.And(goal.args))
+        self.assertEqual(len(env.free_vars_extractor.get(goal)), 20)
+        self.assertTrue(goal.type.is_bool_type())
+        self.assertGreater(len(em.expressions), base_size)
+        max_id = max(e.node_id for e in em.expressions.values())
+        pickled_env = pickle.loads(pickle.dumps(env))
+        self.assertTrue(pickled_env.expression_manager.weak_interning)
+
+        del problem, goal
+        gc.collect()
+        self.assertEqual(len(em.expressions), base_size)
+        new_problem = build_problem()
+        self.assertGreater(new_problem.goals[0].node_id, max_id)
+
+        env.set_weak_interning(False)
+        self.assertFalse(em.weak_interning)
+        self.assertEqual(type(env.type_checker.memoization), dict)
+
+    def test_trusted_construction(self):
+        env = up.environment.Environment()
+        em = env.expression_manager
+        tm = env.type_manager
+        x = Fluent("x", tm.BoolType(), environment=env)
+        y = Fluent("y", tm.BoolType(), environment=env)
+        n = Fluent("n", tm.IntType(), p=tm.IntType(0, 5), environment=env)
+        x_exp, y_exp, zero = em.FluentExp(x), em.FluentExp(y), em.Int(0)
+        n_exp = em.trusted.FluentExp(n, [zero])
+        self.assertIs(n_exp, em.FluentExp(n, [0]))
+        self.assertIs(em.trusted.And([x_exp, y_exp]), em.And(x, y))
+        self.assertIs(em.trusted.Or([x_exp, y_exp]), em.Or(x, y))
+        self.assertIs(em.trusted.And([]), em.TRUE())
+        self.assertIs(em.trusted.Or([x_exp]), x_exp)
+        self.assertIs(em.trusted.Plus([n_exp, zero]), em.Plus(n_exp, 0))
+        self.assertIs(em.trusted.Times([]), em.Int(1))
+        self.assertIs(em.trusted.Not(em.trusted.Not(x_exp)), x_exp)
+        self.assertIs(em.trusted.LE(n_exp, zero), em.LE(n_exp, 0))
+        self.assertIs(em.trusted.Minus(n_exp, zero), em.Minus(n_exp, 0))
+        self.assertEqual(
+            em.trusted.create_nodes(OperatorKind.NOT, [(x_exp,), (y_exp,)]),
+            [em.Not(x), em.Not(y)],
+        )
+        with self.assertRaises(UPExpressionDefinitionError):
+            em.trusted.FluentExp(n, [])
+        # the type checking of the ill-typed expressions is deferred
+        ill_typed = em.trusted.And([x_exp, n_exp])
+        with self.assertRaises(UPTypeError):
+            ill_typed.type
+        with self.assertRaises(UPTypeError):
+            em.Or(x_exp, n_exp)
+
+    def test_construction_rate(self):
+        # micro-benchmark of the number of new expressions created per second
+        def nodes_per_second(trusted: bool) -> float:
+            env = up.environment.Environment()
+            em = env.expression_manager
+            x = Fluent("x", env.type_manager.BoolType(), environment=env)
+            y_exp = em.FluentExp(
+                Fluent("y", env.type_manager.BoolType(), environment=env)
+            )
+            expression, created = em.FluentExp(x), len(em.expressions)
+            start = time.perf_counter()
+            for i in range(2000):
+                if trusted:
+                    arg = em.trusted.Not(y_exp) if i % 2 else y_exp
+                    expression = em.trusted.And([expression, arg])
+                else:
+                    expression = em.And(expression, em.Not(y_exp) if i % 2 else y_exp)
+            created = len(em.expressions) - created
+            self.assertEqual(created, 2001)
+            self.assertTrue(expression.type.is_bool_type())
+            return created / (time.perf_counter() - start)
+
+        rate = max(nodes_per_second(False) for _ in range(3))
+        trusted_rate = max(nodes_per_second(True) for _ in range(3))
+        self.assertGreater(trusted_rate, rate)
+
     def test_clone_problem_and_action(self):
         for _, (problem, _) in self.problems.items():
             if problem.kind.has_scheduling():
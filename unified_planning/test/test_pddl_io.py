@@ -19,7 +19,7 @@ import pytest
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.test import TestCase, main, skipIfNoOneshotPlannerForProblemKind
-from unified_planning.io import PDDLWriter, PDDLReader
+from unified_planning.io import PDDLWriter, PDDLReader, PDDLDomainCache
 from unified_planning.test.examples import get_example_problems
 from unified_planning.exceptions import UPProblemDefinitionError
 from unified_planning.model.problem_kind import simple_numeric_kind
@@ -359,6 +359,39 @@ class TestPddlIO(TestCase):
         problem_2 = reader.parse_problem_string(domain_str, problem_str)
         self.assertEqual(problem, problem_2)
 
+    def test_domain_cache(self):
+        reader = PDDLReader()
+        domain_filename = os.path.join(PDDL_DOMAINS_PATH, "depot", "domain.pddl")
+        problem_filename = os.path.join(PDDL_DOMAINS_PATH, "depot", "problem.pddl")
+        problem = reader.parse_problem(domain_filename, problem_filename)
+        # another instance of the same domain, with a different goal
+        problem_2 = reader.parse_problem(domain_filename, problem_filename)
+        goal = problem_2.goals[0].arg(0)
+        problem_2.clear_goals()
+        problem_2.add_goal(goal)
+        self.assertNotEqual(problem, problem_2)
+
+        cache = PDDLDomainCache()
+        for p in (problem, problem_2):
+            w = PDDLWriter(p, domain_cache=cache)
+            no_cache_w = PDDLWriter(p)
+            # the problem is written before the domain on purpose
+            self.assertEqual(w.get_problem(), no_cache_w.get_problem())
+            self.assertEqual(w.get_domain(), no_cache_w.get_domain())
+            for a in p.actions:
+                self.assertIs(w.get_item_named(w.get_pddl_name(a)), a)
+            for o in p.all_objects:
+                self.assertIs(w.get_item_named(w.get_pddl_name(o)), o)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual((cache.misses, cache.hits), (1, 1))
+
+        # a different domain is not taken from the cache
+        basic = self.problems["basic"].problem
+        w = PDDLWriter(basic, domain_cache=cache)
+        self.assertEqual(w.get_domain(), PDDLWriter(basic).get_domain())
+        self.assertEqual(len(cache), 2)
+        self.assertEqual((cache.misses, cache.hits), (2, 1))
+
     def test_counters_reader(self):
         reader = PDDLReader()
 
@@ -14,6 +14,8 @@
 #
 
 
+import os
+import sys
 from io import StringIO
 import unified_planning as up
 from unified_planning.shortcuts import *
@@ -23,12 +25,116 @@ from unified_planning.test.examples import get_example_problems
 
 VERYSMALL_TIMEOUT = 0.0001
 
+# A fake planner that checks the given PDDL files and prints or writes the plan of
+# the "basic" example problem
+FAKE_PLANNER_SCRIPT = """
+import sys
+domain, problem, plan = sys.argv[1:4]
+assert "(:action a" in open(domain).read()
+assert "(:goal" in open(problem).read()
+if sys.argv[4] == "stdout":
+    print("plan found:\\n(a)\\nend plan")
+else:
+    with open(plan, "w") as plan_file:
+        plan_file.write("(a)\\n")
+"""
+
+
+class FakePDDLPlanner(up.engines.PDDLPlanner):
+    def __init__(
+        self,
+        plan_on_stdout: bool = False,
+        in_memory: bool = False,
+        cache_domain: bool = False,
+    ):
+        up.engines.PDDLPlanner.__init__(
+            self, in_memory=in_memory, cache_domain=cache_domain
+        )
+        self.plan_on_stdout = plan_on_stdout
+
+    @property
+    def name(self):
+        return "fake-pddl-planner"
+
+    @staticmethod
+    def supported_kind():
+        return up.model.ProblemKind()
+
+    @staticmethod
+    def supports(problem_kind):
+        return True
+
+    def _get_cmd(self, domain_filename, problem_filename, plan_filename):
+        self.last_plan_filename = plan_filename
+        plan_output = "stdout" if self.plan_on_stdout else "file"
+        return [
+            sys.executable,
+            "-c",
+            FAKE_PLANNER_SCRIPT,
+            domain_filename,
+            problem_filename,
+            plan_filename,
+            plan_output,
+        ]
+
+    def _plan_from_output(self, problem, planner_output, get_item_named):
+        if "plan found:" not in planner_output:
+            return None
+        plan_str = planner_output.split("plan found:")[1].split("end plan")[0]
+        return self._plan_from_str(problem, plan_str, get_item_named)
+
+    def _result_status(self, problem, plan, retval, log_messages=None):
+        if retval != 0 or plan is None:
+            return PlanGenerationResultStatus.INTERNAL_ERROR
+        return PlanGenerationResultStatus.SOLVED_SATISFICING
+
 
 class TestPDDLPlanner(TestCase):
     def setUp(self):
         TestCase.setUp(self)
         self.problems = get_example_problems()
 
+    def test_in_memory_files(self):
+        problem = self.problems["basic"].problem
+        a = problem.action("a")
+        for plan_on_stdout in (False, True):
+            planner = FakePDDLPlanner(plan_on_stdout=plan_on_stdout, in_memory=True)
+            with planner:
+                scratch_dir = None
+                for _ in range(2):
+                    final_report = planner.solve(problem)
+                    self.assertEqual(
+                        final_report.status,
+                        PlanGenerationResultStatus.SOLVED_SATISFICING,
+                    )
+                    self.assertEqual(len(final_report.plan.actions), 1)
+                    self.assertEqual(final_report.plan.actions[0].action, a)
+                    # the scratch directory is reused by every solve
+                    plan_dir = os.path.dirname(planner.last_plan_filename)
+                    if scratch_dir is not None:
+                        self.assertEqual(plan_dir, scratch_dir)
+                    scratch_dir = plan_dir
+                    self.assertTrue(os.path.isdir(scratch_dir))
+            # and removed when the planner is destroyed
+            self.assertFalse(os.path.isdir(scratch_dir))
+
+        # the domain is rendered and written only once
+        with FakePDDLPlanner(in_memory=True, cache_domain=True) as planner:
+            for _ in range(3):
+                final_report = planner.solve(problem)
+                self.assertEqual(final_report.plan.actions[0].action, a)
+            self.assertEqual(planner._domain_cache.misses, 1)
+            self.assertEqual(planner._domain_cache.hits, 2)
+
+        # by default every solve uses a new temporary directory
+        planner = FakePDDLPlanner()
+        final_report = planner.solve(problem)
+        self.assertEqual(
+            final_report.status, PlanGenerationResultStatus.SOLVED_SATISFICING
+        )
+        self.assertEqual(final_report.plan.actions[0].action, a)
+        self.assertFalse(os.path.isdir(os.path.dirname(planner.last_plan_filename)))
+
     @skipIfEngineNotAvailable("opt-pddl-planner")
     def test_basic(self):
         problem = self.problems["basic"].problem
@@ -46,6 +46,35 @@ class TestProblem(TestCase):
                 validation_result = pv.validate(problem, plan)
                 self.assertEqual(validation_result.status, ValidationResultStatus.VALID)
 
+    def test_parallel_persistent_workers(self):
+        with PlanValidator(
+            names=["sequential_plan_validator", "sequential_plan_validator"]
+        ) as pv:
+            pv.persistent_workers = True
+            self.assertTrue(pv.persistent_workers)
+            checked = 0
+            for name in ["robot", "robot_loader", "basic", "robot_decrease"]:
+                problem, plan = self.problems[name].problem, self.problems[name].plan
+                # the second validation reuses the problem already shipped
+                for _ in range(2):
+                    validation_result = pv.validate(problem, plan)
+                    self.assertEqual(
+                        validation_result.status, ValidationResultStatus.VALID
+                    )
+                checked += 1
+                processes = [p.pid for p in pv._pool._processes]
+            self.assertEqual(checked, 4)
+            # the workers are the same ones for all the calls
+            self.assertEqual([p.pid for p in pv._pool._processes], processes)
+            robot_loader = self.problems["robot_loader"]
+            invalid_plan = up.plans.SequentialPlan(robot_loader.plan.actions[1:])
+            validation_result = pv.validate(robot_loader.problem, invalid_plan)
+            self.assertEqual(validation_result.status, ValidationResultStatus.INVALID)
+            pv.persistent_workers = False
+            self.assertIsNone(pv._pool)
+            validation_result = pv.validate(problem, plan)
+            self.assertEqual(validation_result.status, ValidationResultStatus.VALID)
+
     def test_all_from_factory_with_problem_kind(self):
         for p in self.problems.values():
             problem, plan = p.problem, p.plan
@@ -16,6 +16,7 @@
 from typing import Callable
 import warnings
 import unified_planning as up
+from unified_planning.environment import Environment
 from unified_planning.shortcuts import *
 from unified_planning.model.problem_kind import (
     basic_classical_kind,
@@ -309,6 +310,48 @@ class TestPlanner(TestCase):
             plan = planner.solve(problem).plan
             self.assertIsNotNone(plan)
 
+    def test_incremental_oversubscription(self):
+        factory = Environment().factory
+        factory.add_engine(
+            "bfs", "unified_planning.test.test_solve_many", "BreadthFirstPlanner"
+        )
+        env = factory.environment
+        g = [Fluent(f"g{i}", BoolType(), environment=env) for i in range(4)]
+        problem = Problem("oversubscription", env)
+        for f in g:
+            problem.add_fluent(f, default_initial_value=False)
+        for i in range(3):
+            a = InstantaneousAction(f"a{i}", _env=env)
+            a.add_effect(g[i], True)
+            problem.add_action(a)
+        # g1 and g2 can't be achieved together and g3 can't be achieved at all
+        problem.action("a1").add_precondition(env.expression_manager.Not(g[2]))
+        problem.action("a2").add_precondition(env.expression_manager.Not(g[1]))
+        problem.add_quality_metric(
+            Oversubscription({g[0]: 10, g[1]: 5, g[2]: 1, g[3]: 100}, env)
+        )
+
+        for incremental_search, expected_solves in ((False, 10), (True, 7)):
+            with factory.OneshotPlanner(
+                name="oversubscription[bfs]",
+                params={"incremental_search": incremental_search},
+            ) as planner:
+                solves = []
+                solve = planner.engine.solve
+
+                def counting_solve(*args, **kwargs):
+                    solves.append(args[0])
+                    return solve(*args, **kwargs)
+
+                planner.engine.solve = counting_solve
+                final_report = planner.solve(problem)
+                self.assertEqual(
+                    final_report.status, PlanGenerationResultStatus.SOLVED_OPTIMALLY
+                )
+                actions = {ai.action.name for ai in final_report.plan.actions}
+                self.assertEqual(actions, {"a0", "a1"})
+                self.assertEqual(len(solves), expected_solves)
+
     def test_engine_class(self):
         with self.assertRaises(TypeError):
             Engine()  # type: ignore[abstract]
@@ -131,6 +131,146 @@ class TestSimulator(TestCase):
         simulator = UPSequentialSimulator(problem)
         self.simulate_on_hierarchical_blocks_world(simulator, problem)
 
+    def test_with_compact_states(self):
+        problem = self.problems["hierarchical_blocks_world"].problem
+        simulator = UPSequentialSimulator(problem, compact_states=True)
+        self.assertIsInstance(simulator.get_initial_state(), CompactState)
+        self.simulate_on_hierarchical_blocks_world(simulator, problem)
+        with SequentialSimulator(
+            problem, name="sequential_simulator", params={"compact_states": True}
+        ) as simulator:
+            self.simulate_on_hierarchical_blocks_world(simulator, problem)
+        with self.assertRaises(UPUsageError):
+            simulator.apply(UPState(problem.initial_values), problem.actions[0])
+
+    def test_compact_state(self):
+        for name in ["robot", "robot_loader_weak_bridge"]:
+            problem, plan = self.problems[name]
+            simulator = UPSequentialSimulator(problem, compact_states=True)
+            up_simulator = UPSequentialSimulator(problem)
+            state = simulator.get_initial_state()
+            up_state = up_simulator.get_initial_state()
+            for ai in plan.actions:
+                state = cast(State, simulator.apply(state, ai))
+                up_state = cast(State, up_simulator.apply(up_state, ai))
+                self.assertIsNotNone(state)
+                for f in problem.initial_values:
+                    self.assertEqual(state.get_value(f), up_state.get_value(f))
+            self.assertTrue(simulator.is_goal(state))
+
+        init = cast(CompactState, simulator.get_initial_state())
+        em = problem.environment.expression_manager
+        cargo_mounted = problem.fluent("cargo_mounted")()
+        child = init.make_child({cargo_mounted: em.TRUE()})
+        self.assertEqual(child.get_value(cargo_mounted), em.TRUE())
+        self.assertEqual(init.get_value(cargo_mounted), em.FALSE())
+        self.assertNotEqual(init, child)
+        # states with the same values are equal and have the same hash
+        restored = child.make_child({cargo_mounted: em.FALSE()})
+        self.assertEqual(init, restored)
+        self.assertEqual(hash(init), hash(restored))
+        self.assertIn(restored, {init, child})
+        with self.assertRaises(UPUsageError):
+            init.get_value(em.TRUE())
+
+    def test_with_compiled_evaluation(self):
+        problem = self.problems["hierarchical_blocks_world"].problem
+        simulator = UPSequentialSimulator(problem, compiled=True)
+        self.assertIsInstance(simulator.get_initial_state(), CompactState)
+        self.simulate_on_hierarchical_blocks_world(simulator, problem)
+        with SequentialSimulator(
+            problem, name="sequential_simulator", params={"compiled": True}
+        ) as simulator:
+            self.simulate_on_hierarchical_blocks_world(simulator, problem)
+
+    def test_compiled_evaluation(self):
+        for name in [
+            "robot",
+            "robot_loader_weak_bridge",
+            "robot_fluent_of_user_type",
+            "basic_with_object_constant",
+            "counter",
+            "hierarchical_blocks_world_exists",
+        ]:
+            problem, plan = self.problems[name]
+            simulator = UPSequentialSimulator(problem, compiled=True)
+            up_simulator = UPSequentialSimulator(problem)
+            state = simulator.get_initial_state()
+            up_state = up_simulator.get_initial_state()
+            for ai in plan.actions:
+                self.assertEqual(
+                    set(simulator.get_applicable_actions(state)),
+                    set(up_simulator.get_applicable_actions(up_state)),
+                )
+                state = cast(State, simulator.apply(state, ai))
+                up_state = cast(State, up_simulator.apply(up_state, ai))
+                self.assertIsNotNone(state)
+                for f in problem.initial_values:
+                    self.assertEqual(state.get_value(f), up_state.get_value(f))
+            self.assertTrue(simulator.is_goal(state))
+            self.assertEqual(
+                simulator.get_unsatisfied_goals(state),
+                up_simulator.get_unsatisfied_goals(up_state),
+            )
+
+    def test_compiled_bounded_types_and_conflicts(self):
+        counter = Fluent("counter", IntType(0))
+        flag = Fluent("flag")
+        increase = InstantaneousAction("increase")
+        increase.add_increase_effect(counter, 1)
+        decrease = InstantaneousAction("decrease")
+        decrease.add_decrease_effect(counter, 1)
+        conflict = InstantaneousAction("conflict")
+        conflict.add_effect(counter, 3, flag)
+        conflict.add_effect(counter, 4)
+        problem = Problem("compiled_counter")
+        problem.add_fluent(counter, default_initial_value=1)
+        problem.add_fluent(flag, default_initial_value=True)
+        problem.add_actions([increase, decrease, conflict])
+
+        simulator = UPSequentialSimulator(problem, compiled=True)
+        init = simulator.get_initial_state()
+        self.assertTrue(simulator.is_applicable(init, increase))
+        self.assertFalse(simulator.is_applicable(init, conflict))
+        self.assertIsNone(simulator.apply(init, conflict))
+        dec_state = simulator.apply(init, decrease)
+        assert dec_state is not None
+        self.assertEqual(dec_state.get_value(counter()), Int(0))
+        self.assertFalse(simulator.is_applicable(dec_state, decrease))
+        self.assertIsNone(simulator.apply(dec_state, decrease))
+
+    def test_successor_generator(self):
+        for name in ["robot_loader_weak_bridge", "hierarchical_blocks_world"]:
+            problem, plan = self.problems[name]
+            for params in [{}, {"compiled": True}]:
+                simulator = UPSequentialSimulator(problem, **params)
+                state = simulator.get_initial_state()
+                for ai in plan.actions:
+                    # the indexed successors are the same of the linear scan
+                    expected = [
+                        (a, p)
+                        for a, p, _ in simulator._grounder.get_grounded_actions()
+                        if simulator.is_applicable(state, a, p)
+                    ]
+                    applicable = list(simulator.get_applicable_actions(state))
+                    self.assertEqual(applicable, expected)
+                    self.assertIn((ai.action, ai.actual_parameters), applicable)
+                    state = cast(State, simulator.apply(state, ai))
+
+        # the index is updated incrementally
+        generator = simulator._get_successor_generator()
+        size = len(generator)
+        init = simulator.get_initial_state()
+        action, params = next(iter(simulator.get_applicable_actions(init)))
+        generator.remove_action(action, params)
+        self.assertEqual(len(generator), size - 1)
+        self.assertNotIn((action, params), simulator.get_applicable_actions(init))
+        grounded_action = simulator._ground_action(action, params)
+        assert grounded_action is not None
+        generator.add_action(action, params, grounded_action)
+        self.assertEqual(len(generator), size)
+        self.assertIn((action, params), simulator.get_applicable_actions(init))
+
     def test_with_simulator_from_factory(self):
         problem = self.problems["hierarchical_blocks_world"].problem
         with SequentialSimulator(problem) as simulator:
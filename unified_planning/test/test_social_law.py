@@ -25,7 +25,7 @@ from unified_planning.social_law.waitfor_specification import WaitforSpecificati
 from unified_planning.social_law.ma_problem_waitfor import MultiAgentProblemWithWaitfor
 from unified_planning.model.multi_agent.ma_centralizer import MultiAgentProblemCentralizer
 from unified_planning.model.multi_agent.sa_to_ma_converter import SingleAgentToMultiAgentConverter
-from unified_planning.social_law.synthesis import SocialLawGenerator, SocialLawGeneratorSearch, get_gbfs_social_law_generator
+from unified_planning.social_law.synthesis import SocialLawGenerator, SocialLawGeneratorSearch, SocialLawIndex, SocialLawCompilationCache, get_gbfs_social_law_generator
 from unified_planning.model.multi_agent import *
 from unified_planning.io import PDDLWriter, PDDLReader
 from unified_planning.engines import PlanGenerationResultStatus
@@ -166,8 +166,103 @@ class TestProblem(TestCase):
         g3 = get_gbfs_social_law_generator()
         rprob3 = g3.generate_social_law(problem)
         self.assertIsNotNone(rprob3)
+
+        g4 = SocialLawGenerator(SocialLawGeneratorSearch.BFS, num_workers=2)
+        rprob4 = g4.generate_social_law(problem)
+        self.assertIsNotNone(rprob4)
+        self.assertEqual(SocialLawRobustnessChecker().is_robust(rprob4.compile(problem).problem).status, SocialLawRobustnessStatus.ROBUST_RATIONAL)
+        self.assertLessEqual(g4.expanded, g4.generated)
         
 
+    def test_social_law_index(self):
+        rng = random.Random(7)
+        actions = [("a1", "move", (x, y)) for x in ["nw", "ne", "sw", "se"] for y in ["nw", "ne", "sw", "se"]]
+
+        def random_social_law():
+            l = SocialLaw()
+            for agent_name, action_name, args in rng.sample(actions, rng.randint(0, 4)):
+                l.disallow_action(agent_name, action_name, args)
+            if rng.random() < 0.3:
+                l.add_waitfor_annotation("a1", "move", "free", ("l2",))
+            return l
+
+        index = SocialLawIndex()
+        stored = []
+        for _ in range(40):
+            l = random_social_law()
+            if l not in stored:
+                stored.append(l)
+            index.add(l)
+        self.assertEqual(len(index), len(stored))
+        for _ in range(200):
+            l = random_social_law()
+            self.assertEqual(l in index, l in stored)
+            self.assertEqual(index.has_less_strict(l), any(l.is_stricter_than(o) for o in stored))
+
+        # the initial values of the new fluents must be the same
+        l1 = SocialLaw()
+        l1.add_new_fluent(None, "yieldsto", (("l1","loc"), ("l2","loc")), False)
+        l2 = l1.clone()
+        l2.set_initial_value_for_new_fluent(None, "yieldsto", ("nw", "ne"), True)
+        index = SocialLawIndex()
+        index.add(l1)
+        self.assertTrue(index.has_less_strict(l1))
+        self.assertFalse(index.has_less_strict(l2))
+        self.assertNotIn(l2, index)
+        # the new fluents themselves don't take part in the strictness
+        self.assertNotIn(SocialLaw(), index)
+        self.assertTrue(SocialLaw().is_stricter_than(l1))
+        self.assertTrue(index.has_less_strict(SocialLaw()))
+
+    def test_incremental_compilation(self):
+        problem = get_intersection_problem(wait_drive=False).problem
+        l1 = SocialLaw()
+        l1.disallow_action("car-north", "drive", ("south-ent", "cross-se", "north"))
+        l2 = l1.clone()
+        l2.disallow_action("car-north", "drive", ("cross-se", "cross-ne", "north"))
+        l2.disallow_action("car-south", "drive", ("north-ent", "cross-nw", "south"))
+        l2.add_waitfor_annotation("car-east", "drive", "free", ("l2",))
+        self.assertTrue(l2.extends(l1))
+        self.assertFalse(l1.extends(l2))
+
+        r1 = l1.compile(problem)
+        r2 = l2.compile_from_parent(problem, l1, r1)
+        expected = l2.compile(problem).problem
+        self.assertEqual(r2.problem, expected)
+        for agent in r2.problem.agents:
+            self.assertEqual(set(agent.actions), set(expected.agent(agent.name).actions))
+        for (agent_name, action_name), preconditions in expected.waitfor.waitfor_map.items():
+            self.assertEqual(set(r2.problem.waitfor.get_preconditions_wait(agent_name, action_name)), set(preconditions))
+        # the action of car-north already had the allowed precondition, so it is shared
+        self.assertIs(r2.problem.agent("car-north").action("drive"), r1.problem.agent("car-north").action("drive"))
+        self.assertIsNot(r2.problem.agent("car-south").action("drive"), r1.problem.agent("car-south").action("drive"))
+        self.assertEqual(len(r1.problem.agent("car-south").action("drive").preconditions) + 1,
+                         len(r2.problem.agent("car-south").action("drive").preconditions))
+
+        compilations = SocialLawCompilationCache(problem)
+        compilations.compile(l1)
+        self.assertEqual(compilations.compile(l2, l1).problem, expected)
+        self.assertEqual(compilations.full_compilations, 1)
+        self.assertEqual(compilations.incremental_compilations, 1)
+
+    def test_robustness_verification_cache(self):
+        problem = get_intersection_problem(wait_drive=False).problem
+        l1 = SocialLaw()
+        l1.disallow_action("car-north", "drive", ("south-ent", "cross-se", "north"))
+        l2 = l1.clone()
+        l2.disallow_action("car-south", "drive", ("north-ent", "cross-nw", "south"))
+        problems = [problem, l1.compile(problem).problem, l2.compile(problem).problem, problem]
+        for verifier_class in [SimpleInstantaneousActionRobustnessVerifier, WaitingActionRobustnessVerifier]:
+            verifier = verifier_class()
+            for p in problems:
+                # the verifier reuses the substitutions and the action copies of the previous compilations
+                expected = verifier_class().compile(p).problem
+                self.assertEqual(str(verifier.compile(p).problem), str(expected))
+            self.assertGreater(len(verifier._action_copies), 0)
+            verifier.clear_cache()
+            self.assertEqual(len(verifier._action_copies), 0)
+            self.assertEqual(len(verifier._substitutions), 0)
+
     def test_social_law(self):
         slrc = SocialLawRobustnessChecker(
             planner_name="fast-downward",
@@ -187,6 +282,11 @@ class TestProblem(TestCase):
         self.assertEqual(r_result.status, SocialLawRobustnessStatus.NON_ROBUST_MULTI_AGENT_DEADLOCK)
         r_result = slrc.is_robust(p_4cars_crash)
         self.assertEqual(r_result.status, SocialLawRobustnessStatus.NON_ROBUST_MULTI_AGENT_FAIL)        
+        # the single agent projections are not solved again
+        r_result = slrc.is_robust(p_4cars_crash)
+        self.assertEqual(r_result.status, SocialLawRobustnessStatus.NON_ROBUST_MULTI_AGENT_FAIL)
+        self.assertEqual(r_result.sap_cache_misses, 0)
+        self.assertEqual(r_result.sap_cache_hit_rate, 1.0)
 
         l2 = SocialLaw()
         l2.disallow_action("car-north", "drive", ("south-ent", "cross-se", "north") )
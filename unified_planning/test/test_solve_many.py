@@ -0,0 +1,135 @@
+# Copyright 2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+from collections import deque
+from typing import IO, Callable, Optional
+import unified_planning as up
+from unified_planning.environment import Environment
+from unified_planning.engines import (
+    Engine,
+    PlanGenerationResult,
+    PlanGenerationResultStatus,
+    UPSequentialSimulator,
+)
+from unified_planning.engines.mixins import OneshotPlannerMixin
+from unified_planning.exceptions import UPUsageError
+from unified_planning.model import ProblemKind
+from unified_planning.plans import SequentialPlan
+from unified_planning.shortcuts import PlanValidator
+from unified_planning.test import TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class BreadthFirstPlanner(Engine, OneshotPlannerMixin):
+    """A tiny blind planner, used to test the batch solving without external planners."""
+
+    def __init__(self):
+        Engine.__init__(self)
+        OneshotPlannerMixin.__init__(self)
+
+    @property
+    def name(self):
+        return "bfs"
+
+    @staticmethod
+    def supported_kind() -> ProblemKind:
+        return UPSequentialSimulator.supported_kind()
+
+    @staticmethod
+    def supports(problem_kind: ProblemKind) -> bool:
+        return problem_kind <= BreadthFirstPlanner.supported_kind()
+
+    def _solve(
+        self,
+        problem: "up.model.AbstractProblem",
+        heuristic: Optional[Callable[["up.model.state.State"], Optional[float]]] = None,
+        timeout: Optional[float] = None,
+        output_stream: Optional[IO[str]] = None,
+    ) -> PlanGenerationResult:
+        assert isinstance(problem, up.model.Problem)
+        simulator = UPSequentialSimulator(problem)
+        initial_state = simulator.get_initial_state()
+        queue = deque([(initial_state, [])])
+        visited = {initial_state}
+        while queue:
+            state, actions = queue.popleft()
+            if simulator.is_goal(state):
+                return PlanGenerationResult(
+                    PlanGenerationResultStatus.SOLVED_SATISFICING,
+                    SequentialPlan(actions, problem.environment),
+                    self.name,
+                )
+            for action, params in simulator.get_applicable_actions(state):
+                successor = simulator.apply(state, action, params)
+                if successor is not None and successor not in visited:
+                    visited.add(successor)
+                    ai = up.plans.ActionInstance(action, params)
+                    queue.append((successor, actions + [ai]))
+        return PlanGenerationResult(
+            PlanGenerationResultStatus.UNSOLVABLE_PROVEN, None, self.name
+        )
+
+
+class TestSolveMany(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.problems = get_example_problems()
+        self.factory = Environment().factory
+        self.factory.add_engine(
+            "bfs", "unified_planning.test.test_solve_many", "BreadthFirstPlanner"
+        )
+
+    def _check_results(self, problems, results):
+        self.assertEqual(sorted(i for i, _ in results), list(range(len(problems))))
+        for i, res in results:
+            self.assertEqual(res.engine_name, "bfs")
+            self.assertIsNotNone(res.plan)
+            with PlanValidator(problem_kind=problems[i].kind) as validator:
+                self.assertTrue(validator.validate(problems[i], res.plan))
+
+    def test_solve_many_threads(self):
+        names = ["basic", "robot_loader", "robot_loader_mod", "basic_conditional"]
+        problems = [self.problems[n].problem for n in names]
+        results = list(
+            self.factory.solve_many(
+                problems, name="bfs", max_workers=2, use_threads=True
+            )
+        )
+        self._check_results(problems, results)
+
+    def test_solve_many_processes(self):
+        names = ["basic", "robot_loader", "robot_loader_mod"]
+        problems = [self.problems[n].problem for n in names]
+        # the problems are consumed lazily, from a generator
+        results = list(
+            self.factory.solve_many((p for p in problems), name="bfs", max_workers=2)
+        )
+        self._check_results(problems, results)
+        # the plans are rebuilt on the original problems
+        for i, res in results:
+            for ai in res.plan.actions:
+                self.assertIn(ai.action, problems[i].actions)
+
+    def test_solve_many_errors(self):
+        with self.assertRaises(UPUsageError):
+            list(self.factory.solve_many([], name="bfs", max_workers=0))
+        with self.assertRaises(UPUsageError):
+            self.factory.solve_many([], optimality_guarantee="not_a_guarantee")
+        self.assertEqual(list(self.factory.solve_many([], name="bfs")), [])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Copyright 2021 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import pickle
+import unified_planning
+from unified_planning.shortcuts import *
+from unified_planning.environment import Environment
+from unified_planning.exceptions import UPValueError
+from unified_planning.model.walkers import (
+    FreeVarsExtractor,
+    LRUMemoization,
+    Simplifier,
+    SizeCappedMemoization,
+    WeakMemoization,
+)
+from unified_planning.test import TestCase, main
+
+
+class TestWalkersMemoization(TestCase):
+    def setUp(self):
+        TestCase.setUp(self)
+        self.env = Environment()
+        self.em = self.env.expression_manager
+        BoolType = self.env.type_manager.BoolType
+        self.fluents = [
+            Fluent(f"f{i}", BoolType(), environment=self.env) for i in range(10)
+        ]
+
+    def _expressions(self):
+        return [
+            self.em.And(self.em.FluentExp(f), self.em.Not(self.em.FluentExp(g)))
+            for f, g in zip(self.fluents, reversed(self.fluents))
+        ]
+
+    def test_hits_and_misses(self):
+        fve = FreeVarsExtractor()
+        e = self.em.And(self.em.FluentExp(self.fluents[0]), self.em.TRUE())
+        fve.get(e)
+        self.assertEqual(fve.memoization_hits, 0)
+        self.assertEqual(fve.memoization_misses, 3)
+        fve.get(e)
+        self.assertEqual(fve.memoization_hits, 1)
+        self.assertEqual(fve.memoization_misses, 3)
+        fve.get(self.em.Or(e, self.em.FluentExp(self.fluents[1])))
+        self.assertEqual(fve.memoization_hits, 2)
+        self.assertEqual(fve.memoization_misses, 5)
+        fve.reset_memoization_stats()
+        self.assertEqual(fve.memoization_hits, 0)
+        self.assertEqual(fve.memoization_misses, 0)
+
+    def test_lru_memoization(self):
+        with self.assertRaises(UPValueError):
+            LRUMemoization(-1)
+        fve = FreeVarsExtractor()
+        fve.set_memoization(LRUMemoization(4))
+        expressions = self._expressions()
+        for e in expressions:
+            self.assertEqual(len(fve.get(e)), 2)
+            self.assertLessEqual(len(fve.memoization), 4)
+        # the last walked expression is the most recently used one
+        self.assertIn(expressions[-1], fve.memoization)
+        self.assertNotIn(expressions[0], fve.memoization)
+        hits = fve.memoization_hits
+        fve.get(expressions[-1])
+        self.assertEqual(fve.memoization_hits, hits + 1)
+        memoization = pickle.loads(pickle.dumps(fve.memoization))
+        self.assertIsInstance(memoization, LRUMemoization)
+        self.assertEqual(memoization.max_size, 4)
+        self.assertEqual(len(memoization), 0)
+
+    def test_size_capped_memoization(self):
+        simplifier = Simplifier(self.env)
+        simplifier.set_memoization(SizeCappedMemoization(5))
+        for e in self._expressions():
+            self.assertEqual(simplifier.simplify(e), e)
+            self.assertLessEqual(len(simplifier.memoization), 5)
+        simplifier.set_memoization(None)
+        for e in self._expressions():
+            simplifier.simplify(e)
+        # 10 fluent expressions, 10 negations and 10 conjunctions
+        self.assertEqual(len(simplifier.memoization), 30)
+
+    def test_weak_memoization(self):
+        simplifier = Simplifier(self.env)
+        simplifier.set_memoization(WeakMemoization())
+        e = self.em.And(self.em.FluentExp(self.fluents[0]), self.em.TRUE())
+        self.assertEqual(simplifier.simplify(e), self.em.FluentExp(self.fluents[0]))
+        self.assertIn(e, simplifier.memoization)
+        self.assertEqual(simplifier.simplify(e), self.em.FluentExp(self.fluents[0]))
+        self.assertEqual(simplifier.memoization_hits, 1)
+        copy = pickle.loads(pickle.dumps(simplifier.memoization))
+        self.assertIsInstance(copy, WeakMemoization)
+        self.assertEqual(len(copy), 0)
+        size = len(simplifier.memoization)
+        self.assertGreater(size, 0)
+        simplifier.memoization.clear()
+        self.assertEqual(len(simplifier.memoization), 0)
+
+    def test_environment_walkers_memoization(self):
+        self.env.set_walkers_memoization(lambda: LRUMemoization(3))
+        for e in self._expressions():
+            self.env.free_vars_extractor.get(e)
+            self.assertEqual(e.type, self.env.type_manager.BoolType())
+        stats = self.env.walkers_memoization_stats()
+        self.assertLessEqual(stats["free_vars_extractor"]["size"], 3)
+        self.assertLessEqual(stats["type_checker"]["size"], 3)
+        # with only 3 entries the shared fluent expressions are evicted and
+        # computed again, so there are more misses than distinct expressions
+        self.assertGreater(stats["free_vars_extractor"]["misses"], 30)
+        self.env.set_walkers_memoization(None)
+        self.assertEqual(type(self.env.free_vars_extractor.memoization), dict)
+        env_copy = pickle.loads(pickle.dumps(self.env))
+        self.assertEqual(
+            env_copy.walkers_memoization_stats()["type_checker"]["size"], 0
+        )
+
+
+if __name__ == "__main__":
+    main()